@@ -2,6 +2,12 @@
 """The Python scenariogeneration package is a collection of libraries for
 generating OpenSCENARIO (.xosc) and OpenDRIVE (.xodr) XML files."""
 
+from .archive import *
+from .content_store import *
+from .covering_array import *
 from .esmini_runner import *
+from .generation_queue import *
 from .helpers import *
+from .manifest import *
+from .permutations import *
 from .scenario_generator import *
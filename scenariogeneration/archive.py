@@ -0,0 +1,300 @@
+"""
+scenariogeneration
+https://github.com/pyoscx/scenariogeneration
+
+This Source Code Form is subject to the terms of the Mozilla Public
+License, v. 2.0. If a copy of the MPL was not distributed with this
+file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+Copyright (c) 2022 The scenariogeneration Authors.
+
+"""
+
+import gzip
+import io
+import json
+import os
+import tarfile
+import time
+import xml.etree.ElementTree as ET
+import zipfile
+from typing import Optional
+
+from .helpers import get_creation_timestamp, prettify, write_stream
+
+ARCHIVE_FORMATS = ["tar", "zip"]
+ARCHIVE_COMPRESSIONS = [None, "gzip", "bzip2", "lzma"]
+
+# mode suffix and file extension of each compression
+_TAR_COMPRESSIONS = {
+    None: ("", ""),
+    "gzip": ("gz", ".gz"),
+    "bzip2": ("bz2", ".bz2"),
+    "lzma": ("xz", ".xz"),
+}
+_ZIP_MIN_TIMESTAMP = 315532800  # 1980-01-01 UTC
+_ZIP_COMPRESSIONS = {
+    None: zipfile.ZIP_STORED,
+    "gzip": zipfile.ZIP_DEFLATED,
+    "bzip2": zipfile.ZIP_BZIP2,
+    "lzma": zipfile.ZIP_LZMA,
+}
+
+
+def element_to_bytes(
+    element: ET.Element, prettyprint: bool = True, encoding: str = "utf-8"
+) -> bytes:
+    """element_to_bytes serializes an element the same way as printToFile
+    writes it.
+
+    Parameters
+    ----------
+    element : ET.Element
+        the element to serialize
+
+    prettyprint : bool
+        if the xml should be indented, default: True
+
+    encoding : str
+        encoding of the output, default: utf-8
+
+    Returns
+    -------
+    bytes
+        the xml document
+    """
+    if prettyprint:
+        return prettify(element, encoding=encoding)
+    output = io.BytesIO()
+    write_stream(element, output, prettyprint=False, encoding=encoding)
+    return output.getvalue()
+
+
+class ArchiveWriter:
+    """ArchiveWriter streams files into one or more tar or zip archives
+    instead of writing them as separate files, starting a new archive when
+    the current one has reached max_size.
+
+    Each archive contains an index ({basename}_{number}_index.json) of its
+    members, and an index of all archives and their members ({basename}_index.json) is
+    written next to the archives when the writer is closed. Extracting all
+    archives into the same folder gives the same files as a generation
+    without archives.
+
+    Parameters
+    ----------
+    folder : str
+        folder to create the archives in
+
+    basename : str
+        basename of the archives, the archives are named
+        {basename}_{number}.{extension}
+
+    archive_format : str
+        "tar" or "zip", default: "tar"
+
+    compression : str
+        None, "gzip", "bzip2" or "lzma", default: None
+
+    compression_level : int
+        compression level (preset for lzma in a tar archive),
+        default: None (default of the compression)
+
+    max_size : int
+        size in bytes (on disk) after which a new archive is started,
+        default: None (one archive)
+
+    Attributes
+    ----------
+    archives : list[str]
+        filenames of the created archives (relative to folder)
+
+    index_filename : str
+        filename of the index of all archives (relative to folder)
+    """
+
+    def __init__(
+        self,
+        folder: str,
+        basename: str,
+        archive_format: str = "tar",
+        compression: Optional[str] = None,
+        compression_level: Optional[int] = None,
+        max_size: Optional[int] = None,
+    ):
+        """Initalizes the ArchiveWriter.
+
+        Parameters
+        ----------
+        folder : str
+            folder to create the archives in
+
+        basename : str
+            basename of the archives
+
+        archive_format : str
+            "tar" or "zip", default: "tar"
+
+        compression : str
+            None, "gzip", "bzip2" or "lzma", default: None
+
+        compression_level : int
+            compression level, default: None
+
+        max_size : int
+            size in bytes after which a new archive is started,
+            default: None (one archive)
+        """
+        if archive_format not in ARCHIVE_FORMATS:
+            raise ValueError(
+                "archive_format can only be one of "
+                + ", ".join(ARCHIVE_FORMATS)
+                + ", not: "
+                + str(archive_format)
+            )
+        if compression not in ARCHIVE_COMPRESSIONS:
+            raise ValueError(
+                "compression can only be None, gzip, bzip2 or lzma, not: "
+                + str(compression)
+            )
+        self.folder = folder
+        self.basename = basename
+        self.archive_format = archive_format
+        self.compression = compression
+        self.compression_level = compression_level
+        self.max_size = max_size
+        self.archives = []
+        self.index_filename = basename + "_index.json"
+        self._members = {}
+        self._current_members = []
+        self._index_name = ""
+        self._file = None
+        self._compressed_file = None
+        self._archive = None
+
+    def _open_archive(self):
+        """Starts a new archive."""
+        name = self.basename + "_" + str(len(self.archives)).zfill(4)
+        if self.archive_format == "zip":
+            filename = name + ".zip"
+        else:
+            filename = name + ".tar" + _TAR_COMPRESSIONS[self.compression][1]
+        self.archives.append(filename)
+        self._index_name = name + "_index.json"
+        self._current_members = []
+        self._file = open(os.path.join(self.folder, filename), "wb")
+        if self.archive_format == "zip":
+            self._archive = zipfile.ZipFile(
+                self._file,
+                "w",
+                compression=_ZIP_COMPRESSIONS[self.compression],
+                compresslevel=self.compression_level,
+            )
+            return
+        if self.compression == "gzip":
+            # the gzip header contains a timestamp, opened here to control it
+            self._compressed_file = gzip.GzipFile(
+                filename="",
+                mode="wb",
+                compresslevel=(
+                    9
+                    if self.compression_level is None
+                    else self.compression_level
+                ),
+                fileobj=self._file,
+                mtime=int(get_creation_timestamp()),
+            )
+            self._archive = tarfile.open(
+                fileobj=self._compressed_file, mode="w"
+            )
+            return
+        kwargs = {}
+        if self.compression_level is not None:
+            if self.compression == "lzma":
+                kwargs["preset"] = self.compression_level
+            elif self.compression is not None:
+                kwargs["compresslevel"] = self.compression_level
+        self._archive = tarfile.open(
+            fileobj=self._file,
+            mode="w:" + _TAR_COMPRESSIONS[self.compression][0],
+            **kwargs,
+        )
+
+    def _add_member(self, name: str, data: bytes):
+        timestamp = get_creation_timestamp()
+        if self.archive_format == "zip":
+            # zip can not store dates before 1980
+            info = zipfile.ZipInfo(
+                name, time.gmtime(max(timestamp, _ZIP_MIN_TIMESTAMP))[:6]
+            )
+            info.compress_type = self._archive.compression
+            info.external_attr = 0o644 << 16
+            self._archive.writestr(
+                info, data, compresslevel=self.compression_level
+            )
+        else:
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            info.mtime = int(timestamp)
+            info.mode = 0o644
+            self._archive.addfile(info, io.BytesIO(data))
+
+    def _close_archive(self):
+        """Adds the index to the current archive and closes it."""
+        if self._archive is None:
+            return
+        self._add_member(
+            self._index_name,
+            json.dumps(self._current_members, indent=0).encode(),
+        )
+        self._archive.close()
+        if self._compressed_file is not None:
+            self._compressed_file.close()
+            self._compressed_file = None
+        self._file.close()
+        self._archive = None
+        self._file = None
+
+    def add(self, members: dict):
+        """add writes files to the archive, the files are always put in the
+        same archive.
+
+        Parameters
+        ----------
+        members : dict[str, bytes]
+            path in the archive and content of each file
+        """
+        if not members:
+            return
+        if (
+            self._archive is not None
+            and self.max_size is not None
+            and self._current_members
+            and self._file.tell() >= self.max_size
+        ):
+            self._close_archive()
+        if self._archive is None:
+            self._open_archive()
+        for name, data in members.items():
+            self._add_member(name, data)
+            self._current_members.append(name)
+            self._members[name] = self.archives[-1]
+
+    def close(self):
+        """close finishes the current archive and writes the index of all
+        archives."""
+        self._close_archive()
+        with open(
+            os.path.join(self.folder, self.index_filename), "w"
+        ) as index_file:
+            json.dump(
+                {"archives": self.archives, "members": self._members},
+                index_file,
+                indent=0,
+            )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -0,0 +1,137 @@
+"""
+scenariogeneration
+https://github.com/pyoscx/scenariogeneration
+
+This Source Code Form is subject to the terms of the Mozilla Public
+License, v. 2.0. If a copy of the MPL was not distributed with this
+file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+Copyright (c) 2022 The scenariogeneration Authors.
+
+"""
+
+import hashlib
+import os
+import shutil
+import threading
+import uuid
+
+
+class ContentStore:
+    """ContentStore stores files by the hash of their content, each unique
+    content (blob) is written once and the files are created as hardlinks
+    to the blobs (copies if the filesystem does not support hardlinks).
+
+    The blobs are stored in {folder}/objects/{hash[:2]}/{hash[2:]}, and
+    kept between runs, so identical files of later runs are not written
+    again. Since the files share the blob, they should not be modified in
+    place.
+
+    Several processes can use the same store at the same time.
+
+    Parameters
+    ----------
+    folder : str
+        the folder to create the store in
+
+    Attributes
+    ----------
+    number_of_blobs_written : int
+        number of blobs written (unique contents not in the store)
+
+    number_of_duplicates : int
+        number of files whose content was already in the store
+    """
+
+    folder_name = "objects"
+
+    def __init__(self, folder: str):
+        """Initalizes the ContentStore.
+
+        Parameters
+        ----------
+        folder : str
+            the folder to create the store in
+        """
+        self.path = os.path.join(folder, self.folder_name)
+        self.number_of_blobs_written = 0
+        self.number_of_duplicates = 0
+        self._created_folders = set()
+        self._lock = threading.Lock()
+
+    def get_path(self, blob_hash: str) -> str:
+        """get_path returns the path of a blob.
+
+        Parameters
+        ----------
+        blob_hash : str
+            the hash of the blob
+
+        Returns
+        -------
+        str
+            path to the blob
+        """
+        return os.path.join(self.path, blob_hash[:2], blob_hash[2:])
+
+    def store(self, data: bytes) -> str:
+        """store adds a blob to the store, if not already stored.
+
+        Parameters
+        ----------
+        data : bytes
+            the content to store
+
+        Returns
+        -------
+        str
+            sha256 hex digest of the content
+        """
+        blob_hash = hashlib.sha256(data).hexdigest()
+        blob_file = self.get_path(blob_hash)
+        if os.path.isfile(blob_file):
+            with self._lock:
+                self.number_of_duplicates += 1
+            return blob_hash
+        folder = os.path.dirname(blob_file)
+        if folder not in self._created_folders:
+            os.makedirs(folder, exist_ok=True)
+            self._created_folders.add(folder)
+        # written under a unique name and renamed, so other processes never
+        # see a partial blob
+        temporary_file = blob_file + "." + uuid.uuid4().hex + ".tmp"
+        with open(temporary_file, "wb") as file_handle:
+            file_handle.write(data)
+        os.replace(temporary_file, blob_file)
+        with self._lock:
+            self.number_of_blobs_written += 1
+        return blob_hash
+
+    def link(self, data: bytes, filename: str) -> str:
+        """link stores the content and creates filename as a hardlink to the
+        blob (replacing an existing file).
+
+        Parameters
+        ----------
+        data : bytes
+            the content of the file
+
+        filename : str
+            path of the file to create
+
+        Returns
+        -------
+        str
+            sha256 hex digest of the content
+        """
+        blob_hash = self.store(data)
+        blob_file = self.get_path(blob_hash)
+        if os.path.lexists(filename):
+            if os.path.samefile(filename, blob_file):
+                return blob_hash
+            os.remove(filename)
+        try:
+            os.link(blob_file, filename)
+        except OSError:
+            shutil.copyfile(blob_file, filename)
+        return blob_hash
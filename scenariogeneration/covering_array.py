@@ -0,0 +1,264 @@
+"""
+scenariogeneration
+https://github.com/pyoscx/scenariogeneration
+
+This Source Code Form is subject to the terms of the Mozilla Public
+License, v. 2.0. If a copy of the MPL was not distributed with this
+file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+Copyright (c) 2022 The scenariogeneration Authors.
+
+"""
+
+import itertools
+import random
+from typing import Callable, Optional
+
+import numpy as np
+
+_UNSET = -1
+
+
+class _TupleTable:
+    """Keeps track of which t-tuples (t - 1 earlier columns together with
+    the new column) are not covered yet, for one new column of the IPOG
+    algorithm.
+
+    The tuples of each combination of earlier columns are stored in one
+    flat boolean array, the index of a tuple is
+    offset[combination] + code(values of the earlier columns) * radix + v
+    """
+
+    def __init__(self, radices: list, column: int, strength: int):
+        self.column = column
+        self.radix = radices[column]
+        self.combinations = np.array(
+            list(itertools.combinations(range(column), strength - 1)),
+            dtype=np.int64,
+        ).reshape(-1, strength - 1)
+        self.combination_radices = np.array(radices, dtype=np.int64)[
+            self.combinations
+        ]
+        # mixed radix multipliers, the last column varies fastest
+        self.multipliers = np.ones_like(self.combination_radices)
+        for i in range(strength - 3, -1, -1):
+            self.multipliers[:, i] = (
+                self.multipliers[:, i + 1] * self.combination_radices[:, i + 1]
+            )
+        sizes = np.prod(self.combination_radices, axis=1) * self.radix
+        self.offsets = np.concatenate([[0], np.cumsum(sizes)[:-1]])
+        self.ends = np.cumsum(sizes)
+        self.uncovered = np.ones(int(sizes.sum()), dtype=bool)
+
+    def row_indices(self, row: np.ndarray) -> np.ndarray:
+        """Returns the tuple indices of a row for all values of the new
+        column (shape: valid combinations x radix), combinations with
+        unset values are skipped."""
+        values = row[self.combinations]
+        valid = (values != _UNSET).all(axis=1)
+        codes = (values[valid] * self.multipliers[valid]).sum(axis=1)
+        bases = self.offsets[valid] + codes * self.radix
+        return bases[:, None] + np.arange(self.radix)
+
+    def cover(self, row: np.ndarray):
+        """Marks the tuples of a row as covered."""
+        if row[self.column] != _UNSET:
+            self.uncovered[self.row_indices(row)[:, row[self.column]]] = False
+
+    def decode(self, index: int) -> tuple[np.ndarray, np.ndarray, int]:
+        """Returns the columns, their values, and the value of the new
+        column of a tuple index."""
+        combination = int(np.searchsorted(self.ends, index, side="right"))
+        code, value = divmod(
+            index - int(self.offsets[combination]), self.radix
+        )
+        columns = self.combinations[combination]
+        values = (
+            code // self.multipliers[combination]
+        ) % self.combination_radices[combination]
+        return columns, values, value
+
+
+def create_covering_array(
+    radices: list,
+    strength: int = 2,
+    is_allowed: Optional[Callable] = None,
+    seed: Optional[int] = None,
+) -> list:
+    """create_covering_array creates a t-wise covering array (every
+    combination of values of any strength columns is in at least one row)
+    with the In-Parameter-Order-General (IPOG) strategy.
+
+    Parameters
+    ----------
+    radices : list[int]
+        the number of values of each column
+
+    strength : int
+        the strength (t) of the covering array, default: 2
+
+    is_allowed : Callable, optional
+        called with a dict {column: value} of a (partial) row, should
+        return False if the values can not be in the same row. All rows are
+        allowed, and every tuple that is part of at least one allowed row
+        is covered. Default: None
+
+    seed : int, optional
+        seed used to fill values that are not needed for the coverage.
+        Default: None
+
+    Returns
+    -------
+    list[list[int]]
+        the rows of the covering array, with the value index of each
+        column
+    """
+    if strength < 1:
+        raise ValueError("strength has to be at least 1, not " + str(strength))
+    if not radices:
+        return [[]]
+    if min(radices) == 0:
+        return []
+    rng = random.Random(seed)
+    number_of_columns = len(radices)
+    strength = min(strength, number_of_columns)
+
+    # columns with most values first gives smaller arrays
+    order = sorted(range(number_of_columns), key=lambda c: -radices[c])
+    sorted_radices = [radices[c] for c in order]
+
+    def allowed(row: np.ndarray) -> bool:
+        if is_allowed is None:
+            return True
+        return is_allowed(
+            {
+                order[column]: int(value)
+                for column, value in enumerate(row)
+                if value != _UNSET
+            }
+        )
+
+    rows = []
+    for values in itertools.product(
+        *[range(radix) for radix in sorted_radices[:strength]]
+    ):
+        row = np.full(number_of_columns, _UNSET, dtype=np.int64)
+        row[:strength] = values
+        if allowed(row):
+            rows.append(row)
+    matrix = np.array(rows, dtype=np.int64).reshape(-1, number_of_columns)
+
+    for column in range(strength, number_of_columns):
+        table = _TupleTable(sorted_radices, column, strength)
+
+        # horizontal growth, pick the value covering most new tuples
+        for row in matrix:
+            indices = table.row_indices(row)
+            gains = table.uncovered[indices].sum(axis=0)
+            candidates = sorted(
+                range(table.radix), key=lambda v: (-gains[v], rng.random())
+            )
+            for value in candidates:
+                row[column] = value
+                if allowed(row):
+                    table.uncovered[indices[:, value]] = False
+                    break
+            else:
+                row[column] = _UNSET
+
+        # vertical growth, add (or fill unset values of) rows for the
+        # remaining tuples
+        capacity = max(16, 2 * len(matrix))
+        grown = np.full((capacity, number_of_columns), _UNSET, dtype=np.int64)
+        grown[: len(matrix)] = matrix
+        number_of_rows = len(matrix)
+        for index in np.flatnonzero(table.uncovered):
+            if not table.uncovered[index]:
+                continue
+            columns, values, value = table.decode(int(index))
+            all_columns = np.append(columns, column)
+            all_values = np.append(values, value)
+            candidate = np.full(number_of_columns, _UNSET, dtype=np.int64)
+            candidate[all_columns] = all_values
+            if not allowed(candidate):
+                table.uncovered[index] = False
+                continue
+            current = grown[:number_of_rows, all_columns]
+            compatible = np.flatnonzero(
+                ((current == all_values) | (current == _UNSET)).all(axis=1)
+            )
+            for row_index in compatible:
+                row = grown[row_index].copy()
+                row[all_columns] = all_values
+                if allowed(row):
+                    grown[row_index] = row
+                    break
+            else:
+                if number_of_rows == capacity:
+                    capacity *= 2
+                    grown = np.concatenate(
+                        [grown, np.full_like(grown, _UNSET)], axis=0
+                    )
+                grown[number_of_rows] = candidate
+                row_index = number_of_rows
+                number_of_rows += 1
+            table.cover(grown[row_index])
+            table.uncovered[index] = False
+        matrix = grown[:number_of_rows]
+
+    def complete(row: np.ndarray) -> Optional[np.ndarray]:
+        """Fills the unset values of a row with allowed values (depth first
+        over the unset columns, starting from a random value), returns None
+        if the row can not be completed."""
+        row = row.copy()
+        unset = np.flatnonzero(row == _UNSET)
+
+        def fill(position: int) -> bool:
+            if position == len(unset):
+                return allowed(row)
+            column = unset[position]
+            radix = sorted_radices[column]
+            start = rng.randrange(radix)
+            for offset in range(radix):
+                row[column] = (start + offset) % radix
+                if (is_allowed is None or allowed(row)) and fill(position + 1):
+                    return True
+            row[column] = _UNSET
+            return False
+
+        return row if fill(0) else None
+
+    # fill the values that are not needed for the coverage
+    filled_rows = []
+    incomplete_rows = []
+    for row in matrix:
+        filled = complete(row)
+        if filled is None:
+            incomplete_rows.append(row)
+        else:
+            filled_rows.append(filled)
+
+    # the tuples of rows that could not be completed are covered by new
+    # rows, unless no allowed row contains them
+    for row in incomplete_rows:
+        set_columns = np.flatnonzero(row != _UNSET)
+        for columns in itertools.combinations(set_columns, strength):
+            columns = list(columns)
+            values = row[columns]
+            if any(
+                (filled[columns] == values).all() for filled in filled_rows
+            ):
+                continue
+            candidate = np.full(number_of_columns, _UNSET, dtype=np.int64)
+            candidate[columns] = values
+            filled = complete(candidate)
+            if filled is not None:
+                filled_rows.append(filled)
+
+    result = []
+    for filled in filled_rows:
+        original = [0] * number_of_columns
+        for column, value in enumerate(filled):
+            original[order[column]] = int(value)
+        result.append(original)
+    return result
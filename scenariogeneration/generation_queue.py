@@ -0,0 +1,303 @@
+"""
+scenariogeneration
+https://github.com/pyoscx/scenariogeneration
+
+This Source Code Form is subject to the terms of the Mozilla Public
+License, v. 2.0. If a copy of the MPL was not distributed with this
+file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+Copyright (c) 2022 The scenariogeneration Authors.
+
+"""
+
+import os
+import socket
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+
+class GenerationQueue:
+    """GenerationQueue is a work queue (SQLite) in a shared folder, where any
+    number of processes (on any number of nodes) can claim chunks of
+    permutations to generate.
+
+    A claimed chunk is leased for lease_time seconds, the lease is renewed
+    in the background while the queue is open. If the lease is not renewed
+    (eg. the worker died) the chunk can be claimed by another worker, and
+    the first worker can no longer complete it.
+
+    Each chunk is a range of raw permutation indices, together with the
+    position (among the not excluded permutations) of the first
+    permutation in the chunk, so numerical names are stable.
+
+    A finished queue (all chunks done) is restarted by a worker opening it
+    with other chunks or another generation_key. Workers joining a
+    finished queue of the same generation have nothing to do.
+
+    Parameters
+    ----------
+    filename : str
+        path to the queue file (shared between the workers)
+
+    chunks : list[tuple[int, int, int]]
+        the chunks (raw_start, raw_stop, first_position) to add if the
+        queue is new (or finished and of another generation)
+
+    lease_time : float
+        seconds a claimed chunk is reserved for a worker, default: 600
+
+    worker_id : str, optional
+        identifier of the worker, default: None (hostname-pid)
+
+    generation_key : str
+        identifies what is generated (eg. a hash of the generator and its
+        parameters), workers can only join a queue with the same key,
+        default: ""
+
+    Attributes
+    ----------
+    worker_id : str
+        identifier of the worker
+    """
+
+    filename = "queue.sqlite"
+
+    def __init__(
+        self,
+        filename: str,
+        chunks: list,
+        lease_time: float = 600.0,
+        worker_id: Optional[str] = None,
+        generation_key: str = "",
+    ):
+        """Initalizes the GenerationQueue, the chunks are added if the queue
+        does not exist yet, or if it is finished and was created for other
+        chunks or another generation_key.
+
+        Parameters
+        ----------
+        filename : str
+            path to the queue file (shared between the workers)
+
+        chunks : list[tuple[int, int, int]]
+            the chunks (raw_start, raw_stop, first_position) to add if the
+            queue is new (or finished and of another generation)
+
+        lease_time : float
+            seconds a claimed chunk is reserved for a worker, default: 600
+
+        worker_id : str, optional
+            identifier of the worker, default: None (hostname-pid)
+
+        generation_key : str
+            identifies what is generated, workers can only join a queue
+            with the same key, default: ""
+        """
+        self.lease_time = lease_time
+        self.worker_id = worker_id
+        if self.worker_id is None:
+            self.worker_id = socket.gethostname() + "-" + str(os.getpid())
+        self._claimed = set()
+        self._lock = threading.RLock()
+        self._stop_renewal = threading.Event()
+        self._renewal_thread = None
+        self._connection = sqlite3.connect(
+            filename, timeout=60, isolation_level=None, check_same_thread=False
+        )
+        self._connection.execute("BEGIN IMMEDIATE")
+        try:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS chunks ("
+                "chunk_id INTEGER PRIMARY KEY, "
+                "raw_start INTEGER, "
+                "raw_stop INTEGER, "
+                "first_position INTEGER, "
+                "state TEXT, "
+                "worker TEXT, "
+                "lease_expires REAL)"
+            )
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS generation (key TEXT)"
+            )
+            existing = self._connection.execute(
+                "SELECT raw_start, raw_stop, first_position FROM chunks "
+                "ORDER BY chunk_id"
+            ).fetchall()
+            key = self._connection.execute(
+                "SELECT key FROM generation"
+            ).fetchone()
+            same_generation = existing == [
+                tuple(chunk) for chunk in chunks
+            ] and (key is None or key[0] == generation_key)
+            if not existing or (
+                not same_generation and self._count_unfinished() == 0
+            ):
+                self._connection.execute("DELETE FROM chunks")
+                self._connection.execute("DELETE FROM generation")
+                self._connection.executemany(
+                    "INSERT INTO chunks "
+                    "(raw_start, raw_stop, first_position, state) "
+                    "VALUES (?, ?, ?, 'pending')",
+                    chunks,
+                )
+                self._connection.execute(
+                    "INSERT INTO generation VALUES (?)", (generation_key,)
+                )
+            elif not same_generation:
+                raise ValueError(
+                    "The queue "
+                    + filename
+                    + " is used by an unfinished generation of other "
+                    "permutations (or another generator), remove it to "
+                    "start a new generation."
+                )
+            self._connection.execute("COMMIT")
+        except BaseException:
+            self._connection.execute("ROLLBACK")
+            self._connection.close()
+            raise
+
+    def _count_unfinished(self) -> int:
+        return self._connection.execute(
+            "SELECT COUNT(*) FROM chunks WHERE state != 'done'"
+        ).fetchone()[0]
+
+    def _renew_leases(self):
+        """Renews the leases of the claimed chunks until the queue is
+        closed."""
+        while not self._stop_renewal.wait(self.lease_time / 4):
+            for chunk_id in list(self._claimed):
+                self.renew(chunk_id)
+
+    def claim(self) -> Optional[tuple[int, int, int, int]]:
+        """claim reserves the next pending (or expired) chunk for this
+        worker, its lease is renewed until it is completed.
+
+        Returns
+        -------
+        tuple[int, int, int, int] | None
+            chunk_id, raw_start, raw_stop, first_position,
+            None if no chunk is available right now
+        """
+        with self._lock:
+            now = time.time()
+            self._connection.execute("BEGIN IMMEDIATE")
+            try:
+                chunk = self._connection.execute(
+                    "SELECT chunk_id, raw_start, raw_stop, first_position "
+                    "FROM chunks WHERE state = 'pending' OR "
+                    "(state = 'claimed' AND lease_expires < ?) "
+                    "ORDER BY chunk_id LIMIT 1",
+                    (now,),
+                ).fetchone()
+                if chunk is not None:
+                    self._connection.execute(
+                        "UPDATE chunks SET state = 'claimed', worker = ?, "
+                        "lease_expires = ? WHERE chunk_id = ?",
+                        (self.worker_id, now + self.lease_time, chunk[0]),
+                    )
+                self._connection.execute("COMMIT")
+            except BaseException:
+                self._connection.execute("ROLLBACK")
+                raise
+            if chunk is not None:
+                self._claimed.add(chunk[0])
+                if self._renewal_thread is None:
+                    self._renewal_thread = threading.Thread(
+                        target=self._renew_leases, daemon=True
+                    )
+                    self._renewal_thread.start()
+        return chunk
+
+    def renew(self, chunk_id: int) -> bool:
+        """renew extends the lease of a claimed chunk (done in the
+        background for all claimed chunks).
+
+        Parameters
+        ----------
+        chunk_id : int
+            the chunk to renew
+
+        Returns
+        -------
+        bool
+            False if the chunk is no longer claimed by this worker
+        """
+        with self._lock:
+            if chunk_id not in self._claimed:
+                return False
+            renewed = self._connection.execute(
+                "UPDATE chunks SET lease_expires = ? "
+                "WHERE chunk_id = ? AND worker = ? AND state = 'claimed'",
+                (time.time() + self.lease_time, chunk_id, self.worker_id),
+            ).rowcount
+            if not renewed:
+                self._claimed.discard(chunk_id)
+            return bool(renewed)
+
+    def is_claimed(self, chunk_id: int) -> bool:
+        """is_claimed checks if a chunk is still claimed by this worker (as
+        far as known from the last renewal).
+
+        Parameters
+        ----------
+        chunk_id : int
+            the chunk to check
+
+        Returns
+        -------
+        bool
+            True if the chunk is claimed by this worker
+        """
+        return chunk_id in self._claimed
+
+    def complete(self, chunk_id: int) -> bool:
+        """complete marks a chunk claimed by this worker as done.
+
+        Parameters
+        ----------
+        chunk_id : int
+            the chunk that is done
+
+        Returns
+        -------
+        bool
+            False if the chunk is no longer claimed by this worker (its
+            lease expired and it was claimed by another worker)
+        """
+        with self._lock:
+            self._claimed.discard(chunk_id)
+            return bool(
+                self._connection.execute(
+                    "UPDATE chunks SET state = 'done', lease_expires = NULL "
+                    "WHERE chunk_id = ? AND worker = ? AND state = 'claimed'",
+                    (chunk_id, self.worker_id),
+                ).rowcount
+            )
+
+    def is_done(self) -> bool:
+        """is_done checks if all chunks are done.
+
+        Returns
+        -------
+        bool
+            True if all chunks are done
+        """
+        with self._lock:
+            return self._count_unfinished() == 0
+
+    def close(self):
+        """close stops the lease renewal and closes the connection to the
+        queue."""
+        self._stop_renewal.set()
+        if self._renewal_thread is not None:
+            self._renewal_thread.join()
+        self._connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -10,12 +10,827 @@ Copyright (c) 2022 The scenariogeneration Authors.
 
 """
 
+import codecs
+import copy
+import datetime as dt
+import functools
+import gzip
+import hashlib
+import io
+import itertools
+import operator
 import os
+import re
+import time
 import xml.etree.ElementTree as ET
-from typing import Optional
+from importlib import metadata
+from typing import Callable, Iterable, Optional, Union
 
 from lxml import etree
 
+# timestamp pinned with set_deterministic_timestamp
+_deterministic_timestamp = None
+
+
+def set_deterministic_timestamp(timestamp: Optional[int]) -> Optional[int]:
+    """Pins the creation date written in the headers of all generated
+    files (and in archives), so identical inputs give byte identical
+    outputs. Without a pinned timestamp, the SOURCE_DATE_EPOCH environment
+    variable is used if set, otherwise the current time.
+
+    Parameters
+    ----------
+    timestamp : int, optional
+        seconds since 1970-01-01 UTC, None to unpin.
+
+    Returns
+    -------
+    int | None
+        the previously pinned timestamp
+    """
+    global _deterministic_timestamp
+    previous_timestamp = _deterministic_timestamp
+    _deterministic_timestamp = timestamp
+    return previous_timestamp
+
+
+def get_deterministic_timestamp() -> Optional[int]:
+    """Returns the pinned timestamp (see set_deterministic_timestamp), or
+    SOURCE_DATE_EPOCH if set.
+
+    Returns
+    -------
+    int | None
+        seconds since 1970-01-01 UTC, None if the current time should be
+        used.
+    """
+    if _deterministic_timestamp is not None:
+        return _deterministic_timestamp
+    source_date_epoch = os.environ.get("SOURCE_DATE_EPOCH")
+    if source_date_epoch:
+        return int(source_date_epoch)
+    return None
+
+
+def get_creation_timestamp() -> float:
+    """Returns the creation time of generated files, the pinned timestamp
+    (see get_deterministic_timestamp) or the current time.
+
+    Returns
+    -------
+    float
+        seconds since 1970-01-01 UTC
+    """
+    timestamp = get_deterministic_timestamp()
+    if timestamp is None:
+        return time.time()
+    return timestamp
+
+
+def get_creation_date() -> dt.datetime:
+    """Returns the creation date to write in the headers of generated
+    files, the pinned timestamp (in UTC, see get_deterministic_timestamp)
+    or the current (local) time.
+
+    Returns
+    -------
+    datetime.datetime
+        the creation date (without time zone)
+    """
+    timestamp = get_deterministic_timestamp()
+    if timestamp is None:
+        return dt.datetime.now()
+    return dt.datetime.fromtimestamp(timestamp, dt.timezone.utc).replace(
+        tzinfo=None
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def get_library_hash() -> str:
+    """Returns a hash identifying the installed version of
+    scenariogeneration (its version and the content of its source files),
+    used to invalidate results stored by an older version.
+
+    Returns
+    -------
+    str
+        sha256 hex digest
+    """
+    library_hash = hashlib.sha256()
+    try:
+        library_hash.update(metadata.version("scenariogeneration").encode())
+    except metadata.PackageNotFoundError:
+        pass
+    package_folder = os.path.dirname(os.path.abspath(__file__))
+    for folder, subfolders, filenames in os.walk(package_folder):
+        subfolders.sort()
+        for filename in sorted(filenames):
+            if filename.endswith(".py"):
+                path = os.path.join(folder, filename)
+                library_hash.update(
+                    os.path.relpath(path, package_folder).encode()
+                )
+                with open(path, "rb") as file_handle:
+                    library_hash.update(file_handle.read())
+    return library_hash.hexdigest()
+
+
+ELEMENT_FACTORIES = ["etree", "lxml"]
+
+# element factory used by Element and SubElement
+_element_factory = "etree"
+
+
+def set_element_factory(factory: str) -> str:
+    """Selects which xml library the get_element methods of all classes
+    build their elements with.
+
+    With "lxml", the elements are lxml.etree elements, which can be
+    validated directly (lxml.etree.XMLSchema) and written without
+    converting the tree. The "xmlns:"/"xsi:" attributes of the root
+    elements are then real namespace declarations.
+
+    Parameters
+    ----------
+    factory : str
+        "etree" (xml.etree.ElementTree, default) or "lxml"
+
+    Returns
+    -------
+    str
+        the previous element factory
+    """
+    global _element_factory
+    if factory not in ELEMENT_FACTORIES:
+        raise ValueError(
+            "factory can only be one of "
+            + ", ".join(ELEMENT_FACTORIES)
+            + ", not: "
+            + str(factory)
+        )
+    previous_factory = _element_factory
+    _element_factory = factory
+    return previous_factory
+
+
+def get_element_factory() -> str:
+    """Returns the element factory selected with set_element_factory.
+
+    Returns
+    -------
+    str
+        "etree" or "lxml"
+    """
+    return _element_factory
+
+
+def _lxml_name(name: str, nsmap: dict) -> str:
+    """Converts a prefixed name (xsi:name) to the lxml form ({uri}name)."""
+    prefix, _, local_name = name.partition(":")
+    return "{" + nsmap[prefix] + "}" + local_name
+
+
+def _lxml_element(parent, tag: str, attrib: Optional[dict]):
+    if attrib and None in attrib.values():
+        # ElementTree accepts (but can not write) unset attributes, lxml
+        # does not accept them at all
+        attrib = {
+            key: value for key, value in attrib.items() if value is not None
+        }
+    if not attrib or not any(":" in key for key in attrib):
+        if parent is None:
+            return etree.Element(tag, attrib)
+        return etree.SubElement(parent, tag, attrib)
+    nsmap = {
+        key[len("xmlns:") :]: value
+        for key, value in attrib.items()
+        if key.startswith("xmlns:")
+    }
+    if parent is None:
+        element = etree.Element(tag, nsmap=nsmap)
+    else:
+        element = etree.SubElement(parent, tag, nsmap=nsmap)
+    in_scope = element.nsmap
+    for key, value in attrib.items():
+        if key.startswith("xmlns:"):
+            continue
+        if ":" in key:
+            key = _lxml_name(key, in_scope)
+        element.set(key, value)
+    return element
+
+
+def Element(tag: str, attrib: Optional[dict] = None):
+    """Creates an element with the selected element factory (see
+    set_element_factory).
+
+    Parameters
+    ----------
+    tag : str
+        tag of the element
+
+    attrib : dict, optional
+        attributes of the element, default: None
+
+    Returns
+    -------
+    ET.Element | lxml.etree._Element
+        the element
+    """
+    if _element_factory == "lxml":
+        return _lxml_element(None, tag, attrib)
+    if attrib is None:
+        return ET.Element(tag)
+    return ET.Element(tag, attrib)
+
+
+def SubElement(parent, tag: str, attrib: Optional[dict] = None):
+    """Creates an element with the selected element factory (see
+    set_element_factory) and appends it to parent.
+
+    Parameters
+    ----------
+    parent : ET.Element | lxml.etree._Element
+        the parent of the element
+
+    tag : str
+        tag of the element
+
+    attrib : dict, optional
+        attributes of the element, default: None
+
+    Returns
+    -------
+    ET.Element | lxml.etree._Element
+        the element
+    """
+    if _element_factory == "lxml":
+        return _lxml_element(parent, tag, attrib)
+    if attrib is None:
+        return ET.SubElement(parent, tag)
+    return ET.SubElement(parent, tag, attrib)
+
+
+def import_element(element):
+    """Returns element as an element of the selected element factory (see
+    set_element_factory), copying it if it was created with the other one.
+
+    Parameters
+    ----------
+    element : ET.Element | lxml.etree._Element
+        the element to import
+
+    Returns
+    -------
+    ET.Element | lxml.etree._Element
+        the element
+    """
+    if _element_factory == "lxml":
+        if isinstance(element, etree._Element):
+            return element
+        return etree.fromstring(ET.tostring(element))
+    if isinstance(element, etree._Element):
+        return ET.fromstring(etree.tostring(element))
+    return element
+
+
+def parse_file(filename: str):
+    """Parses an xml file with the selected element factory (see
+    set_element_factory), so elements created by the classes can be
+    added to it. Files ending with .gz are decompressed while they are
+    parsed (see open_file).
+
+    Parameters
+    ----------
+    filename : str
+        path to the xml file
+
+    Returns
+    -------
+    ET.ElementTree | lxml.etree._ElementTree
+        the parsed tree
+    """
+    with open_file(filename, "rb") as file_handle:
+        if _element_factory == "lxml":
+            return etree.parse(file_handle)
+        return ET.parse(file_handle)
+
+
+def is_element(element) -> bool:
+    """Returns True if element is an xml element of either element factory.
+
+    Parameters
+    ----------
+    element : Any
+        the object to check
+
+    Returns
+    -------
+    bool
+    """
+    return isinstance(element, (ET.Element, etree._Element))
+
+
+# revisions of the mutations of CachedElementBase objects
+_revisions = itertools.count(1)
+
+# prefixes of the methods that are treated as mutators by CachedElementBase
+_MUTATOR_PREFIXES = ("add_", "set_", "adjust_")
+
+
+def _wrap_get_element(cls, get_element: Callable) -> Callable:
+    @functools.wraps(get_element)
+    def cached_get_element(self, *args, **kwargs):
+        if not self._element_cache_enabled:
+            return get_element(self, *args, **kwargs)
+        try:
+            key = (cls, args, tuple(sorted(kwargs.items())))
+            key += self._element_cache_key()
+            hash(key)
+        except TypeError:
+            return get_element(self, *args, **kwargs)
+        cache = self.__dict__.setdefault("_element_cache", {})
+        cached = cache.get(key)
+        if cached is not None:
+            revision, dependencies, cached_element = cached
+            if max(map(_get_revision, dependencies)) < revision:
+                return copy.deepcopy(cached_element)
+        element = get_element(self, *args, **kwargs)
+        dependencies = {}
+        _collect_dependencies(self, dependencies)
+        cache[key] = (
+            next(_revisions),
+            list(dependencies.values()),
+            copy.deepcopy(element),
+        )
+        return element
+
+    return cached_get_element
+
+
+def _wrap_mutator(mutator: Callable) -> Callable:
+    @functools.wraps(mutator)
+    def tracked_mutator(self, *args, **kwargs):
+        try:
+            return mutator(self, *args, **kwargs)
+        finally:
+            object.__setattr__(self, "_revision", next(_revisions))
+
+    return tracked_mutator
+
+
+def _collect_dependencies(value, dependencies: dict) -> None:
+    """Collects all CachedElementBase objects reachable from value (by id)."""
+    if isinstance(value, CachedElementBase):
+        if id(value) in dependencies:
+            return
+        dependencies[id(value)] = value
+        children = value.__dict__.values()
+    elif isinstance(value, (list, tuple)):
+        children = value
+    elif isinstance(value, dict):
+        children = value.values()
+    else:
+        return
+    for child in children:
+        if isinstance(child, (CachedElementBase, list, tuple, dict)):
+            _collect_dependencies(child, dependencies)
+
+
+_get_revision = operator.attrgetter("_revision")
+
+# CachedElementBase classes, whose methods are wrapped once tracking is on
+_cached_element_classes = []
+_tracking_installed = False
+
+
+def _tracked_setattr(self, name: str, value) -> None:
+    object.__setattr__(self, name, value)
+    object.__setattr__(self, "_revision", next(_revisions))
+
+
+def _install_class_tracking(cls) -> None:
+    """Wraps get_element and the mutators defined by cls."""
+    for name, attr in list(cls.__dict__.items()):
+        if not callable(attr) or isinstance(
+            attr, (type, staticmethod, classmethod)
+        ):
+            continue
+        if name == "get_element":
+            setattr(cls, name, _wrap_get_element(cls, attr))
+        elif name.startswith(_MUTATOR_PREFIXES):
+            setattr(cls, name, _wrap_mutator(attr))
+
+
+def _install_tracking() -> None:
+    """Installs the revision tracking of all CachedElementBase classes.
+
+    Tracking is only installed the first time a cache is enabled, so
+    objects cost nothing extra as long as no cache is used.
+    """
+    global _tracking_installed
+    if _tracking_installed:
+        return
+    _tracking_installed = True
+    CachedElementBase.__setattr__ = _tracked_setattr
+    for cls in _cached_element_classes:
+        _install_class_tracking(cls)
+
+
+class CachedElementBase:
+    """Base class adding opt-in caching of the element created by
+    get_element, see enable_element_cache.
+
+    Once a cache is enabled, assigning an attribute or calling a method
+    starting with add_, set_ or adjust_ marks the object as changed, which
+    invalidates the cached elements of the object and of all objects
+    containing it.
+    """
+
+    _element_cache_enabled = False
+    _revision = 0
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        _cached_element_classes.append(cls)
+        if _tracking_installed:
+            _install_class_tracking(cls)
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        state.pop("_element_cache", None)
+        return state
+
+    def _element_cache_key(self) -> tuple:
+        """Returns what, besides the object itself, the element depends
+        on."""
+        return (_element_factory,)
+
+    def enable_element_cache(self, enable: bool = True) -> None:
+        """Enables caching of the element created by get_element, so an
+        object that is used many times (e.g. a catalog entry shared by many
+        scenarios) is only built once, and copied afterwards.
+
+        The cache is invalidated when the object, or any object it
+        contains, is changed. Elements that depend on the time of creation
+        (e.g. FileHeader dates) are reused as they were created.
+
+        Parameters
+        ----------
+        enable : bool
+            True to enable the cache, False to disable (and clear) it.
+            Default: True
+        """
+        if enable:
+            _install_tracking()
+        object.__setattr__(self, "_element_cache_enabled", enable)
+        self.__dict__.pop("_element_cache", None)
+
+
+class StreamElement:
+    """StreamElement is an XML element whose children are produced lazily,
+    so it can be written to a file (see write_stream) without building the
+    whole ElementTree.
+
+    The children can only be iterated once, iter_xml() of the generation
+    classes returns a new StreamElement for each call.
+
+    Parameters
+    ----------
+    tag : str
+        tag of the element
+
+    attrib : dict, optional
+        attributes of the element, default: None
+
+    children : Iterable[ET.Element | StreamElement], optional
+        the children of the element, default: no children
+
+    Attributes
+    ----------
+    tag : str
+        tag of the element
+
+    attrib : dict
+        attributes of the element
+
+    children : Iterable[ET.Element | StreamElement]
+        the children of the element
+    """
+
+    def __init__(
+        self,
+        tag: str,
+        attrib: Optional[dict] = None,
+        children: Iterable[Union[ET.Element, "StreamElement"]] = (),
+    ):
+        """Initalizes the StreamElement.
+
+        Parameters
+        ----------
+        tag : str
+            tag of the element
+
+        attrib : dict, optional
+            attributes of the element, default: None
+
+        children : Iterable[ET.Element | StreamElement], optional
+            the children of the element, default: no children
+        """
+        self.tag = tag
+        self.attrib = {} if attrib is None else attrib
+        self.children = children
+
+    def to_element(self) -> ET.Element:
+        """to_element builds the ElementTree of the element (consumes the
+        children).
+
+        Returns
+        -------
+        ET.Element
+            the element
+        """
+        element = Element(self.tag, self.attrib)
+        for child in self.children:
+            if isinstance(child, StreamElement):
+                child = child.to_element()
+            element.append(import_element(child))
+        return element
+
+
+_INDENT = "    "
+_CDATA_START = "<![CDATA["
+_CDATA_END = "]]>"
+# number of serialized pieces kept before they are written to the file
+_FLUSH_INTERVAL = 4096
+
+
+_TEXT_ESCAPES = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;"})
+_TEXT_ESCAPES[ord("\r")] = "&#13;"
+_ATTRIBUTE_ESCAPES = str.maketrans(
+    {
+        "&": "&amp;",
+        "<": "&lt;",
+        ">": "&gt;",
+        '"': "&quot;",
+        "\n": "&#10;",
+        "\r": "&#13;",
+        "\t": "&#9;",
+    }
+)
+_NEEDS_ESCAPE = re.compile('[&<>"\n\r\t]')
+
+
+def _escape_text(text: str) -> str:
+    """Escapes the text of an element (CDATA sections are kept as is)."""
+    if text.startswith(_CDATA_START) and text.endswith(_CDATA_END):
+        return text
+    if _NEEDS_ESCAPE.search(text) is None:
+        return text
+    return text.translate(_TEXT_ESCAPES)
+
+
+def _escape_attribute(value: str) -> str:
+    """Escapes an attribute value."""
+    if _NEEDS_ESCAPE.search(value) is None:
+        return value
+    return value.translate(_ATTRIBUTE_ESCAPES)
+
+
+def _is_blank(text: Optional[str]) -> bool:
+    return text is None or not text.strip()
+
+
+_COMMENT_TAGS = (ET.Comment, etree.Comment)
+_PI_TAGS = (ET.ProcessingInstruction, etree.ProcessingInstruction)
+
+
+class _PrettyWriter:
+    """Serializes an ElementTree in one pass, indenting elements that only
+    contain other elements (elements with mixed content are written as
+    they are, like lxml pretty_print)."""
+
+    def __init__(self, file_handle, encoding: str):
+        self._file_handle = file_handle
+        # incremental, so a BOM is only written once
+        self._encoder = codecs.getincrementalencoder(encoding)(
+            "xmlcharrefreplace"
+        )
+        self._pieces = []
+
+    def flush(self):
+        """Writes the serialized pieces to the file handle."""
+        self._file_handle.write(self._encoder.encode("".join(self._pieces)))
+        # cleared in place, write_element holds a reference to the list
+        self._pieces.clear()
+
+    def _start_tag(self, element: Union[ET.Element, StreamElement]) -> str:
+        attrib = element.attrib
+        if not attrib:
+            return "<" + element.tag
+        if _NEEDS_ESCAPE.search("".join(attrib.values())) is None:
+            return (
+                "<"
+                + element.tag
+                + "".join([' %s="%s"' % item for item in attrib.items()])
+            )
+        return (
+            "<"
+            + element.tag
+            + "".join(
+                [
+                    ' %s="%s"' % (key, _escape_attribute(value))
+                    for key, value in attrib.items()
+                ]
+            )
+        )
+
+    def write_element(
+        self, element: Union[ET.Element, StreamElement], indent: str
+    ):
+        """Writes an element (with indent before it and a newline after)."""
+        if len(self._pieces) >= _FLUSH_INTERVAL:
+            self.flush()
+        append = self._pieces.append
+        tag = element.tag
+        if isinstance(element, StreamElement):
+            child_indent = indent + _INDENT
+            empty = True
+            for child in element.children:
+                if empty:
+                    append(indent + self._start_tag(element) + ">\n")
+                    empty = False
+                self.write_element(child, child_indent)
+            if empty:
+                append(indent + self._start_tag(element) + "/>\n")
+            else:
+                append(indent + "</" + tag + ">\n")
+            return
+        if not isinstance(tag, str):
+            append(indent)
+            self.write_unformatted(element)
+            append("\n")
+            return
+        if len(element):
+            if (element.text or any(child.tail for child in element)) and (
+                not _is_blank(element.text)
+                or any(not _is_blank(child.tail) for child in element)
+            ):
+                append(indent)
+                self.write_unformatted(element)
+                append("\n")
+                return
+            append(indent + self._start_tag(element) + ">\n")
+            child_indent = indent + _INDENT
+            for child in element:
+                self.write_element(child, child_indent)
+            append(indent + "</" + tag + ">\n")
+        elif element.text:
+            append(
+                indent
+                + self._start_tag(element)
+                + ">"
+                + _escape_text(element.text)
+                + "</"
+                + tag
+                + ">\n"
+            )
+        else:
+            append(indent + self._start_tag(element) + "/>\n")
+
+    def write_unformatted(self, element: ET.Element):
+        """Writes an element (without its tail) as it is."""
+        append = self._pieces.append
+        if element.tag in _COMMENT_TAGS:
+            append("<!--" + (element.text or "") + "-->")
+            return
+        if element.tag in _PI_TAGS:
+            if isinstance(element, etree._Element):
+                append(etree.tostring(element, encoding="unicode"))
+            else:
+                append("<?" + (element.text or "") + "?>")
+            return
+        if not isinstance(element.tag, str):
+            # lxml entity references
+            append(
+                etree.tostring(element, encoding="unicode", with_tail=False)
+            )
+            return
+        if not element.text and not len(element):
+            append(self._start_tag(element) + "/>")
+            return
+        append(self._start_tag(element) + ">")
+        if element.text:
+            append(_escape_text(element.text))
+        for child in element:
+            self.write_unformatted(child)
+            if child.tail:
+                append(_escape_text(child.tail))
+        append("</" + element.tag + ">")
+
+
+class _LxmlPrettyWriter(_PrettyWriter):
+    """_PrettyWriter for lxml trees, writing namespaced names with their
+    prefixes and the namespace declarations."""
+
+    def __init__(self, file_handle, encoding: str, root: etree._Element):
+        super().__init__(file_handle, encoding)
+        self._root = root
+
+    def _start_tag(self, element: etree._Element) -> str:
+        parent = element.getparent()
+        nsmap = element.nsmap
+        if element is self._root or parent is None:
+            declarations = nsmap
+        else:
+            parent_nsmap = parent.nsmap
+            declarations = {
+                prefix: uri
+                for prefix, uri in nsmap.items()
+                if parent_nsmap.get(prefix) != uri
+            }
+        if not declarations and "{" not in element.tag:
+            if not any(key.startswith("{") for key in element.attrib):
+                return super()._start_tag(element)
+        prefixes = {uri: prefix for prefix, uri in nsmap.items()}
+        pieces = ["<" + self._prefixed_name(element.tag, prefixes)]
+        for prefix, uri in declarations.items():
+            name = "xmlns" if prefix is None else "xmlns:" + prefix
+            pieces.append(' %s="%s"' % (name, _escape_attribute(uri)))
+        for key, value in element.attrib.items():
+            pieces.append(
+                ' %s="%s"'
+                % (
+                    self._prefixed_name(key, prefixes),
+                    _escape_attribute(value),
+                )
+            )
+        return "".join(pieces)
+
+    @staticmethod
+    def _prefixed_name(name: str, prefixes: dict) -> str:
+        if not name.startswith("{"):
+            return name
+        uri, local_name = name[1:].split("}", 1)
+        prefix = prefixes.get(uri)
+        if prefix is None:
+            return local_name
+        return prefix + ":" + local_name
+
+
+def _has_qualified_names(element: ET.Element) -> bool:
+    """Checks if the root element has namespace qualified ({uri}name) names,
+    as the root of a parsed file with namespace declarations has."""
+    return "{" in element.tag or any("{" in key for key in element.attrib)
+
+
+def write_prettified(
+    element: ET.Element,
+    file_handle,
+    encoding: Optional[str] = None,
+    xml_declaration: bool = True,
+) -> None:
+    """Writes a prettified version of an XML element directly to a file
+    handle, in a single pass with 4-space indentation.
+
+    Text on the form "<![CDATA[...]]>" is written as a CDATA section.
+
+    Parameters
+    ----------
+    element : ET.Element | StreamElement
+        The XML element to write. Can also be any generation class of
+        scenariogeneration.
+    file_handle : BinaryIO
+        The (binary) file handle to write to.
+    encoding : str, optional
+        The encoding to use for the output. Default is 'utf-8'.
+    xml_declaration : bool, optional
+        Whether to include the XML declaration in the output. Default is True.
+
+    Returns
+    -------
+    None
+    """
+    if not is_element(element) and not isinstance(element, StreamElement):
+        element = element.get_element()
+
+    if encoding is None:
+        encoding = "utf-8"
+
+    if isinstance(element, ET.Element) and _has_qualified_names(element):
+        # parsed files ({uri}name), ElementTree assigns the prefixes
+        element = etree.fromstring(ET.tostring(element))
+    if isinstance(element, etree._Element):
+        writer = _LxmlPrettyWriter(file_handle, encoding, element)
+    else:
+        writer = _PrettyWriter(file_handle, encoding)
+    if xml_declaration:
+        writer._pieces.append(
+            "<?xml version='1.0' encoding='" + encoding + "'?>\n"
+        )
+    writer.write_element(element, "")
+    writer.flush()
+
 
 def prettify(
     element: ET.Element,
@@ -40,47 +855,9 @@ def prettify(
     bytes
         The prettified XML as a bytes string with 4-space indentation.
     """
-    if not isinstance(element, ET.Element):
-        element = element.get_element()
-
-    if encoding is None:
-        encoding = "utf-8"
-
-    # Define a 4-space indent string
-    indent_str = "    "
-
-    # Use the etree.Parser class from lxml to specify a custom parser
-    parser = etree.XMLParser(remove_blank_text=True, strip_cdata=False)
-
-    # Convert the ElementTree element to an lxml etree form
-    lxml_element = etree.fromstring(
-        ET.tostring(element, encoding), parser=parser
-    )
-
-    # Replace the CDATA marker with a real CDATA node
-    for cdata_marker in lxml_element.xpath(
-        '//*[starts-with(text(), "<![CDATA[")]'
-    ):
-        cdata_content = cdata_marker.text[len("<![CDATA[") : -len("]]>")]
-        cdata_marker.text = etree.CDATA(cdata_content)
-
-    # Now generate a 2-space indented pretty_print string (bytes type)
-    # and Decode the bytes type pretty_print string to utf-8 encoded string,
-    # then replace 2-space indents with 4 spaces
-    pretty_print_str = (
-        etree.tostring(
-            lxml_element,
-            pretty_print=True,
-            encoding=encoding,
-            xml_declaration=xml_declaration,
-        )
-        .decode(encoding)
-        .replace("  ", indent_str)
-        # .replace("'", '"') // This was added for geo_reference. Will remove for now since it's causing issues with stacking double quotations
-    )
-
-    # Encode the string back into bytes type and return
-    return pretty_print_str.encode(encoding)
+    output = io.BytesIO()
+    write_prettified(element, output, encoding, xml_declaration)
+    return output.getvalue()
 
 
 def prettyprint(element: ET.Element, encoding: Optional[str] = None) -> None:
@@ -103,17 +880,177 @@ def prettyprint(element: ET.Element, encoding: Optional[str] = None) -> None:
     print(prettify(element, encoding=encoding).decode())
 
 
+def _write_unindented(
+    element: Union[ET.Element, StreamElement], write: Callable
+) -> None:
+    """Writes an element the same way as ElementTree.write (lxml elements
+    as lxml writes them), writing each child of a StreamElement as soon as
+    it is produced."""
+    if isinstance(element, etree._Element):
+        write(etree.tostring(element, encoding="unicode", with_tail=False))
+        return
+    if not isinstance(element, StreamElement):
+        write(ET.tostring(element, encoding="unicode"))
+        return
+    # the start tag is serialized by ElementTree to get the same escaping
+    start_tag = ET.tostring(
+        ET.Element(element.tag, attrib=element.attrib), encoding="unicode"
+    )[: -len(" />")]
+    empty = True
+    for child in element.children:
+        if empty:
+            write(start_tag + ">")
+            empty = False
+        _write_unindented(child, write)
+    if empty:
+        write(start_tag + " />")
+    else:
+        write("</" + element.tag + ">")
+
+
+def write_stream(
+    element: Union[ET.Element, StreamElement],
+    file_handle,
+    prettyprint: bool = True,
+    encoding: str = "utf-8",
+) -> None:
+    """Writes an element to a (binary) file handle, the children of
+    StreamElements are written as they are produced, so the whole
+    ElementTree is never held in memory.
+
+    The output is the same as printToFile gives for the full element.
+
+    Parameters
+    ----------
+    element : ET.Element | StreamElement
+        The XML element to write.
+    file_handle : BinaryIO
+        The (binary) file handle to write to.
+    prettyprint : bool, optional
+        Whether to format the XML with indentation. Default is True.
+    encoding : str, optional
+        The output encoding to use. Default is 'utf-8'.
+
+    Returns
+    -------
+    None
+    """
+    if prettyprint:
+        write_prettified(element, file_handle, encoding=encoding)
+        return
+    # raises LookupError for unknown encodings
+    encoder = codecs.getincrementalencoder(encoding)("xmlcharrefreplace")
+
+    def write(text: str):
+        file_handle.write(encoder.encode(text))
+
+    if encoding.lower() not in ["utf-8", "us-ascii"]:
+        write("<?xml version='1.0' encoding='" + encoding + "'?>\n")
+    _write_unindented(element, write)
+
+
+# files with this extension are gzip compressed (see open_file)
+COMPRESSED_EXTENSION = ".gz"
+
+# gzip compression level of the written files, a good tradeoff between the
+# speed and the size (9 is much slower for a few percent smaller files)
+COMPRESSION_LEVEL = 6
+
+
+def is_compressed_file(filename: str) -> bool:
+    """Returns True if filename has the COMPRESSED_EXTENSION (.gz).
+
+    Parameters
+    ----------
+    filename : str
+        path to the file
+
+    Returns
+    -------
+    bool
+    """
+    return str(filename).endswith(COMPRESSED_EXTENSION)
+
+
+def open_file(filename: str, mode: str = "rb", encoding: Optional[str] = None):
+    """Opens a file, transparently (de)compressed with gzip if the filename
+    ends with .gz (e.g. myscenario.xosc.gz). The content is compressed and
+    decompressed as it is written and read, so it is never held in memory
+    as a whole.
+
+    The gzip header of written files contains the creation timestamp (see
+    get_creation_timestamp), so deterministic outputs stay byte identical.
+
+    Parameters
+    ----------
+    filename : str
+        path to the file
+
+    mode : str
+        "rb", "wb", "r" or "w" (text modes need encoding), default: "rb"
+
+    encoding : str
+        encoding of text modes, default: None
+
+    Returns
+    -------
+    file object
+        the opened file
+    """
+    if not is_compressed_file(filename):
+        if "b" in mode:
+            return open(filename, mode)
+        return open(filename, mode, encoding=encoding)
+    binary_mode = mode.replace("t", "").replace("b", "") + "b"
+    if "w" in binary_mode:
+        file_handle = gzip.GzipFile(
+            filename,
+            binary_mode,
+            compresslevel=COMPRESSION_LEVEL,
+            mtime=int(get_creation_timestamp()),
+        )
+    else:
+        file_handle = gzip.GzipFile(filename, binary_mode)
+    if "b" in mode:
+        return file_handle
+    return io.TextIOWrapper(file_handle, encoding=encoding)
+
+
+def compress_bytes(data: bytes) -> bytes:
+    """Compresses data the same way as open_file compresses .gz files.
+
+    Parameters
+    ----------
+    data : bytes
+        the data to compress
+
+    Returns
+    -------
+    bytes
+        the gzip compressed data
+    """
+    return gzip.compress(
+        data,
+        compresslevel=COMPRESSION_LEVEL,
+        mtime=int(get_creation_timestamp()),
+    )
+
+
 def printToFile(
-    element: ET.Element,
+    element: Union[ET.Element, StreamElement],
     filename: str,
     prettyprint: bool = True,
     encoding: str = "utf-8",
 ) -> None:
     """Prints the element to an XML file.
 
+    A StreamElement is written as its children are produced (the file is
+    removed if producing them fails). Files ending with .gz are gzip
+    compressed while they are written (see open_file).
+
     Parameters
     ----------
-    element : ET.Element
+    element : ET.Element | lxml.etree._Element | StreamElement
         The XML element to print.
     filename : str
         The file path to save the XML content.
@@ -126,21 +1063,32 @@ def printToFile(
     -------
     None
     """
-    if prettyprint:
+    try:
+        # checked before the file is opened, so that it is left untouched
+        codecs.lookup(encoding)
+    except LookupError:
+        print("%s is not a valid encoding option." % encoding)
+        return
+    if isinstance(element, (StreamElement, etree._Element)):
+        if os.path.dirname(filename):
+            os.makedirs(os.path.dirname(filename), exist_ok=True)
         try:
-            if os.path.dirname(filename):
-                os.makedirs(os.path.dirname(filename), exist_ok=True)
-            with open(filename, "wb") as file_handle:
-                file_handle.write(prettify(element, encoding=encoding))
-        except LookupError:
-            print("%s is not a valid encoding option." % encoding)
+            with open_file(filename, "wb") as file_handle:
+                write_stream(element, file_handle, prettyprint, encoding)
+        except BaseException:
+            os.remove(filename)
+            raise
+
+    elif prettyprint:
+        if os.path.dirname(filename):
+            os.makedirs(os.path.dirname(filename), exist_ok=True)
+        with open_file(filename, "wb") as file_handle:
+            write_prettified(element, file_handle, encoding=encoding)
 
     else:
         tree = ET.ElementTree(element)
-        try:
-            tree.write(filename, encoding=encoding)
-        except LookupError:
-            print("%s is not a valid encoding option." % encoding)
+        with open_file(filename, "wb") as file_handle:
+            tree.write(file_handle, encoding=encoding)
 
 
 def enum2str(enum: "Enum") -> str:
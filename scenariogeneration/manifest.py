@@ -0,0 +1,373 @@
+"""
+scenariogeneration
+https://github.com/pyoscx/scenariogeneration
+
+This Source Code Form is subject to the terms of the Mozilla Public
+License, v. 2.0. If a copy of the MPL was not distributed with this
+file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+Copyright (c) 2022 The scenariogeneration Authors.
+
+"""
+
+import glob
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from typing import Iterator, Optional
+
+_MANIFEST_FIELDS = [
+    "name",
+    "parameters_hash",
+    "generator_hash",
+    "scenario_file",
+    "scenario_hash",
+    "scenario_size",
+    "scenario_mtime_ns",
+    "road_file",
+    "road_hash",
+    "road_size",
+    "road_mtime_ns",
+]
+
+
+def hash_parameters(permutation: dict) -> str:
+    """hash_parameters creates a stable hash of a permutation.
+
+    Parameters
+    ----------
+    permutation : dict
+        the permutation to hash
+
+    Returns
+    -------
+    str
+        sha256 hex digest of the permutation
+    """
+    return hashlib.sha256(
+        json.dumps(permutation, sort_keys=True, default=repr).encode()
+    ).hexdigest()
+
+
+def hash_file(filename: str) -> str:
+    """hash_file creates a hash of the content of a file.
+
+    Parameters
+    ----------
+    filename : str
+        path to the file
+
+    Returns
+    -------
+    str
+        sha256 hex digest of the file
+    """
+    file_hash = hashlib.sha256()
+    with open(filename, "rb") as file_handle:
+        for block in iter(lambda: file_handle.read(1 << 16), b""):
+            file_hash.update(block)
+    return file_hash.hexdigest()
+
+
+class GenerationManifest:
+    """GenerationManifest is a persistent (SQLite) record of what has been
+    generated in a generation folder, used by the ScenarioGenerator to skip
+    permutations that are already up to date.
+
+    Each entry is a dict with the following keys:
+        name - name of the scenario
+        parameters_hash - hash of the permutation
+        generator_hash - hash of the generator source and settings
+        scenario_file - path of the xosc, relative to the generation
+            folder ("" if no scenario was generated)
+        scenario_hash - sha256 of the xosc
+        scenario_size - size of the xosc in bytes
+        scenario_mtime_ns - modification time of the xosc
+        road_file - path of the xodr, relative to the generation folder
+            ("" if no road was generated)
+        road_hash - sha256 of the xodr
+        road_size - size of the xodr in bytes
+        road_mtime_ns - modification time of the xodr
+
+    Parameters
+    ----------
+    filename : str
+        path to the manifest file
+
+    commit_interval : int
+        number of recorded entries between each commit to disk,
+        default: 1000
+    """
+
+    filename = "manifest.sqlite"
+
+    @staticmethod
+    def shard_filename(shard_index: int, shard_count: int) -> str:
+        """shard_filename returns the filename of the manifest of a shard.
+
+        Parameters
+        ----------
+        shard_index : int
+            index of the shard
+
+        shard_count : int
+            number of shards
+
+        Returns
+        -------
+        str
+            filename of the manifest
+        """
+        return (
+            "manifest_shard_"
+            + str(shard_index)
+            + "_of_"
+            + str(shard_count)
+            + ".sqlite"
+        )
+
+    def __init__(self, filename: str, commit_interval: int = 1000):
+        """Initalizes the GenerationManifest.
+
+        Parameters
+        ----------
+        filename : str
+            path to the manifest file
+
+        commit_interval : int
+            number of recorded entries between each commit to disk,
+            default: 1000
+        """
+        self.path = filename
+        self.commit_interval = commit_interval
+        self._uncommitted = 0
+        # the manifest can be used from several threads (eg. the task
+        # handler of a multiprocessing.Pool), so all access is locked
+        self._lock = threading.RLock()
+        self._connection = sqlite3.connect(filename, check_same_thread=False)
+        self._connection.row_factory = sqlite3.Row
+        columns = [
+            row[1]
+            for row in self._connection.execute("PRAGMA table_info(entries)")
+        ]
+        if columns and columns != _MANIFEST_FIELDS:
+            # written by an older version, whose outputs are outdated anyway
+            self._connection.execute("DROP TABLE entries")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            "name TEXT PRIMARY KEY, "
+            "parameters_hash TEXT, "
+            "generator_hash TEXT, "
+            "scenario_file TEXT, "
+            "scenario_hash TEXT, "
+            "scenario_size INTEGER, "
+            "scenario_mtime_ns INTEGER, "
+            "road_file TEXT, "
+            "road_hash TEXT, "
+            "road_size INTEGER, "
+            "road_mtime_ns INTEGER)"
+        )
+        self._connection.commit()
+
+    def get(self, name: str) -> Optional[dict]:
+        """get returns the entry of a scenario.
+
+        Parameters
+        ----------
+        name : str
+            name of the scenario
+
+        Returns
+        -------
+        dict | None
+            the entry, None if the scenario is not in the manifest
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT * FROM entries WHERE name = ?", (name,)
+            ).fetchone()
+        if row is None:
+            return None
+        return dict(row)
+
+    def record(self, entry: dict):
+        """record adds (or replaces) an entry in the manifest.
+
+        Parameters
+        ----------
+        entry : dict
+            the entry to record
+        """
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO entries VALUES ("
+                + ", ".join("?" * len(_MANIFEST_FIELDS))
+                + ")",
+                tuple(entry[field] for field in _MANIFEST_FIELDS),
+            )
+            self._uncommitted += 1
+            if self._uncommitted >= self.commit_interval:
+                self.commit()
+
+    def is_up_to_date(
+        self,
+        name: str,
+        parameters_hash: str,
+        generator_hash: str,
+        generation_folder: str,
+    ) -> Optional[dict]:
+        """is_up_to_date checks if a scenario has been generated with the
+        same parameters and generator, and that its outputs are unchanged
+        (same size, and same modification time or else same hash).
+
+        Parameters
+        ----------
+        name : str
+            name of the scenario
+
+        parameters_hash : str
+            hash of the permutation
+
+        generator_hash : str
+            hash of the generator
+
+        generation_folder : str
+            the folder the outputs are relative to
+
+        Returns
+        -------
+        dict | None
+            the entry if the outputs are up to date, else None
+        """
+        entry = self.get(name)
+        if (
+            entry is None
+            or entry["parameters_hash"] != parameters_hash
+            or entry["generator_hash"] != generator_hash
+        ):
+            return None
+        for kind in ["scenario", "road"]:
+            if not entry[kind + "_file"]:
+                continue
+            filename = os.path.join(generation_folder, entry[kind + "_file"])
+            try:
+                stat = os.stat(filename)
+            except OSError:
+                return None
+            if stat.st_size != entry[kind + "_size"]:
+                return None
+            if stat.st_mtime_ns == entry[kind + "_mtime_ns"]:
+                continue
+            # modified (or touched), compare the content
+            if hash_file(filename) != entry[kind + "_hash"]:
+                return None
+        return entry
+
+    @staticmethod
+    def worker_filename(worker_id: str) -> str:
+        """worker_filename returns the filename of the manifest of a worker
+        of a GenerationQueue.
+
+        Parameters
+        ----------
+        worker_id : str
+            identifier of the worker
+
+        Returns
+        -------
+        str
+            filename of the manifest
+        """
+        return "manifest_worker_" + worker_id + ".sqlite"
+
+    def merge(self, filename: str):
+        """merge adds all entries of another manifest to this manifest,
+        entries with the same name are replaced.
+
+        Parameters
+        ----------
+        filename : str
+            path to the manifest to merge
+        """
+        with self._lock:
+            self.commit()
+            self._connection.execute("ATTACH DATABASE ? AS other", (filename,))
+            try:
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO entries "
+                    "SELECT * FROM other.entries"
+                )
+                self._connection.commit()
+            finally:
+                self._connection.execute("DETACH DATABASE other")
+
+    def commit(self):
+        """commit writes all recorded entries to disk."""
+        with self._lock:
+            self._connection.commit()
+            self._uncommitted = 0
+
+    def close(self):
+        """close commits and closes the manifest."""
+        with self._lock:
+            self.commit()
+            self._connection.close()
+
+    def __iter__(self) -> Iterator[dict]:
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT * FROM entries ORDER BY name"
+            ).fetchall()
+        for row in rows:
+            yield dict(row)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute(
+                "SELECT COUNT(*) FROM entries"
+            ).fetchone()[0]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def merge_shard_manifests(
+    generation_folder: str, remove_shard_manifests: bool = False
+) -> str:
+    """merge_shard_manifests merges the manifests of all shards and workers
+    in a generation folder (from ScenarioGenerator.generate with
+    shard_count > 1 or work_queue = True) into the manifest of the
+    generation folder.
+
+    Parameters
+    ----------
+    generation_folder : str
+        the generation folder
+
+    remove_shard_manifests : bool
+        remove the manifests of the shards/workers after they are merged.
+        Default: False
+
+    Returns
+    -------
+    str
+        path to the merged manifest
+    """
+    shard_manifests = sorted(
+        glob.glob(
+            os.path.join(glob.escape(generation_folder), "manifest_*.sqlite")
+        )
+    )
+    filename = os.path.join(generation_folder, GenerationManifest.filename)
+    with GenerationManifest(filename) as manifest:
+        for shard_manifest in shard_manifests:
+            manifest.merge(shard_manifest)
+    if remove_shard_manifests:
+        for shard_manifest in shard_manifests:
+            os.remove(shard_manifest)
+    return filename
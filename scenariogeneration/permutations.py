@@ -0,0 +1,839 @@
+"""
+scenariogeneration
+https://github.com/pyoscx/scenariogeneration
+
+This Source Code Form is subject to the terms of the Mozilla Public
+License, v. 2.0. If a copy of the MPL was not distributed with this
+file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+Copyright (c) 2022 The scenariogeneration Authors.
+
+"""
+
+import bisect
+import inspect
+import itertools
+import random
+import sys
+from collections.abc import Sequence
+from typing import Callable, Iterator, Optional, Union
+
+from scipy.stats import qmc
+
+from .covering_array import create_covering_array
+
+SAMPLING_METHODS = ["random", "latin_hypercube", "sobol", "halton"]
+
+# max number of prefixes whose permutations are counted, used to find a
+# permutation by index without enumerating all permutations
+_MAX_COUNTED_PREFIXES = 4096
+
+
+class _PermutationSequence(Sequence):
+    """_PermutationSequence is the common base of PermutationSpace and
+    PermutationSample, a lazy sequence of permutations where each
+    permutation is created from its raw index when needed.
+
+    Subclasses implement decode, and is_excluded/iter_indexed if some of
+    the raw indices can be excluded.
+
+    len() can not be used for more than sys.maxsize permutations (a
+    limitation of len), use size instead.
+
+    Parameters
+    ----------
+    raw_size : int
+        the number of permutations before excluded permutations are
+        removed
+
+    Attributes
+    ----------
+    raw_size : int
+        the number of permutations before excluded permutations are
+        removed
+
+    size : int
+        the number of (not excluded) permutations, counted the first time
+        it is used if there are exclusions
+    """
+
+    def __init__(self, raw_size: int):
+        """Initalizes the _PermutationSequence.
+
+        Parameters
+        ----------
+        raw_size : int
+            the number of permutations before excluded permutations are
+            removed
+        """
+        self.raw_size = raw_size
+        self._size = None if self.has_exclusions else raw_size
+
+    @property
+    def has_exclusions(self) -> bool:
+        """True if any permutations might be excluded."""
+        return False
+
+    def decode(self, raw_index: int) -> dict:
+        """decode creates the permutation of a raw index (the index before
+        excluded permutations are removed).
+
+        Parameters
+        ----------
+        raw_index : int
+            the index of the permutation
+
+        Returns
+        -------
+        dict
+            the permutation
+        """
+        raise NotImplementedError
+
+    def _check_raw_index(self, raw_index: int):
+        """Raises an IndexError if raw_index is out of range."""
+        if not 0 <= raw_index < self.raw_size:
+            raise IndexError(
+                "permutation index "
+                + str(raw_index)
+                + " out of range for "
+                + str(self.raw_size)
+                + " permutations"
+            )
+
+    def is_excluded(self, permutation: dict) -> bool:
+        """is_excluded checks if a permutation is one of the excluded
+        permutations.
+
+        Parameters
+        ----------
+        permutation : dict
+            the permutation to check
+
+        Returns
+        -------
+        bool
+            True if the permutation should be skipped
+        """
+        return False
+
+    def iter_indexed(self) -> Iterator[tuple[int, dict]]:
+        """iter_indexed iterates over all (not excluded) permutations,
+        together with their raw index.
+
+        Yields
+        ------
+        tuple[int, dict]
+            raw index, permutation
+        """
+        for raw_index in range(self.raw_size):
+            yield raw_index, self.decode(raw_index)
+
+    def iter_raw_range(
+        self, raw_start: int, raw_stop: int
+    ) -> Iterator[tuple[int, dict]]:
+        """iter_raw_range iterates over the (not excluded) permutations with
+        a raw index in the range raw_start to raw_stop.
+
+        Parameters
+        ----------
+        raw_start : int
+            first raw index
+
+        raw_stop : int
+            raw index after the last one
+
+        Yields
+        ------
+        tuple[int, dict]
+            raw index, permutation
+        """
+        for raw_index in range(raw_start, min(raw_stop, self.raw_size)):
+            permutation = self.decode(raw_index)
+            if self.has_exclusions and self.is_excluded(permutation):
+                continue
+            yield raw_index, permutation
+
+    def iter_positions(
+        self, start: int = 0, step: int = 1
+    ) -> Iterator[tuple[int, int, dict]]:
+        """iter_positions iterates over every step:th (not excluded)
+        permutation, beginning at position start.
+
+        Without excluded permutations only the wanted permutations are
+        created, otherwise all permutations have to be checked.
+
+        Parameters
+        ----------
+        start : int
+            position of the first permutation. Default: 0
+
+        step : int
+            distance between the positions. Default: 1
+
+        Yields
+        ------
+        tuple[int, int, dict]
+            position, raw index, permutation
+        """
+        if not self.has_exclusions:
+            for raw_index in range(start, self.raw_size, step):
+                yield raw_index, raw_index, self.decode(raw_index)
+            return
+        for position, (raw_index, permutation) in enumerate(
+            self.iter_indexed()
+        ):
+            if position >= start and (position - start) % step == 0:
+                yield position, raw_index, permutation
+
+    def __iter__(self) -> Iterator[dict]:
+        for _, permutation in self.iter_indexed():
+            yield permutation
+
+    @property
+    def size(self) -> int:
+        """The number of (not excluded) permutations."""
+        if self._size is None:
+            self._size = self._count()
+        return self._size
+
+    def _count(self) -> int:
+        """Counts the (not excluded) permutations."""
+        return sum(1 for _ in self.iter_indexed())
+
+    def _find(self, index: int) -> dict:
+        """Returns the permutation at a position (0 <= index < size) when
+        there are exclusions."""
+        for position, (_, permutation) in enumerate(self.iter_indexed()):
+            if position == index:
+                return permutation
+
+    def __len__(self) -> int:
+        if self.size > sys.maxsize:
+            raise OverflowError(
+                "len() is limited to sys.maxsize, use size for the "
+                + str(self.size)
+                + " permutations"
+            )
+        return self.size
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[dict, list]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self.size))]
+        if index < 0:
+            index += self.size
+        if not self.has_exclusions:
+            return self.decode(index)
+        if not 0 <= index < self.size:
+            raise IndexError("permutation index out of range")
+        return self._find(index)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Sequence) or isinstance(other, str):
+            return NotImplemented
+        if self.size != len(other):
+            return False
+        return all(a == b for a, b in zip(self, other))
+
+    def __repr__(self) -> str:
+        return (
+            self.__class__.__name__ + "(" + str(self.size) + " permutations)"
+        )
+
+
+class PermutationSpace(_PermutationSequence):
+    """PermutationSpace is a lazy view of all permutations that a
+    ScenarioGenerator will generate.
+
+    No permutation is created before it is asked for, instead each
+    permutation is decoded from its index (mixed-radix decoding over the
+    swept parameters), hence the memory usage is independent of the
+    number of permutations.
+
+    The ordering is identical to the ordering of the (previously used)
+    itertools.product over the parameters, i.e. the last parameter varies
+    fastest.
+
+    Parameters
+    ----------
+    parameters : dict[list] | list[dict]
+        the parameters of the ScenarioGenerator, either a dict of lists
+        (all permutations of the lists) or a list of dicts (one
+        permutation per dict)
+
+    expand_permutations : list[dict[list]], optional
+        only used if parameters is a list of dicts, each dict of lists is
+        expanded and combined with all the dicts of parameters.
+        Default: None
+
+    excluded_permutations : list[dict], optional
+        permutations that should be skipped. Default: None
+
+    exclusion_rules : list[dict | Callable], optional
+        rules for permutations that should be skipped, applied while the
+        permutations are enumerated so that all permutations below an
+        excluded combination are skipped without being created.
+            dict - a permutation is skipped if it contains all the keys
+                of the dict with the same values (partial match)
+            Callable - called with the parameters in its signature as
+                keyword arguments (or all parameters if it takes
+                **kwargs), a permutation is skipped if it returns True.
+                The parameters have to be in the permutations (ValueError
+                otherwise), and the rule is not used for permutations
+                without all of them.
+        Default: None
+
+    Attributes
+    ----------
+    raw_size : int
+        the number of permutations before excluded permutations are
+        removed
+    """
+
+    def __init__(
+        self,
+        parameters: Union[dict, list],
+        expand_permutations: Optional[list] = None,
+        excluded_permutations: Optional[list] = None,
+        exclusion_rules: Optional[list] = None,
+    ):
+        """Initalizes the PermutationSpace.
+
+        Parameters
+        ----------
+        parameters : dict[list] | list[dict]
+            the parameters of the ScenarioGenerator
+
+        expand_permutations : list[dict[list]], optional
+            dicts of lists to expand a list of dicts with.
+            Default: None
+
+        excluded_permutations : list[dict], optional
+            permutations that should be skipped. Default: None
+
+        exclusion_rules : list[dict | Callable], optional
+            rules for permutations that should be skipped. Default: None
+        """
+        # each dimension is a (key, values) pair, a key of None means
+        # that the values are dicts that should be merged in
+        self._dimensions = []
+        if isinstance(parameters, dict):
+            for key, values in parameters.items():
+                self._dimensions.append((key, list(values)))
+        else:
+            self._dimensions.append((None, parameters))
+            if expand_permutations:
+                for expansion in expand_permutations:
+                    for key, values in expansion.items():
+                        self._dimensions.append((key, list(values)))
+
+        self._radices = [len(values) for _, values in self._dimensions]
+        raw_size = 1
+        for radix in self._radices:
+            raw_size *= radix
+
+        self.excluded_permutations = (
+            list(excluded_permutations) if excluded_permutations else []
+        )
+        self.exclusion_rules = list(exclusion_rules) if exclusion_rules else []
+        self._create_exclusion_index()
+        self._prefix_depth = None
+        self._prefix_offsets = None
+        super().__init__(raw_size)
+
+    @property
+    def has_exclusions(self) -> bool:
+        """True if any permutations might be excluded."""
+        return bool(self.excluded_permutations or self.exclusion_rules)
+
+    def _create_exclusion_index(self):
+        """Sorts the exclusions by the stage (number of bound dimensions)
+        where they can first be checked, and creates hashed lookups for the
+        dict based exclusions.
+
+        A key is bound at the last dimension that sets it (expansions can
+        override keys of the base dicts).
+        """
+        number_of_stages = len(self._dimensions) + 1
+        key_stage = {}
+        for depth, (key, values) in enumerate(self._dimensions):
+            if key is None:
+                for base in values:
+                    for base_key in base:
+                        key_stage[base_key] = depth + 1
+            else:
+                key_stage[key] = depth + 1
+        leaf_stage = number_of_stages - 1
+        self._key_stage = key_stage
+
+        # per stage: {keys: (keys, [hashed values, unhashable values])}
+        self._partial_index = [{} for _ in range(number_of_stages)]
+        self._predicates = [[] for _ in range(number_of_stages)]
+        for rule in self.exclusion_rules:
+            if callable(rule):
+                keys = _get_keyword_parameters(rule)
+                if keys is None:
+                    stage = leaf_stage
+                else:
+                    unknown_keys = [
+                        key for key in keys if key not in key_stage
+                    ]
+                    if unknown_keys:
+                        raise ValueError(
+                            "exclusion rule "
+                            + getattr(rule, "__name__", repr(rule))
+                            + " uses parameters that are not in the "
+                            + "permutations: "
+                            + ", ".join(unknown_keys)
+                        )
+                    stage = max(
+                        [key_stage[key] for key in keys], default=leaf_stage
+                    )
+                self._predicates[stage].append((rule, keys))
+            elif all(key in key_stage for key in rule):
+                stage = max([key_stage[key] for key in rule], default=0)
+                _add_to_index(self._partial_index[stage], rule)
+            # a rule with a key that is never set can never match
+
+        # full-key exclusions: frozenset(keys) -> [hashed, unhashable]
+        self._full_index = {}
+        for excluded in self.excluded_permutations:
+            _add_to_index(self._full_index, excluded, frozenset(excluded))
+
+    def _is_rejected(self, stage: int, partial: dict) -> bool:
+        """Checks the exclusions of a stage on a (partial) permutation."""
+        for keys, values in self._partial_index[stage].values():
+            if all(key in partial for key in keys) and _in_index(
+                values, tuple(partial[key] for key in keys)
+            ):
+                return True
+        for predicate, keys in self._predicates[stage]:
+            if keys is None:
+                if predicate(**partial):
+                    return True
+            # a key can be missing in some of the dicts of a list of dicts
+            elif all(key in partial for key in keys) and predicate(
+                **{key: partial[key] for key in keys}
+            ):
+                return True
+        if stage == len(self._dimensions) and self._full_index:
+            full_key = frozenset(partial)
+            if full_key in self._full_index:
+                keys, values = self._full_index[full_key]
+                if _in_index(values, tuple(partial[key] for key in keys)):
+                    return True
+        return False
+
+    def decode(self, raw_index: int) -> dict:
+        """decode creates the permutation of a raw index (the index before
+        excluded permutations are removed).
+
+        Parameters
+        ----------
+        raw_index : int
+            the index of the permutation
+
+        Returns
+        -------
+        dict
+            the permutation
+        """
+        self._check_raw_index(raw_index)
+        digits = []
+        for radix in reversed(self._radices):
+            raw_index, digit = divmod(raw_index, radix)
+            digits.append(digit)
+        digits.reverse()
+        return self._create_permutation(digits)
+
+    def _create_permutation(self, digits: Sequence) -> dict:
+        """Creates the permutation from the index of each dimension."""
+        permutation = {}
+        for (key, values), digit in zip(self._dimensions, digits):
+            if key is None:
+                permutation.update(values[digit])
+            else:
+                permutation[key] = values[digit]
+        return permutation
+
+    def is_excluded(self, permutation: dict) -> bool:
+        """is_excluded checks if a permutation is one of the excluded
+        permutations.
+
+        Parameters
+        ----------
+        permutation : dict
+            the permutation to check
+
+        Returns
+        -------
+        bool
+            True if the permutation should be skipped
+        """
+        return any(
+            self._is_rejected(stage, permutation)
+            for stage in range(len(self._dimensions) + 1)
+        )
+
+    def iter_indexed(self) -> Iterator[tuple[int, dict]]:
+        """iter_indexed iterates over all (not excluded) permutations,
+        together with their raw index.
+
+        Yields
+        ------
+        tuple[int, dict]
+            raw index, permutation
+        """
+        if self.has_exclusions:
+            yield from self._iter_pruned(0, 0, {})
+            return
+        all_digits = itertools.product(
+            *[range(radix) for radix in self._radices]
+        )
+        for raw_index, digits in enumerate(all_digits):
+            yield raw_index, self._create_permutation(digits)
+
+    def _iter_pruned(
+        self, depth: int, raw_prefix: int, partial: dict
+    ) -> Iterator[tuple[int, dict]]:
+        """Depth first enumeration of the permutations, where a subtree is
+        skipped as soon as the bound dimensions are excluded."""
+        if self._is_rejected(depth, partial):
+            return
+        if depth == len(self._dimensions):
+            yield raw_prefix, partial
+            return
+        key, values = self._dimensions[depth]
+        radix = self._radices[depth]
+        for digit, value in enumerate(values):
+            child = partial.copy()
+            if key is None:
+                child.update(value)
+            else:
+                child[key] = value
+            yield from self._iter_pruned(
+                depth + 1, raw_prefix * radix + digit, child
+            )
+
+    def _count(self) -> int:
+        """Counts the (not excluded) permutations."""
+        if self.raw_size == 0:
+            return 0
+        return self._get_prefix_offsets()[-1]
+
+    def _get_prefix_offsets(self) -> list:
+        """Counts the (not excluded) permutations of each prefix (the first
+        dimensions) once, and returns the position of the first
+        permutation of each prefix (and the total count)."""
+        if self._prefix_offsets is None:
+            depth = 0
+            number_of_prefixes = 1
+            while (
+                depth < len(self._radices)
+                and number_of_prefixes * self._radices[depth]
+                <= _MAX_COUNTED_PREFIXES
+            ):
+                number_of_prefixes *= self._radices[depth]
+                depth += 1
+            prefix_raw_size = self.raw_size // number_of_prefixes
+            counts = [0] * number_of_prefixes
+            for raw_index, _ in self.iter_indexed():
+                counts[raw_index // prefix_raw_size] += 1
+            self._prefix_depth = depth
+            self._prefix_offsets = list(
+                itertools.accumulate(counts, initial=0)
+            )
+        return self._prefix_offsets
+
+    def _find(self, index: int) -> dict:
+        """Returns the permutation at a position (0 <= index < size) when
+        there are exclusions, only the permutations of its prefix are
+        enumerated."""
+        offsets = self._get_prefix_offsets()
+        prefix = bisect.bisect_right(offsets, index) - 1
+        digits = []
+        rest = prefix
+        for radix in reversed(self._radices[: self._prefix_depth]):
+            rest, digit = divmod(rest, radix)
+            digits.append(digit)
+        digits.reverse()
+        for position, (_, permutation) in enumerate(
+            self._iter_pruned(
+                self._prefix_depth, prefix, self._create_permutation(digits)
+            ),
+            offsets[prefix],
+        ):
+            if position == index:
+                return permutation
+
+    def sample(
+        self, count: int, method: str = "random", seed: Optional[int] = None
+    ) -> "PermutationSample":
+        """sample picks a subset of the permutations, without enumerating
+        all permutations.
+
+        The samples are drawn in the index space of each dimension and
+        decoded directly, excluded permutations are removed from the
+        sample (hence the sample can contain fewer than count
+        permutations, as can the quasi random methods if points fall on
+        the same permutation).
+
+        Parameters
+        ----------
+        count : int
+            number of permutations to sample
+
+        method : str
+            how to sample:
+                random - uniform random permutations (no duplicates)
+                latin_hypercube - Latin hypercube sampling, the values of
+                    each dimension are evenly covered
+                sobol - scrambled Sobol sequence (count should be a power
+                    of 2)
+                halton - scrambled Halton sequence
+            Default: random
+
+        seed : int, optional
+            seed of the sampling, the same seed gives the same sample.
+            Default: None
+
+        Returns
+        -------
+        PermutationSample
+            the sampled permutations
+        """
+        if method not in SAMPLING_METHODS:
+            raise ValueError(
+                "method can only be one of "
+                + ", ".join(SAMPLING_METHODS)
+                + ", not: "
+                + str(method)
+            )
+        if isinstance(count, bool) or not isinstance(count, int):
+            raise ValueError(
+                "the number of permutations to sample has to be an int, not: "
+                + str(count)
+            )
+        if self.raw_size == 0 or count <= 0:
+            raw_indices = []
+        elif not self._radices:
+            raw_indices = [0]
+        elif method == "random":
+            rng = random.Random(seed)
+            count = min(count, self.raw_size)
+            if self.raw_size <= sys.maxsize:
+                raw_indices = rng.sample(range(self.raw_size), count)
+            else:
+                # range can not be sampled beyond sys.maxsize, duplicates are
+                # rare since count is far below raw_size
+                raw_indices = set()
+                while len(raw_indices) < count:
+                    raw_indices.add(rng.randrange(self.raw_size))
+            raw_indices = sorted(raw_indices)
+        else:
+            dimensions = len(self._radices)
+            if method == "latin_hypercube":
+                engine = qmc.LatinHypercube(dimensions, seed=seed)
+            elif method == "sobol":
+                engine = qmc.Sobol(dimensions, scramble=True, seed=seed)
+            else:
+                engine = qmc.Halton(dimensions, scramble=True, seed=seed)
+            raw_indices = []
+            for point in engine.random(count):
+                raw_index = 0
+                for radix, value in zip(self._radices, point):
+                    raw_index = raw_index * radix + min(
+                        int(value * radix), radix - 1
+                    )
+                raw_indices.append(raw_index)
+            raw_indices = list(dict.fromkeys(raw_indices))
+        if self.has_exclusions:
+            raw_indices = [
+                raw_index
+                for raw_index in raw_indices
+                if not self.is_excluded(self.decode(raw_index))
+            ]
+        return PermutationSample(self, raw_indices)
+
+    def covering_array(
+        self, strength: int = 2, seed: Optional[int] = None
+    ) -> "PermutationSample":
+        """covering_array picks a subset of the permutations where every
+        combination of values of any strength dimensions is present at
+        least once (a t-wise covering array), eg. strength 2 covers all
+        pairs of parameter values.
+
+        Combinations that can only appear in excluded permutations are not
+        covered, and no excluded permutations are part of the subset.
+
+        Parameters
+        ----------
+        strength : int
+            the number of dimensions (t) whose combinations are covered,
+            default: 2
+
+        seed : int, optional
+            seed used for the values that are not needed for the coverage.
+            Default: None
+
+        Returns
+        -------
+        PermutationSample
+            the permutations of the covering array
+        """
+        is_allowed = None
+        if self.has_exclusions:
+            number_of_dimensions = len(self._dimensions)
+
+            def is_allowed(assignment: dict) -> bool:
+                if len(assignment) == number_of_dimensions:
+                    return not self.is_excluded(
+                        self._create_permutation(
+                            [
+                                assignment[depth]
+                                for depth in range(number_of_dimensions)
+                            ]
+                        )
+                    )
+                return not self._is_partially_rejected(assignment)
+
+        raw_indices = []
+        for digits in create_covering_array(
+            self._radices, strength, is_allowed, seed
+        ):
+            raw_index = 0
+            for radix, digit in zip(self._radices, digits):
+                raw_index = raw_index * radix + digit
+            raw_indices.append(raw_index)
+        return PermutationSample(self, sorted(set(raw_indices)))
+
+    def _is_partially_rejected(self, assignment: dict) -> bool:
+        """Checks the exclusion rules on some of the dimensions
+        ({depth: index of the value}), only keys that can not be changed
+        by the other dimensions are used."""
+        partial = {}
+        for depth in sorted(assignment):
+            key, values = self._dimensions[depth]
+            if key is None:
+                partial.update(values[assignment[depth]])
+            else:
+                partial[key] = values[assignment[depth]]
+        partial = {
+            key: value
+            for key, value in partial.items()
+            if self._key_stage[key] - 1 in assignment
+        }
+        for stage_index in self._partial_index:
+            for keys, values in stage_index.values():
+                if all(key in partial for key in keys) and _in_index(
+                    values, tuple(partial[key] for key in keys)
+                ):
+                    return True
+        for predicates in self._predicates:
+            for predicate, keys in predicates:
+                if (
+                    keys
+                    and all(key in partial for key in keys)
+                    and predicate(**{key: partial[key] for key in keys})
+                ):
+                    return True
+        return False
+
+
+class PermutationSample(_PermutationSequence):
+    """PermutationSample is a subset of the permutations of a
+    PermutationSpace (see PermutationSpace.sample), the raw indices of the
+    sample are 0 to len(sample) - 1.
+
+    The sample only refers to its space, it can not be sampled again
+    (sample from the PermutationSpace instead).
+
+    Parameters
+    ----------
+    space : PermutationSpace
+        the space the sample is taken from
+
+    raw_indices : list[int]
+        the raw indices (in space) of the sampled permutations
+
+    Attributes
+    ----------
+    raw_size : int
+        the number of sampled permutations
+    """
+
+    def __init__(self, space: PermutationSpace, raw_indices: list):
+        """Initalizes the PermutationSample.
+
+        Parameters
+        ----------
+        space : PermutationSpace
+            the space the sample is taken from
+
+        raw_indices : list[int]
+            the raw indices (in space) of the sampled permutations
+        """
+        self.space = space
+        self.raw_indices = list(raw_indices)
+        super().__init__(len(self.raw_indices))
+
+    def decode(self, raw_index: int) -> dict:
+        """decode creates the permutation of a sample index.
+
+        Parameters
+        ----------
+        raw_index : int
+            the index of the permutation in the sample
+
+        Returns
+        -------
+        dict
+            the permutation
+        """
+        self._check_raw_index(raw_index)
+        return self.space.decode(self.raw_indices[raw_index])
+
+
+def _get_keyword_parameters(function: Callable) -> Optional[list]:
+    """Returns the names of the parameters of a function, None if it takes
+    **kwargs."""
+    parameters = inspect.signature(function).parameters.values()
+    if any(p.kind == inspect.Parameter.VAR_KEYWORD for p in parameters):
+        return None
+    return [
+        p.name
+        for p in parameters
+        if p.kind
+        in (
+            inspect.Parameter.POSITIONAL_OR_KEYWORD,
+            inspect.Parameter.KEYWORD_ONLY,
+        )
+    ]
+
+
+def _add_to_index(index: dict, rule: dict, index_key=None):
+    """Adds the values of a dict rule to an index (the keys of the rule are
+    used as index key if no index_key is given)."""
+    keys = tuple(sorted(rule, key=repr))
+    if index_key is None:
+        index_key = keys
+    if index_key not in index:
+        index[index_key] = (keys, [set(), []])
+    keys, (hashed, unhashable) = index[index_key]
+    values = tuple(rule[key] for key in keys)
+    try:
+        hashed.add(values)
+    except TypeError:
+        unhashable.append(values)
+
+
+def _in_index(index_values: list, values: tuple) -> bool:
+    """Checks if values are in the [hashed, unhashable] values of an
+    index."""
+    hashed, unhashable = index_values
+    try:
+        if values in hashed:
+            return True
+    except TypeError:
+        pass
+    return any(values == other for other in unhashable)
@@ -10,18 +10,44 @@ Copyright (c) 2022 The scenariogeneration Authors.
 
 """
 
+import hashlib
+import inspect
 import itertools
 import os
 import sys
+import threading
+import time
+import warnings
+from collections import OrderedDict, deque
 from multiprocessing import Pool
-from typing import Optional, Union
+from multiprocessing.pool import ThreadPool
+from typing import Iterator, Optional, Union
 
 import numpy as np
+from lxml import etree
 
 from scenariogeneration.xodr import OpenDrive
 from scenariogeneration.xosc import Scenario
 
-from .helpers import printToFile
+from .archive import ArchiveWriter, element_to_bytes
+from .content_store import ContentStore
+from .generation_queue import GenerationQueue
+from .helpers import (
+    COMPRESSED_EXTENSION,
+    compress_bytes,
+    get_deterministic_timestamp,
+    get_element_factory,
+    get_library_hash,
+    printToFile,
+    set_deterministic_timestamp,
+    set_element_factory,
+)
+from .manifest import (
+    GenerationManifest,
+    hash_file,
+    hash_parameters,
+)
+from .permutations import PermutationSpace
 
 
 class _GenerationStruct:
@@ -31,6 +57,20 @@ class _GenerationStruct:
         self.prettyprint = prettyprint
         self.encoding = encoding
 
+    def __getstate__(self):
+        # lxml elements can not be pickled, they are sent as (unindented)
+        # bytes to the writing processes and parsed back there
+        state = self.__dict__.copy()
+        if isinstance(self.data, etree._Element):
+            state["data"] = etree.tostring(self.data)
+            state["lxml"] = True
+        return state
+
+    def __setstate__(self, state):
+        if state.pop("lxml", False):
+            state["data"] = etree.fromstring(state["data"])
+        self.__dict__.update(state)
+
 
 def _write_xml_file(data_struct):
     printToFile(
@@ -41,6 +81,125 @@ def _write_xml_file(data_struct):
     )
 
 
+class _WritingPipeline:
+    """_WritingPipeline writes _GenerationStructs in a pool of processes (or
+    threads) while new ones are being built.
+
+    At most depth structs are waiting or being written at the same time,
+    if the pool is full put will block until a write is done, hence the
+    memory usage is bounded and the writing overlaps the building.
+
+    Parameters
+    ----------
+    workers : int
+        number of processes/threads that write files
+
+    depth : int
+        max number of files waiting to be written
+
+    backend : str
+        "process" or "thread"
+    """
+
+    def __init__(self, workers: int, depth: int, backend: str = "process"):
+        if backend == "process":
+            self._pool = Pool(workers)
+        elif backend == "thread":
+            self._pool = ThreadPool(workers)
+        else:
+            raise ValueError(
+                'writing_backend can only be "process" or "thread", not: '
+                + str(backend)
+            )
+        self._slots = threading.BoundedSemaphore(max(1, depth))
+        self._errors = []
+
+    def _done(self, _):
+        self._slots.release()
+
+    def _failed(self, error):
+        self._errors.append(error)
+        self._slots.release()
+
+    def _raise_errors(self):
+        if self._errors:
+            raise self._errors[0]
+
+    def put(self, data_struct: _GenerationStruct):
+        """put adds a file to be written, blocks if the pipeline is full.
+
+        Parameters
+        ----------
+        data_struct : _GenerationStruct
+            the file to write
+        """
+        self._slots.acquire()
+        self._raise_errors()
+        self._pool.apply_async(
+            _write_xml_file,
+            (data_struct,),
+            callback=self._done,
+            error_callback=self._failed,
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self._pool.close()
+            self._pool.join()
+        self._pool.terminate()
+        if exc_type is None:
+            self._raise_errors()
+
+
+_worker_generator = None
+
+
+def _init_generation_worker(generator, element_factory):
+    """Initializer of the processes used for parallel generation, stores the
+    generator in the worker and makes it write its files directly."""
+    global _worker_generator
+    set_element_factory(element_factory)
+    _worker_generator = generator
+    _worker_generator.number_of_parallel_writings = 1
+    if _worker_generator._creation_timestamp is not None:
+        set_deterministic_timestamp(_worker_generator._creation_timestamp)
+    if _worker_generator.use_content_store:
+        _worker_generator._content_store = ContentStore(
+            _worker_generator._generation_folder
+        )
+
+
+def _generate_in_worker(task):
+    """Builds and writes the road/scenario of one permutation in a worker
+    process, only the resulting file paths are sent back."""
+    raw_index, scenario_name, up_to_date_files = task
+    if up_to_date_files is not None:
+        return up_to_date_files + (None,)
+    permutation = _worker_generator.all_permutations.decode(raw_index)
+    scenario_file, road_file, _ = (
+        _worker_generator._generate_road_and_scenario(
+            permutation, scenario_name
+        )
+    )
+    entry = None
+    if _worker_generator.use_manifest:
+        entry = _worker_generator._create_manifest_entry(
+            scenario_name,
+            hash_parameters(permutation),
+            scenario_file,
+            road_file,
+        )
+    return scenario_file, road_file, entry
+
+
+def _generate_chunk_in_worker(tasks):
+    """Runs _generate_in_worker for a chunk of tasks."""
+    return [_generate_in_worker(task) for task in tasks]
+
+
 class ScenarioGenerator:
     """ScenarioTemplate is a class that should be inherited by a Scenario class
     in order to generate xodr and xosc files based on the submodules xodr and
@@ -71,9 +230,105 @@ class ScenarioGenerator:
     generate_all_roads : bool
         will only generate unique roads
 
+    use_manifest : bool
+        keep a manifest (GenerationManifest) in the generation folder, and
+        skip permutations that have already been generated with the same
+        parameters and generator (source code and settings) and whose
+        files still exist, default: False
+
+    queue_chunk_size : int
+        number of permutations claimed at a time when generating with a
+        work queue, default: 100
+
+    queue_lease_time : float
+        seconds a chunk claimed from a work queue is reserved for a
+        worker before other workers can claim it, default: 600
+
+    queue_poll_interval : float
+        seconds to wait before checking the work queue again when all
+        remaining chunks are claimed by other workers, default: 5
+
+    archive_format : str
+        write the generated files into archives ("tar" or "zip", see
+        ArchiveWriter) in the generation folder instead of separate files,
+        the returned paths are the paths the files get when all archives
+        are extracted into the generation folder. Default: None (no
+        archives)
+
+    archive_compression : str
+        compression of the archives, None, "gzip", "bzip2" or "lzma",
+        default: None
+
+    archive_compression_level : int
+        compression level of the archives, default: None
+
+    archive_max_size : int
+        size in bytes after which a new archive is started, a scenario and
+        its road are always put in the same archive, default: None (one
+        archive)
+
+    deterministic : bool
+        generate byte identical files for identical inputs, the creation
+        dates in the headers (and in archives) are pinned to
+        SOURCE_DATE_EPOCH (environment variable) if set, else to
+        1970-01-01 (see helpers.set_deterministic_timestamp),
+        default: False
+
+    use_content_store : bool
+        hash the content of each generated file and write each unique
+        content only once into a ContentStore in the generation folder, the
+        files are created as hardlinks to the stored content (also
+        between runs). The creation dates are pinned as if deterministic
+        was set, so that identical content of different runs is stored
+        once. The files should then not be modified in place.
+        Default: False
+
+    compress_files : bool
+        gzip compress the generated files while they are written, they are
+        named .xosc.gz and .xodr.gz (can be read by xosc.ParseOpenScenario),
+        can not be combined with archive_format (use archive_compression
+        instead), default: False
+
+    fan_out_levels : int
+        number of levels of subfolders (named by a hash of the scenario
+        name) the files are spread over in the xosc and xodr folders, eg.
+        xosc/3f/a2/name.xosc for 2 levels, default: 0 (no subfolders)
+
+    fan_out_width : int
+        number of hex characters of the hash in each subfolder name,
+        default: 2 (256 subfolders per level)
+
+    road_parameters : list[str]
+        the parameters the road method depends on, only these are passed to
+        road, and with generate_all_roads = False the road is built once
+        per distinct set of these parameters. If None, they are taken from
+        the signature of road, unless road takes **kwargs. Default: None
+
+    road_cache_size : int
+        max number of distinct roads remembered for reuse (None means no
+        limit), default: 128
+
     number_of_parallel_writings : int
         parallelize the writing of the xml files, default: 1
 
+    number_of_parallel_generations : int
+        parallelize the whole generation (building, serializing and
+        writing) of the permutations over this many processes, each
+        process gets the indices of the permutations to generate and
+        returns only the file paths. The generator has to be picklable,
+        and unique roads (generate_all_roads = False) are only detected
+        within each process. Overrides number_of_parallel_writings,
+        default: 1
+
+    writing_queue_depth : int
+        max number of built files waiting to be written when
+        number_of_parallel_writings != 1, default: None
+        (4 * number_of_parallel_writings)
+
+    writing_backend : str
+        "process" or "thread", what the parallel writings are run in,
+        default: "process"
+
     basename : str
         basename of the scenariofiles, default: name of file
 
@@ -83,6 +338,33 @@ class ScenarioGenerator:
     excluded_permutations : list[dict]
         list of parameter dicts to exclude from generation
 
+    exclusion_rules : list[dict | Callable]
+        rules to exclude permutations, checked as soon as the parameters
+        they need are set while the permutations are enumerated
+            dict - excludes all permutations containing these values
+                (the dict can contain only some of the parameters)
+            Callable - called with the parameters in its signature as
+                keyword arguments, excludes the permutation if True (all
+                the parameters have to be in the permutations)
+
+    sampling_method : str
+        generate only a sample of the permutations, can be "random",
+        "latin_hypercube", "sobol" or "halton" (see PermutationSpace.sample),
+        or "covering_array" (see PermutationSpace.covering_array),
+        default: None (all permutations)
+
+    sample_count : int
+        number of permutations to sample, required if sampling_method is
+        not "covering_array", default: None
+
+    sampling_seed : int
+        seed of the sampling, default: None
+
+    covering_array_strength : int
+        the strength (t) of the covering array if sampling_method is
+        "covering_array", all combinations of values of any t parameters
+        are generated, default: 2
+
     expand_permutations : list[dict[list]]
         list of dicts where each dict has lists as values, all combinations
         of these lists will be expanded and combined with the other
@@ -101,8 +383,38 @@ class ScenarioGenerator:
 
         self.generate_all_roads = True
         self._created_roads = {}
+        self._road_fingerprints = {}
+        self.road_parameters = None
+        self.use_manifest = False
+        self._manifest = None
+        self._generator_hash = ""
+        self._shard = (0, 1)
+        self._previous_manifest = None
+        self.queue_chunk_size = 100
+        self.queue_lease_time = 600.0
+        self.queue_poll_interval = 5.0
+        self._work_queue = None
+        self.deterministic = False
+        self._creation_timestamp = None
+        self.use_content_store = False
+        self._content_store = None
+        self.compress_files = False
+        self.fan_out_levels = 0
+        self.fan_out_width = 2
+        self._created_folders = set()
+        self.archive_format = None
+        self.archive_compression = None
+        self.archive_compression_level = None
+        self.archive_max_size = None
+        self._archive = None
+        self.road_cache_size = 128
+        self._used_road_parameters = None
+        self._road_cache = OrderedDict()
         self._name_separator = "_"
         self.number_of_parallel_writings = 1
+        self.number_of_parallel_generations = 1
+        self.writing_queue_depth = None
+        self.writing_backend = "process"
         self._prettyprint = True
         self.basename = os.path.basename(
             sys.modules[self.__class__.__module__].__file__
@@ -111,7 +423,21 @@ class ScenarioGenerator:
         self.all_permutations = None
         self.write_relative_road_path = None
         self.excluded_permutations = []
+        self.exclusion_rules = []
         self.expand_permutations = []
+        self.sampling_method = None
+        self.sample_count = None
+        self.sampling_seed = None
+        self.covering_array_strength = 2
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_manifest"] = None
+        state["_previous_manifest"] = None
+        state["_work_queue"] = None
+        state["_archive"] = None
+        state["_content_store"] = None
+        return state
 
     def road(self, **kwargs) -> Optional[OpenDrive]:
         """Dummy method for generating an OpenDRIVE road.
@@ -143,7 +469,9 @@ class ScenarioGenerator:
         """Method to reset the counter if numerical naming is used."""
         self._it = 0
 
-    def _create_folder_structure(self, generation_folder: str):
+    def _create_folder_structure(
+        self, generation_folder: str, create_subfolders: bool = True
+    ):
         """Method to create a folder structure (if needed) to generate the
         scenarios and roads in.
 
@@ -151,12 +479,19 @@ class ScenarioGenerator:
         ----------
         generation_folder : str
             the path to a folder where the files should be generated
+
+        create_subfolders : bool
+            create the xosc and xodr folders, default: True
         """
         xosc_folder = os.path.join(generation_folder, "xosc")
         xodr_folder = os.path.join(generation_folder, "xodr")
 
+        self._created_folders = set()
         if not os.path.exists(generation_folder):
             os.mkdir(generation_folder)
+        if not create_subfolders:
+            self._generation_folder = generation_folder
+            return
         if not os.path.exists(xosc_folder):
             os.mkdir(xosc_folder)
         if not os.path.exists(xodr_folder):
@@ -189,47 +524,36 @@ class ScenarioGenerator:
 
     def _handle_input_parameters(self):
         """_handle_input_parameters takes care of different types of parameters
-        inputs, such as list of dicts or a dict of lists."""
-
-        def expand_dict_of_lists(d):
-            keys = d.keys()
-            values = d.values()
-            return [
-                dict(zip(keys, combo)) for combo in itertools.product(*values)
-            ]
-
-        def combine(base_dicts, variants):
-            permutations = []
-            for base in base_dicts:
-                for variant in variants:
-                    permutations.append({**base, **variant})
-            return permutations
+        inputs, such as list of dicts or a dict of lists.
 
+        The permutations are not created here, all_permutations is a lazy
+        PermutationSpace that creates each permutation when needed.
+        """
         if isinstance(self.parameters, dict):
             self._create_permutations()
-
-        elif isinstance(self.parameters, list):
-            self.all_permutations = self.parameters
-            if self.expand_permutations:
-                for d in self.expand_permutations:
-                    expanded = expand_dict_of_lists(d)
-                    self.all_permutations = combine(
-                        self.all_permutations, expanded
-                    )
-
-        if self.excluded_permutations:
-            self.all_permutations = [
-                p
-                for p in self.all_permutations
-                if not any(
-                    set(ex.keys()) == set(p.keys())
-                    and all(p[k] == ex[k] for k in ex)
-                    for ex in self.excluded_permutations
+        else:
+            self.all_permutations = PermutationSpace(
+                self.parameters,
+                expand_permutations=self.expand_permutations,
+                excluded_permutations=self.excluded_permutations,
+                exclusion_rules=self.exclusion_rules,
+            )
+        if self.sampling_method == "covering_array":
+            self.all_permutations = self.all_permutations.covering_array(
+                self.covering_array_strength, self.sampling_seed
+            )
+        elif self.sampling_method is not None:
+            if self.sample_count is None:
+                raise ValueError(
+                    "sample_count has to be set when sampling_method is "
+                    + str(self.sampling_method)
                 )
-            ]
+            self.all_permutations = self.all_permutations.sample(
+                self.sample_count, self.sampling_method, self.sampling_seed
+            )
 
     def _generate_road_and_scenario(
-        self, permutation: dict
+        self, permutation: dict, scenario_name: Optional[str] = None
     ) -> tuple[str, str, list[_GenerationStruct]]:
         """_generate_road_and_scenario takes a permutation and generates the
         road/scenario (if specified)
@@ -239,71 +563,250 @@ class ScenarioGenerator:
         permutation : dict
             the parameter dict of the wanted scenario
 
+        scenario_name : str, optional
+            name of the scenario, if not given it is created from the
+            permutation. Default: None
+
         Returns
         -------
         tuple[str,str]
             open_scenario_file, open_drive_file
         """
-        scenario_name = self._get_scenario_name(permutation)
+        if scenario_name is None:
+            scenario_name = self._get_scenario_name(permutation)
         self.road_file = ""
         scenario_file = ""
         files_to_write = []
-        road = self.road(**permutation)
+        cache_key = self._get_road_cache_key(permutation)
+        if cache_key is not None and cache_key in self._road_cache:
+            self._road_cache.move_to_end(cache_key)
+            self.road_file = self._road_cache[cache_key]
+        else:
+            self._generate_road(permutation, scenario_name, files_to_write)
+            if cache_key is not None:
+                self._road_cache[cache_key] = self.road_file
+                if (
+                    self.road_cache_size is not None
+                    and len(self._road_cache) > self.road_cache_size
+                ):
+                    self._road_cache.popitem(last=False)
+
+        sce = self.scenario(**permutation)
+        if sce:
+            scenario_file = self._get_output_file("xosc", scenario_name)
+            self._write_file(sce, scenario_file, files_to_write)
+        return scenario_file, self.road_file, files_to_write
+
+    def _get_output_file(self, kind: str, name: str) -> str:
+        """_get_output_file creates the path of a generated file, in the
+        fan out subfolders (created if needed) if fan_out_levels is set.
+
+        Parameters
+        ----------
+        kind : str
+            "xosc" or "xodr"
+
+        name : str
+            name of the scenario
+
+        Returns
+        -------
+        str
+            path to the file
+        """
+        folder = os.path.join(self._generation_folder, kind)
+        if self.fan_out_levels:
+            name_hash = hashlib.sha256(name.encode()).hexdigest()
+            folder = os.path.join(
+                folder,
+                *[
+                    name_hash[
+                        level
+                        * self.fan_out_width : (level + 1)
+                        * self.fan_out_width
+                    ]
+                    for level in range(self.fan_out_levels)
+                ],
+            )
+            if self._archive is None and folder not in self._created_folders:
+                os.makedirs(folder, exist_ok=True)
+                self._created_folders.add(folder)
+        if self.compress_files:
+            return os.path.join(
+                folder, name + "." + kind + COMPRESSED_EXTENSION
+            )
+        return os.path.join(folder, name + "." + kind)
+
+    def _get_relative_road_prefix(self) -> str:
+        """Returns the path from the folder of a scenario to the generation
+        folder."""
+        return os.path.join(*[os.path.pardir] * (self.fan_out_levels + 1))
+
+    def _write_file(
+        self,
+        generated: Union[Scenario, OpenDrive],
+        filename: str,
+        files_to_write: list[_GenerationStruct],
+    ):
+        """_write_file writes a built scenario/road (through the content
+        store if used), or adds it to files_to_write if it is written in
+        parallel or into an archive.
+
+        Parameters
+        ----------
+        generated : xosc.Scenario | xodr.OpenDrive
+            the scenario/road to write
+
+        filename : str
+            path to the file
+
+        files_to_write : list[_GenerationStruct]
+            list to add the file to if it is not written here
+        """
+        if self._content_store is not None:
+            data = element_to_bytes(
+                generated.get_element(), self._prettyprint, self.encoding
+            )
+            if self.compress_files:
+                data = compress_bytes(data)
+            self._content_store.link(data, filename)
+        elif self.number_of_parallel_writings == 1 and self._archive is None:
+            generated.write_xml(filename, prettyprint=self._prettyprint)
+        else:
+            files_to_write.append(
+                _GenerationStruct(
+                    generated.get_element(),
+                    filename,
+                    self._prettyprint,
+                    self.encoding,
+                )
+            )
+
+    def _write_to_archive(self, files_to_write: list[_GenerationStruct]):
+        """Serializes the files and adds them to the archive, with their
+        paths relative to the generation folder.
+
+        Parameters
+        ----------
+        files_to_write : list[_GenerationStruct]
+            the files to write
+        """
+        self._archive.add(
+            {
+                os.path.relpath(
+                    data_struct.filename, self._generation_folder
+                ).replace(os.sep, "/"): element_to_bytes(
+                    data_struct.data,
+                    data_struct.prettyprint,
+                    data_struct.encoding,
+                )
+                for data_struct in files_to_write
+            }
+        )
+
+    def _generate_road(
+        self,
+        permutation: dict,
+        scenario_name: str,
+        files_to_write: list[_GenerationStruct],
+    ):
+        """_generate_road builds the road of a permutation and writes it (or
+        adds it to files_to_write), self.road_file is set to the resulting
+        road file.
+
+        Parameters
+        ----------
+        permutation : dict
+            the parameter dict of the wanted scenario
+
+        scenario_name : str
+            name of the scenario
+
+        files_to_write : list[_GenerationStruct]
+            list to add the road to if it should be written in parallel
+        """
+        road = self.road(**self._get_road_kwargs(permutation))
         if road:
             new_unique_road = True
             if not self.generate_all_roads:
-                for previous_road in self._created_roads:
+                fingerprint = road.get_fingerprint()
+                for previous_road in self._road_fingerprints.get(
+                    fingerprint, []
+                ):
                     if self._created_roads[previous_road] == road:
                         self.road_file = previous_road
                         new_unique_road = False
+                        break
 
             if new_unique_road:
                 self.road_file = os.path.abspath(
-                    os.path.join(
-                        self._generation_folder,
-                        "xodr",
-                        scenario_name + ".xodr",
-                    )
+                    self._get_output_file("xodr", scenario_name)
                 )
-                if self.number_of_parallel_writings == 1:
-                    road.write_xml(
-                        self.road_file, prettyprint=self._prettyprint
-                    )
-                else:
-                    files_to_write.append(
-                        _GenerationStruct(
-                            road.get_element(),
-                            self.road_file,
-                            self._prettyprint,
-                            self.encoding,
-                        )
-                    )
+                self._write_file(road, self.road_file, files_to_write)
 
                 if self.write_relative_road_path:
                     self.road_file = self.road_file.replace(
                         os.path.abspath(self._generation_folder),
-                        os.path.pardir,
+                        self._get_relative_road_prefix(),
                     )
 
-                self._created_roads[self.road_file] = road
+                if not self.generate_all_roads:
+                    self._created_roads[self.road_file] = road
+                    self._road_fingerprints.setdefault(fingerprint, []).append(
+                        self.road_file
+                    )
 
-        sce = self.scenario(**permutation)
-        if sce:
-            scenario_file = os.path.join(
-                self._generation_folder, "xosc", scenario_name + ".xosc"
+    def _resolve_road_parameters(self):
+        """_resolve_road_parameters finds what parameters the road method
+        uses, either from road_parameters or from the signature of road
+        (if it does not take **kwargs), and resets the road cache."""
+        self._road_cache = OrderedDict()
+        self._used_road_parameters = None
+        if self.road_parameters is not None:
+            self._used_road_parameters = list(self.road_parameters)
+            return
+        signature = inspect.signature(self.road)
+        if any(
+            parameter.kind == inspect.Parameter.VAR_KEYWORD
+            for parameter in signature.parameters.values()
+        ):
+            return
+        self._used_road_parameters = [
+            name
+            for name, parameter in signature.parameters.items()
+            if parameter.kind
+            in (
+                inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                inspect.Parameter.KEYWORD_ONLY,
             )
-            if self.number_of_parallel_writings == 1:
-                sce.write_xml(scenario_file, prettyprint=self._prettyprint)
-            else:
-                files_to_write.append(
-                    _GenerationStruct(
-                        sce.get_element(),
-                        scenario_file,
-                        self._prettyprint,
-                        self.encoding,
-                    )
-                )
-        return scenario_file, self.road_file, files_to_write
+        ]
+
+    def _get_road_kwargs(self, permutation: dict) -> dict:
+        """Returns the part of the permutation that should be passed to the
+        road method."""
+        if self._used_road_parameters is None:
+            return permutation
+        return {
+            key: permutation[key]
+            for key in self._used_road_parameters
+            if key in permutation
+        }
+
+    def _get_road_cache_key(self, permutation: dict) -> Optional[tuple]:
+        """Returns the key of the road cache for a permutation, or None if
+        every permutation should get its own road (generate_all_roads) or
+        it is not known what parameters the road depends on."""
+        if self.generate_all_roads or self._used_road_parameters is None:
+            return None
+        key = []
+        for name in self._used_road_parameters:
+            value = permutation.get(name)
+            try:
+                hash(value)
+            except TypeError:
+                value = repr(value)
+            key.append((name, value))
+        return tuple(key)
 
     def _get_scenario_name(self, permutation: dict) -> str:
         """_get_scenario_name generates the name of the wanted file, based on
@@ -406,23 +909,28 @@ class ScenarioGenerator:
         if override_parameters:
             self.parameters = override_parameters
         self._handle_input_parameters()
+        self._resolve_road_parameters()
 
         if isinstance(order, str):
             if order == "first":
                 it = 0
             elif order == "middle":
-                it = int(np.floor(len(self.all_permutations) / 2))
+                it = self.all_permutations.size // 2
             elif order == "random":
                 it = int(
-                    np.floor(np.random.rand() * len(self.all_permutations))
+                    np.floor(np.random.rand() * self.all_permutations.size)
                 )
         else:
             it = order
             self._it = it
         self.number_of_parallel_writings = 1
-        osc, odr, _ = self._generate_road_and_scenario(
-            self.all_permutations[it]
-        )
+        previous_timestamp = self._pin_creation_timestamp()
+        try:
+            osc, odr, _ = self._generate_road_and_scenario(
+                self.all_permutations[it]
+            )
+        finally:
+            self._unpin_creation_timestamp(previous_timestamp)
         self._reset_name_counter()
         return osc, odr
 
@@ -433,6 +941,9 @@ class ScenarioGenerator:
         write_relative_road_path: bool = True,
         name_separator: Optional[str] = None,
         prettyprint: bool = True,
+        shard_index: int = 0,
+        shard_count: int = 1,
+        work_queue: Union[bool, str] = False,
     ):
         """Generate uses the xosc.Scenario defined in the method scenario and
         the xodr.OpenDrive (optional) in the road method together with the
@@ -459,7 +970,61 @@ class ScenarioGenerator:
         prettyprint : bool
             determins if the prettify funciton should be used while
             writing to xml (will take longer time). Default: True
+
+        shard_index : int
+            the index of the shard to generate (0 to shard_count - 1), the
+            shard contains every shard_count:th permutation starting at
+            shard_index. The names of the files are the same as if all
+            permutations were generated. Default: 0
+
+        shard_count : int
+            the number of shards the permutations are split into, eg. one
+            per node. If a manifest is used each shard will have its own
+            manifest, that can be merged with merge_shard_manifests.
+            Default: 1
+
+        work_queue : bool | str
+            generate from a work queue (GenerationQueue) in the generation
+            folder, any number of processes (on any number of nodes sharing
+            the generation folder) can run generate with the same folder and
+            will claim chunks (queue_chunk_size) of permutations until all
+            are generated. Each process generates serially, so start more
+            processes to use more cores. If a manifest is used each worker
+            will have its own manifest, that can be merged with
+            merge_shard_manifests. A finished queue is restarted when the
+            generator or the parameters change, a string names the run, so
+            the same permutations can be generated again by a run with a
+            new name. Default: False
         """
+        if not 0 <= shard_index < shard_count:
+            raise ValueError(
+                "shard_index has to be between 0 and shard_count - 1, not "
+                + str(shard_index)
+            )
+        if self.archive_format is not None and (
+            self.number_of_parallel_generations != 1
+            or self.number_of_parallel_writings != 1
+            or self.use_manifest
+            or self.use_content_store
+            or self.compress_files
+        ):
+            raise ValueError(
+                "archive_format can not be combined with parallel "
+                "generations/writings, use_manifest, use_content_store or "
+                "compress_files."
+            )
+        if work_queue and (
+            shard_count != 1
+            or self.number_of_parallel_generations != 1
+            or self.number_of_parallel_writings != 1
+            or self.naming == "parameter_no_lists"
+        ):
+            raise ValueError(
+                "work_queue can not be combined with shards, parallel "
+                "generations/writings or parameter_no_lists naming, start "
+                "more processes instead."
+            )
+        self._shard = (shard_index, shard_count)
         self._prettyprint = prettyprint
         if name_separator:
             self._name_separator = name_separator
@@ -467,38 +1032,529 @@ class ScenarioGenerator:
         self.write_relative_road_path = write_relative_road_path
         scenario_files = []
         road_files = []
-        self._create_folder_structure(generation_folder)
+        self._create_folder_structure(
+            generation_folder, self.archive_format is None
+        )
         if override_parameters:
             self.parameters = override_parameters
         self._handle_input_parameters()
-        files_to_write = []
-        for p in self.all_permutations:
-            (
-                scenario_file,
-                road_file,
-                writables,
-            ) = self._generate_road_and_scenario(p)
-            scenario_files.append(scenario_file)
-            road_files.append(road_file)
-            files_to_write.extend(writables)
-
-        if self.number_of_parallel_writings != 1:
-            with Pool(self.number_of_parallel_writings) as p:
-                p.map(_write_xml_file, files_to_write)
+        self._resolve_road_parameters()
+        if work_queue:
+            self._work_queue = GenerationQueue(
+                os.path.join(generation_folder, GenerationQueue.filename),
+                self._create_queue_chunks(),
+                self.queue_lease_time,
+                generation_key=hashlib.sha256(
+                    (
+                        self._get_generator_hash()
+                        + repr(self.parameters)
+                        + repr(work_queue)
+                    ).encode()
+                ).hexdigest(),
+            )
+            if self._work_queue.is_done():
+                warnings.warn(
+                    "The work queue in "
+                    + str(generation_folder)
+                    + " is already finished, nothing is generated. Use "
+                    "another run name (work_queue) to generate again."
+                )
+        self._open_manifest()
+        previous_timestamp = self._pin_creation_timestamp()
+        self._open_archive()
+        if self.use_content_store:
+            self._content_store = ContentStore(generation_folder)
+        try:
+            if self.number_of_parallel_generations != 1:
+                self._generate_in_parallel(scenario_files, road_files)
+            elif self.number_of_parallel_writings != 1:
+                self._generate_pipelined(scenario_files, road_files)
+            else:
+                for _, scenario_name, p in self._iter_named_permutations():
+                    files = self._get_up_to_date_files(scenario_name, p)
+                    if files is None:
+                        (
+                            scenario_file,
+                            road_file,
+                            writables,
+                        ) = self._generate_road_and_scenario(p, scenario_name)
+                        if self._archive is not None:
+                            self._write_to_archive(writables)
+                        self._record_in_manifest(
+                            scenario_name, p, scenario_file, road_file
+                        )
+                    else:
+                        scenario_file, road_file = files
+                    scenario_files.append(scenario_file)
+                    road_files.append(road_file)
+        finally:
+            self._close_manifest()
+            if self._archive is not None:
+                self._archive.close()
+                self._archive = None
+            self._content_store = None
+            self._unpin_creation_timestamp(previous_timestamp)
+            if self._work_queue is not None:
+                self._work_queue.close()
+                self._work_queue = None
         self._reset_name_counter()
         return scenario_files, road_files
 
+    def _create_queue_chunks(self) -> list[tuple[int, int, int]]:
+        """_create_queue_chunks splits the raw indices of the permutations
+        into chunks for a GenerationQueue.
+
+        Returns
+        -------
+        list[tuple[int, int, int]]
+            raw_start, raw_stop, first_position of each chunk
+        """
+        raw_size = self.all_permutations.raw_size
+        chunk_size = max(1, self.queue_chunk_size)
+        starts = list(range(0, raw_size, chunk_size))
+        if not self.all_permutations.has_exclusions:
+            positions = starts
+        else:
+            counts = [0] * len(starts)
+            for raw_index, _ in self.all_permutations.iter_indexed():
+                counts[raw_index // chunk_size] += 1
+            positions = [0]
+            for count in counts[:-1]:
+                positions.append(positions[-1] + count)
+        return [
+            (start, min(start + chunk_size, raw_size), position)
+            for start, position in zip(starts, positions)
+        ]
+
+    def _iter_queued_permutations(self) -> Iterator[tuple[int, str, dict]]:
+        """_iter_queued_permutations claims chunks from the work queue and
+        iterates over their permutations, until all chunks are done.
+
+        A chunk is marked as done when all its permutations have been
+        generated, if the lease of the chunk is lost (claimed by another
+        worker) the rest of the chunk is left to that worker.
+
+        Yields
+        ------
+        tuple[int, str, dict]
+            raw index, scenario name, permutation
+        """
+        while not self._work_queue.is_done():
+            chunk = self._work_queue.claim()
+            if chunk is None:
+                # the remaining chunks are claimed by other workers, wait
+                # for them to be done (or for their leases to expire)
+                time.sleep(self.queue_poll_interval)
+                continue
+            chunk_id, raw_start, raw_stop, position = chunk
+            for raw_index, permutation in self.all_permutations.iter_raw_range(
+                raw_start, raw_stop
+            ):
+                self._it = position
+                yield raw_index, self._get_scenario_name(
+                    permutation
+                ), permutation
+                position += 1
+                if not self._work_queue.is_claimed(chunk_id):
+                    # the lease was lost, another worker generates the rest
+                    break
+            self._work_queue.complete(chunk_id)
+
+    def _iter_named_permutations(self) -> Iterator[tuple[int, str, dict]]:
+        """_iter_named_permutations iterates over the permutations of the
+        current shard, together with their names.
+
+        The names are the same as in a generation without shards, since
+        numerical naming uses the position of the permutation among all
+        permutations.
+
+        Yields
+        ------
+        tuple[int, str, dict]
+            raw index, scenario name, permutation
+        """
+        if self._work_queue is not None:
+            yield from self._iter_queued_permutations()
+            return
+        shard_index, shard_count = self._shard
+        if self.naming == "parameter_no_lists":
+            # the name counter depends on all previous permutations
+            for position, (raw_index, permutation) in enumerate(
+                self.all_permutations.iter_indexed()
+            ):
+                scenario_name = self._get_scenario_name(permutation)
+                if position % shard_count == shard_index:
+                    yield raw_index, scenario_name, permutation
+            return
+        for (
+            position,
+            raw_index,
+            permutation,
+        ) in self.all_permutations.iter_positions(shard_index, shard_count):
+            self._it = position
+            yield raw_index, self._get_scenario_name(permutation), permutation
+
+    def _generate_pipelined(self, scenario_files: list, road_files: list):
+        """_generate_pipelined builds the roads/scenarios and hands them over
+        to a _WritingPipeline, so the writing is done while the next
+        permutations are built.
+
+        Parameters
+        ----------
+        scenario_files : list
+            list to add the generated scenario files to
+
+        road_files : list
+            list to add the generated road files to
+        """
+        depth = self.writing_queue_depth
+        if depth is None:
+            depth = 4 * (self.number_of_parallel_writings or os.cpu_count())
+        # manifest entries can only be created when the files are written
+        unrecorded = []
+        with _WritingPipeline(
+            self.number_of_parallel_writings, depth, self.writing_backend
+        ) as pipeline:
+            for _, scenario_name, p in self._iter_named_permutations():
+                files = self._get_up_to_date_files(scenario_name, p)
+                if files is None:
+                    (
+                        scenario_file,
+                        road_file,
+                        writables,
+                    ) = self._generate_road_and_scenario(p, scenario_name)
+                    for writable in writables:
+                        pipeline.put(writable)
+                    if self._manifest is not None:
+                        unrecorded.append(
+                            (
+                                scenario_name,
+                                hash_parameters(p),
+                                scenario_file,
+                                road_file,
+                            )
+                        )
+                else:
+                    scenario_file, road_file = files
+                scenario_files.append(scenario_file)
+                road_files.append(road_file)
+        for (
+            scenario_name,
+            parameters_hash,
+            scenario_file,
+            road_file,
+        ) in unrecorded:
+            self._manifest.record(
+                self._create_manifest_entry(
+                    scenario_name, parameters_hash, scenario_file, road_file
+                )
+            )
+
+    def _generate_in_parallel(self, scenario_files: list, road_files: list):
+        """_generate_in_parallel distributes the permutations over
+        number_of_parallel_generations processes, where each process builds
+        and writes the road/scenario.
+
+        The names are created (to keep numerical naming identical to a
+        serial generation) and the manifest is checked here, so only the
+        index and the name of each permutation are sent to the processes.
+        The tasks are sent in chunks, and at most two chunks per process
+        are waiting at the same time, hence the permutations are created
+        as the results come back.
+
+        Parameters
+        ----------
+        scenario_files : list
+            list to add the generated scenario files to
+
+        road_files : list
+            list to add the generated road files to
+        """
+
+        def create_tasks():
+            for (
+                raw_index,
+                scenario_name,
+                permutation,
+            ) in self._iter_named_permutations():
+                yield (
+                    raw_index,
+                    scenario_name,
+                    self._get_up_to_date_files(scenario_name, permutation),
+                )
+
+        chunksize = max(
+            1,
+            min(
+                64,
+                self.all_permutations.raw_size
+                // (4 * self.number_of_parallel_generations),
+            ),
+        )
+        max_pending = 2 * self.number_of_parallel_generations
+        tasks = create_tasks()
+        pending = deque()
+        with Pool(
+            self.number_of_parallel_generations,
+            initializer=_init_generation_worker,
+            initargs=(self, get_element_factory()),
+        ) as pool:
+            while True:
+                chunk = list(itertools.islice(tasks, chunksize))
+                if chunk:
+                    pending.append(
+                        pool.apply_async(_generate_chunk_in_worker, (chunk,))
+                    )
+                if not pending:
+                    break
+                if chunk and len(pending) < max_pending:
+                    continue
+                # the results are collected in order
+                for scenario_file, road_file, entry in pending.popleft().get():
+                    scenario_files.append(scenario_file)
+                    road_files.append(road_file)
+                    if entry is not None:
+                        self._manifest.record(entry)
+
+    def _get_generator_hash(self) -> str:
+        """Returns the hash of the generator, covering the source code of
+        the module where the generator is defined, the settings affecting
+        the outputs, and the version of scenariogeneration."""
+        module = sys.modules[self.__class__.__module__]
+        try:
+            source = inspect.getsource(module)
+        except (OSError, TypeError):
+            source = repr(self.__class__)
+        settings = repr(
+            (
+                self._prettyprint,
+                self.encoding,
+                self.write_relative_road_path,
+                self.fan_out_levels,
+                self.fan_out_width,
+                self.deterministic,
+                self.compress_files,
+            )
+        )
+        return hashlib.sha256(
+            (source + settings + get_library_hash()).encode()
+        ).hexdigest()
+
+    def _open_manifest(self):
+        """Opens the manifest of the generation folder (if use_manifest is
+        set) and creates the hash of the generator.
+
+        The generator hash covers the source code of the module where the
+        generator is defined, the settings affecting the outputs, and the
+        version of scenariogeneration.
+        """
+        if not self.use_manifest:
+            return
+        self._generator_hash = self._get_generator_hash()
+        filename = GenerationManifest.filename
+        if self._work_queue is not None:
+            filename = GenerationManifest.worker_filename(
+                self._work_queue.worker_id
+            )
+        elif self._shard[1] != 1:
+            filename = GenerationManifest.shard_filename(*self._shard)
+        previous_filename = os.path.join(
+            self._generation_folder, GenerationManifest.filename
+        )
+        if filename != GenerationManifest.filename and os.path.isfile(
+            previous_filename
+        ):
+            # merged manifest of a previous sharded/queued generation
+            self._previous_manifest = GenerationManifest(previous_filename)
+        self._manifest = GenerationManifest(
+            os.path.join(self._generation_folder, filename)
+        )
+
+    def _pin_creation_timestamp(self) -> Optional[int]:
+        """Pins the creation timestamp of the generated files (to
+        SOURCE_DATE_EPOCH or 1970-01-01) if deterministic or
+        use_content_store is set.
+
+        Returns
+        -------
+        int | None
+            the previously pinned timestamp, to restore after the
+            generation (with _unpin_creation_timestamp)
+        """
+        self._creation_timestamp = None
+        if not self.deterministic and not self.use_content_store:
+            return None
+        # with a content store, the same content of two runs shares a blob
+        self._creation_timestamp = get_deterministic_timestamp() or 0
+        return set_deterministic_timestamp(self._creation_timestamp)
+
+    def _unpin_creation_timestamp(self, previous_timestamp: Optional[int]):
+        """Restores the pinned timestamp from before the generation."""
+        if self._creation_timestamp is not None:
+            set_deterministic_timestamp(previous_timestamp)
+            self._creation_timestamp = None
+
+    def _open_archive(self):
+        """Opens the ArchiveWriter (if archive_format is set), shards and
+        workers of a work queue write their own archives."""
+        if self.archive_format is None:
+            return
+        basename = self.basename
+        if self._work_queue is not None:
+            basename += "_worker_" + self._work_queue.worker_id
+        elif self._shard[1] != 1:
+            basename += (
+                "_shard_" + str(self._shard[0]) + "_of_" + str(self._shard[1])
+            )
+        self._archive = ArchiveWriter(
+            self._generation_folder,
+            basename,
+            self.archive_format,
+            self.archive_compression,
+            self.archive_compression_level,
+            self.archive_max_size,
+        )
+
+    def _close_manifest(self):
+        """Closes the manifests (if open)."""
+        if self._manifest is not None:
+            self._manifest.close()
+            self._manifest = None
+        if self._previous_manifest is not None:
+            self._previous_manifest.close()
+            self._previous_manifest = None
+
+    def _get_up_to_date_files(
+        self, scenario_name: str, permutation: dict
+    ) -> Optional[tuple[str, str]]:
+        """_get_up_to_date_files checks the manifest if a permutation is
+        already generated and up to date.
+
+        Parameters
+        ----------
+        scenario_name : str
+            name of the scenario
+
+        permutation : dict
+            the permutation
+
+        Returns
+        -------
+        tuple[str, str] | None
+            scenario_file, road_file if up to date, else None
+        """
+        if self._manifest is None:
+            return None
+        parameters_hash = hash_parameters(permutation)
+        entry = None
+        for manifest in [self._manifest, self._previous_manifest]:
+            if manifest is not None and entry is None:
+                entry = manifest.is_up_to_date(
+                    scenario_name,
+                    parameters_hash,
+                    self._generator_hash,
+                    self._generation_folder,
+                )
+        if entry is None:
+            return None
+        scenario_file = ""
+        if entry["scenario_file"]:
+            scenario_file = os.path.join(
+                self._generation_folder, entry["scenario_file"]
+            )
+        road_file = ""
+        if entry["road_file"]:
+            if self.write_relative_road_path:
+                road_file = os.path.join(
+                    self._get_relative_road_prefix(), entry["road_file"]
+                )
+            else:
+                road_file = os.path.abspath(
+                    os.path.join(self._generation_folder, entry["road_file"])
+                )
+        return scenario_file, road_file
+
+    def _record_in_manifest(
+        self,
+        scenario_name: str,
+        permutation: dict,
+        scenario_file: str,
+        road_file: str,
+    ):
+        """Adds a generated permutation to the manifest (if open)."""
+        if self._manifest is not None:
+            self._manifest.record(
+                self._create_manifest_entry(
+                    scenario_name,
+                    hash_parameters(permutation),
+                    scenario_file,
+                    road_file,
+                )
+            )
+
+    def _create_manifest_entry(
+        self,
+        scenario_name: str,
+        parameters_hash: str,
+        scenario_file: str,
+        road_file: str,
+    ) -> dict:
+        """_create_manifest_entry creates the manifest entry of a generated
+        permutation, the files have to be written.
+
+        Parameters
+        ----------
+        scenario_name : str
+            name of the scenario
+
+        parameters_hash : str
+            hash of the permutation
+
+        scenario_file : str
+            the scenario file (as returned by generate)
+
+        road_file : str
+            the road file (as returned by generate)
+
+        Returns
+        -------
+        dict
+            the manifest entry
+        """
+        if road_file and self.write_relative_road_path:
+            road_file = os.path.join(
+                self._generation_folder,
+                road_file[len(self._get_relative_road_prefix()) + 1 :],
+            )
+        entry = {
+            "name": scenario_name,
+            "parameters_hash": parameters_hash,
+            "generator_hash": self._generator_hash,
+        }
+        for kind, filename in [
+            ("scenario", scenario_file),
+            ("road", road_file),
+        ]:
+            if filename:
+                entry[kind + "_file"] = os.path.relpath(
+                    filename, self._generation_folder
+                )
+                stat = os.stat(filename)
+                entry[kind + "_hash"] = hash_file(filename)
+                entry[kind + "_size"] = stat.st_size
+                entry[kind + "_mtime_ns"] = stat.st_mtime_ns
+            else:
+                entry[kind + "_file"] = ""
+                entry[kind + "_hash"] = ""
+                entry[kind + "_size"] = 0
+                entry[kind + "_mtime_ns"] = 0
+        return entry
+
     def _create_permutations(self):
-        """Generates all permutations of the defined parameters."""
-        parameterlist = []
-        for key in self.parameters:
-            parameterlist.append(self.parameters[key])
-
-        available_permutations = list(itertools.product(*parameterlist))
-        self.all_permutations = []
-        keys = list(self.parameters.keys())
-        for p in available_permutations:
-            inputdict = {}
-            for i in range(len(self.parameters)):
-                inputdict[keys[i]] = p[i]
-            self.all_permutations.append(inputdict)
+        """Creates a lazy view of all permutations of the defined
+        parameters."""
+        self.all_permutations = PermutationSpace(
+            self.parameters,
+            excluded_permutations=self.excluded_permutations,
+            exclusion_rules=self.exclusion_rules,
+        )
@@ -16,6 +16,7 @@ from warnings import warn
 
 import numpy as np
 
+from ..helpers import Element
 from .enumerations import ContactPoint, ElementType
 from .utils import XodrBase
 
@@ -86,7 +87,7 @@ class ElevationProfile(XodrBase):
         xml.etree.ElementTree.Element
             The elevationProfile element.
         """
-        element = ET.Element("elevationProfile")
+        element = Element("elevationProfile")
         self._add_additional_data_to_element(element)
         for i in self.elevations:
             element.append(i.get_element("elevation"))
@@ -201,7 +202,7 @@ class LateralProfile(XodrBase):
         xml.etree.ElementTree.Element
             The lateralProfile element.
         """
-        element = ET.Element("lateralProfile")
+        element = Element("lateralProfile")
         self._add_additional_data_to_element(element)
         for i in self.superelevations:
             element.append(i.get_element("superelevation"))
@@ -383,7 +384,7 @@ class _Poly3Profile:
                 "When shape is not used, the t value should not be set."
             )
 
-        element = ET.Element(elementname, attrib=self.get_attributes())
+        element = Element(elementname, attrib=self.get_attributes())
         return element
 
 
@@ -17,12 +17,13 @@ import numpy as np
 import pyclothoids as pcloth
 from scipy.integrate import quad
 
+from ..helpers import Element, StreamElement
 from .exceptions import (
     MixOfGeometryAddition,
     NotEnoughInputArguments,
     ToManyOptionalArguments,
 )
-from .utils import XodrBase
+from .utils import XodrBase, _get_attributes_fingerprint
 
 
 def wrap_pi(angle):
@@ -210,6 +211,28 @@ class PlanView(XodrBase):
 
         return False
 
+    def get_fingerprint(self) -> int:
+        """Return a structural fingerprint of the PlanView, based on the
+        adjusted geometries.
+
+        Returns
+        -------
+        int
+            The fingerprint of the PlanView.
+        """
+        if not self.adjusted:
+            return hash(("PlanView", super().get_fingerprint()))
+        return hash(
+            (
+                "PlanView",
+                super().get_fingerprint(),
+                tuple(
+                    _get_attributes_fingerprint(geom.get_attributes())
+                    for geom in self._adjusted_geometries
+                ),
+            )
+        )
+
     def add_geometry(
         self, geom: _BaseGeometry, heading: Optional[float] = None
     ) -> "PlanView":
@@ -495,12 +518,24 @@ class PlanView(XodrBase):
         xml.etree.ElementTree.Element
             The ElementTree representation of the PlanView.
         """
+        return self.iter_xml().to_element()
 
-        element = ET.Element("planView")
-        self._add_additional_data_to_element(element)
-        for geom in self._adjusted_geometries:
-            element.append(geom.get_element())
-        return element
+    def iter_xml(self) -> StreamElement:
+        """Return the PlanView as a StreamElement, producing the geometries
+        lazily.
+
+        Returns
+        -------
+        StreamElement
+            The streamable representation of the PlanView.
+        """
+
+        def children():
+            yield from self._iter_additional_data()
+            for geom in self._adjusted_geometries:
+                yield geom.get_element()
+
+        return StreamElement("planView", children=children())
 
 
 class _Geometry(XodrBase):
@@ -693,7 +728,7 @@ class _Geometry(XodrBase):
         xml.etree.ElementTree.Element
             The ElementTree representation of the `_Geometry`.
         """
-        element = ET.Element("geometry", attrib=self.get_attributes())
+        element = Element("geometry", attrib=self.get_attributes())
         self._add_additional_data_to_element(element)
         element.append(self.geom_type.get_element())
         return element
@@ -818,7 +853,7 @@ class Line(_BaseGeometry):
         xml.etree.ElementTree.Element
             The ElementTree representation of the `Line`.
         """
-        element = ET.Element("line")
+        element = Element("line")
         self._add_additional_data_to_element(element)
         return element
 
@@ -1043,7 +1078,7 @@ class Arc(_BaseGeometry):
         xml.etree.ElementTree.Element
             The ElementTree representation of the `Arc`.
         """
-        element = ET.Element("arc", attrib=self.get_attributes())
+        element = Element("arc", attrib=self.get_attributes())
         self._add_additional_data_to_element(element)
         return element
 
@@ -1341,7 +1376,7 @@ class ParamPoly3(_BaseGeometry):
         xml.etree.ElementTree.Element
             The ElementTree representation of the `ParamPoly3`.
         """
-        element = ET.Element("paramPoly3", attrib=self.get_attributes())
+        element = Element("paramPoly3", attrib=self.get_attributes())
         self._add_additional_data_to_element(element)
         return element
 
@@ -1544,6 +1579,6 @@ class Spiral(_BaseGeometry):
         xml.etree.ElementTree.Element
             The ElementTree representation of the `Spiral`.
         """
-        element = ET.Element("spiral", attrib=self.get_attributes())
+        element = Element("spiral", attrib=self.get_attributes())
         self._add_additional_data_to_element(element)
         return element
@@ -15,7 +15,7 @@ from typing import Optional, Union
 
 import numpy as np
 
-from ..helpers import enum2str
+from ..helpers import Element, StreamElement, SubElement, enum2str
 from .enumerations import (
     ContactPoint,
     LaneChange,
@@ -28,7 +28,7 @@ from .enumerations import (
 )
 from .exceptions import ToManyOptionalArguments
 from .links import LaneLinker, _Link, _Links
-from .utils import XodrBase
+from .utils import XodrBase, _get_attributes_fingerprint
 
 
 class Lanes(XodrBase):
@@ -97,6 +97,36 @@ class Lanes(XodrBase):
                 return True
         return False
 
+    def get_fingerprint(self) -> int:
+        """Return a structural fingerprint of the Lanes, based on the lane
+        offsets and the lane sections.
+
+        Returns
+        -------
+        int
+            The fingerprint of the Lanes.
+        """
+        return hash(
+            (
+                "Lanes",
+                super().get_fingerprint(),
+                tuple(
+                    _get_attributes_fingerprint(laneoffset.get_attributes())
+                    for laneoffset in self.laneoffsets
+                ),
+                tuple(
+                    (
+                        _get_attributes_fingerprint(
+                            lanesection.get_attributes()
+                        ),
+                        len(lanesection.leftlanes),
+                        len(lanesection.rightlanes),
+                    )
+                    for lanesection in self.lanesections
+                ),
+            )
+        )
+
     def add_lanesection(
         self,
         lanesection: "LaneSection",
@@ -825,13 +855,26 @@ class Lanes(XodrBase):
         ET.Element
             The XML ElementTree representation of the `Lanes` object.
         """
-        element = ET.Element("lanes")
-        self._add_additional_data_to_element(element)
-        for l in self.laneoffsets:
-            element.append(l.get_element())
-        for l in self.lanesections:
-            element.append(l.get_element())
-        return element
+        return self.iter_xml().to_element()
+
+    def iter_xml(self) -> StreamElement:
+        """Returns the `Lanes` object as a StreamElement, producing the lane
+        sections lazily.
+
+        Returns
+        -------
+        StreamElement
+            The streamable representation of the `Lanes` object.
+        """
+
+        def children():
+            yield from self._iter_additional_data()
+            for l in self.laneoffsets:
+                yield l.get_element()
+            for l in self.lanesections:
+                yield l.get_element()
+
+        return StreamElement("lanes", children=children())
 
 
 class LaneOffset(XodrBase):
@@ -944,7 +987,7 @@ class LaneOffset(XodrBase):
         ET.Element
             The XML ElementTree representation of the `LaneOffset`.
         """
-        element = ET.Element("laneOffset", attrib=self.get_attributes())
+        element = Element("laneOffset", attrib=self.get_attributes())
         self._add_additional_data_to_element(element)
         return element
 
@@ -1092,18 +1135,18 @@ class LaneSection(XodrBase):
         ET.Element
             The XML ElementTree representation of the `LaneSection`.
         """
-        element = ET.Element("laneSection", attrib=self.get_attributes())
+        element = Element("laneSection", attrib=self.get_attributes())
         self._add_additional_data_to_element(element)
         if self.leftlanes:
-            left = ET.SubElement(element, "left")
+            left = SubElement(element, "left")
             for l in reversed(self.leftlanes):
                 left.append(l.get_element())
 
-        center = ET.SubElement(element, "center")
+        center = SubElement(element, "center")
         center.append(self.centerlane.get_element())
 
         if self.rightlanes:
-            right = ET.SubElement(element, "right")
+            right = SubElement(element, "right")
             for l in self.rightlanes:
                 right.append(l.get_element())
 
@@ -1556,29 +1599,29 @@ class Lane(XodrBase):
         ET.Element
             The XML ElementTree representation of the lane.
         """
-        element = ET.Element("lane", attrib=self.get_attributes())
+        element = Element("lane", attrib=self.get_attributes())
         self._add_additional_data_to_element(element)
         # according to standard if lane is centerlane it should
         # not have a width record and omit the link record
         if self.lane_id != 0:
             element.append(self.links.get_element())
             for w in sorted(self.widths, key=lambda x: x.soffset):
-                ET.SubElement(element, "width", attrib=w.get_attributes())
+                SubElement(element, "width", attrib=w.get_attributes())
         # use polynomial dict for laneOffset in case of center lane (only if values provided)
         # removed, should not be here..
         # elif any([self.a,self.b,self.c,self.d]):
         #     polynomialdict['s'] = polynomialdict.pop('sOffset')
-        #     ET.SubElement(element,'laneOffset',attrib=polynomialdict)
+        #     SubElement(element,'laneOffset',attrib=polynomialdict)
 
         if self.roadmark:
             for r in sorted(self.roadmark, key=lambda x: x.soffset):
                 element.append(r.get_element())
 
         for height in self.heights:
-            ET.SubElement(element, "height", attrib=height)
+            SubElement(element, "height", attrib=height)
 
         for material in sorted(self.materials, key=lambda x: x["sOffset"]):
-            ET.SubElement(element, "material", attrib=material)
+            SubElement(element, "material", attrib=material)
 
         return element
 
@@ -1839,7 +1882,7 @@ class RoadMark(XodrBase):
         ET.Element
             The XML ElementTree representation of the `RoadMark`.
         """
-        element = ET.Element("roadMark", attrib=self.get_attributes())
+        element = Element("roadMark", attrib=self.get_attributes())
         self._add_additional_data_to_element(element)
         if self._line:
             attribs = {"name": enum2str(self.marking_type)}
@@ -1859,7 +1902,7 @@ class RoadMark(XodrBase):
                         ]
                     )
                 )
-            typeelement = ET.SubElement(
+            typeelement = SubElement(
                 element,
                 "type",
                 attrib=attribs,
@@ -1867,7 +1910,7 @@ class RoadMark(XodrBase):
             for l in self._line:
                 typeelement.append(l.get_element())
         if self._explicit_line:
-            typeelement = ET.SubElement(
+            typeelement = SubElement(
                 element,
                 "explicit",
             )
@@ -2107,7 +2150,7 @@ class RoadLine(XodrBase):
             The XML ElementTree representation of the `RoadLine`.
         """
         """Returns the elementTree of the RoadLine."""
-        element = ET.Element("line", attrib=self.get_attributes())
+        element = Element("line", attrib=self.get_attributes())
         self._add_additional_data_to_element(element)
         return element
 
@@ -2213,6 +2256,6 @@ class ExplicitRoadLine(XodrBase):
         ET.Element
             The XML ElementTree representation of the `ExplicitRoadLine`.
         """
-        element = ET.Element("line", attrib=self.get_attributes())
+        element = Element("line", attrib=self.get_attributes())
         self._add_additional_data_to_element(element)
         return element
@@ -16,7 +16,7 @@ from typing import Optional
 
 import numpy as np
 
-from ..helpers import enum2str
+from ..helpers import Element, SubElement, enum2str
 from .enumerations import (
     ContactPoint,
     Direction,
@@ -215,7 +215,7 @@ class _Links(XodrBase):
         ET.Element
             The XML ElementTree representation of the `_Links` object.
         """
-        element = ET.Element("link")
+        element = Element("link")
         self._add_additional_data_to_element(element)
         # sort links alphabetically by link type to ensure predecessor
         # appears before successor to comply to schema
@@ -340,7 +340,7 @@ class _Link(XodrBase):
         ET.Element
             The XML ElementTree representation of the `_Link`.
         """
-        element = ET.Element(self.link_type, attrib=self.get_attributes())
+        element = Element(self.link_type, attrib=self.get_attributes())
         self._add_additional_data_to_element(element)
         return element
 
@@ -596,12 +596,12 @@ class Connection(XodrBase):
             The XML ElementTree representation of the connection.
         """
 
-        element = ET.Element(
+        element = Element(
             "connection", attrib=self.get_attributes(junctiontype)
         )
         self._add_additional_data_to_element(element)
         for l in sorted(self.links, key=lambda x: x[0], reverse=True):
-            ET.SubElement(
+            SubElement(
                 element,
                 "laneLink",
                 attrib={"from": str(l[0]), "to": str(l[1])},
@@ -786,7 +786,7 @@ class Junction(XodrBase):
         ET.Element
             The XML ElementTree representation of the junction.
         """
-        element = ET.Element("junction", attrib=self.get_attributes())
+        element = Element("junction", attrib=self.get_attributes())
         self._add_additional_data_to_element(element)
         for con in self.connections:
             element.append(con.get_element(self.junction_type))
@@ -1450,10 +1450,10 @@ class JunctionGroup(XodrBase):
         ET.Element
             The XML ElementTree representation of the JunctionGroup.
         """
-        element = ET.Element("junctionGroup", attrib=self.get_attributes())
+        element = Element("junctionGroup", attrib=self.get_attributes())
         self._add_additional_data_to_element(element)
         for j in self.junctions:
-            ET.SubElement(
+            SubElement(
                 element, "junctionReference", attrib={"junction": str(j)}
             )
         return element
@@ -11,7 +11,6 @@ Copyright (c) 2022 The scenariogeneration Authors.
 """
 
 import copy as cpy
-import datetime as dt
 import xml.etree.ElementTree as ET
 from itertools import combinations
 from typing import Optional, Union
@@ -20,7 +19,15 @@ from warnings import warn
 import numpy as np
 import pyclothoids as pcloth
 
-from ..helpers import enum2str, printToFile
+from ..helpers import (
+    Element,
+    StreamElement,
+    SubElement,
+    enum2str,
+    get_creation_date,
+    printToFile,
+    write_stream,
+)
 from .elevation import (
     ElevationCalculator,
     ElevationProfile,
@@ -48,7 +55,11 @@ from .lane import Lanes
 from .lane_def import LaneDef, create_lanes_merge_split, std_roadmark_solid
 from .links import Junction, _Link, _Links, create_lane_links
 from .signals_objects import Object, Signal, SignalReference, Tunnel
-from .utils import XodrBase, get_lane_sec_and_s_for_lane_calc
+from .utils import (
+    XodrBase,
+    _get_attributes_fingerprint,
+    get_lane_sec_and_s_for_lane_calc,
+)
 
 
 class _Header:
@@ -132,7 +143,7 @@ class _Header:
         retdict["name"] = self.name
         retdict["revMajor"] = str(self.revMajor)
         retdict["revMinor"] = str(self.revMinor)
-        retdict["date"] = str(dt.datetime.now())
+        retdict["date"] = str(get_creation_date())
         retdict["north"] = "0.0"
         retdict["south"] = "0.0"
         retdict["east"] = "0.0"
@@ -147,10 +158,10 @@ class _Header:
         ET.Element
             The XML ElementTree representation of the FileHeader.
         """
-        element = ET.Element("header", attrib=self.get_attributes())
+        element = Element("header", attrib=self.get_attributes())
 
         if self.geo_reference is not None:
-            geo_reference_element = ET.SubElement(element, "geoReference")
+            geo_reference_element = SubElement(element, "geoReference")
             geo_reference_element.text = self.geo_reference
 
         return element
@@ -328,6 +339,27 @@ class Road(XodrBase):
                 return True
         return False
 
+    def get_fingerprint(self) -> int:
+        """Return a structural fingerprint of the Road, based on its
+        attributes, PlanView and Lanes.
+
+        Returns
+        -------
+        int
+            The fingerprint of the Road.
+        """
+        return hash(
+            (
+                "Road",
+                super().get_fingerprint(),
+                _get_attributes_fingerprint(self.get_attributes()),
+                self.planview.get_fingerprint(),
+                self.lanes.get_fingerprint(),
+                len(self.objects),
+                len(self.signals),
+            )
+        )
+
     def is_adjusted(self, domain: str = "planview") -> bool:
         """Check if the road has been properly defined in the specified
         domain.
@@ -939,25 +971,43 @@ class Road(XodrBase):
         ET.Element
             The XML ElementTree representation of the road.
         """
-        element = ET.Element("road", attrib=self.get_attributes())
-        self._add_additional_data_to_element(element)
-        element.append(self.links.get_element())
-        if self.types:
-            for r in self.types:
-                element.append(r.get_element())
-        element.append(self.planview.get_element())
-        element.append(self.elevationprofile.get_element())
-        element.append(self.lateralprofile.get_element())
-        element.append(self.lanes.get_element())
-        if len(self.objects) > 0:
-            objectselement = ET.SubElement(element, "objects")
-            for road_object in self.objects:
-                objectselement.append(road_object.get_element())
-        if len(self.signals) > 0:
-            signalselement = ET.SubElement(element, "signals")
-            for signal in self.signals:
-                signalselement.append(signal.get_element())
-        return element
+        return self.iter_xml().to_element()
+
+    def iter_xml(self) -> StreamElement:
+        """Return the road as a StreamElement, producing the planview,
+        lanes, objects and signals lazily.
+
+        Returns
+        -------
+        StreamElement
+            The streamable representation of the road.
+        """
+
+        def children():
+            yield from self._iter_additional_data()
+            yield self.links.get_element()
+            if self.types:
+                for r in self.types:
+                    yield r.get_element()
+            yield self.planview.iter_xml()
+            yield self.elevationprofile.get_element()
+            yield self.lateralprofile.get_element()
+            yield self.lanes.iter_xml()
+            if len(self.objects) > 0:
+                yield StreamElement(
+                    "objects",
+                    children=(
+                        road_object.get_element()
+                        for road_object in self.objects
+                    ),
+                )
+            if len(self.signals) > 0:
+                yield StreamElement(
+                    "signals",
+                    children=(signal.get_element() for signal in self.signals),
+                )
+
+        return StreamElement("road", self.get_attributes(), children())
 
 
 class OpenDrive(XodrBase):
@@ -1051,6 +1101,31 @@ class OpenDrive(XodrBase):
                 return True
         return False
 
+    def get_fingerprint(self) -> int:
+        """Return a structural fingerprint of the OpenDrive, based on the
+        header name and all roads.
+
+        Equal OpenDrives always have the same fingerprint, hence it can be
+        used for fast lookup of previously created roads.
+
+        Returns
+        -------
+        int
+            The fingerprint of the OpenDrive.
+        """
+        return hash(
+            (
+                "OpenDrive",
+                super().get_fingerprint(),
+                self._header.name,
+                frozenset(
+                    (str(road_id), road.get_fingerprint())
+                    for road_id, road in self.roads.items()
+                ),
+                len(self.junctions),
+            )
+        )
+
     def add_road(self, road: Road) -> "OpenDrive":
         """Add a new road to the OpenDrive.
 
@@ -2694,16 +2769,49 @@ class OpenDrive(XodrBase):
         ET.Element
             The XML ElementTree representation of the OpenDrive.
         """
-        element = ET.Element("OpenDRIVE")
-        self._add_additional_data_to_element(element)
-        element.append(self._header.get_element())
-        for r in self.roads:
-            element.append(self.roads[r].get_element())
+        return self.iter_xml().to_element()
 
-        for j in self.junctions:
-            element.append(j.get_element())
+    def iter_xml(self) -> StreamElement:
+        """Return the OpenDrive as a StreamElement, producing each road and
+        junction when it is written.
 
-        return element
+        Returns
+        -------
+        StreamElement
+            The streamable representation of the OpenDrive.
+        """
+
+        def children():
+            yield from self._iter_additional_data()
+            yield self._header.get_element()
+            for r in self.roads:
+                yield self.roads[r].iter_xml()
+
+            for j in self.junctions:
+                yield j.get_element()
+
+        return StreamElement("OpenDRIVE", children=children())
+
+    def write_stream(
+        self, file_handle, prettyprint: bool = True, encoding: str = "utf-8"
+    ) -> None:
+        """Write the OpenDRIVE XML to a (binary) file handle, one road at a
+        time, without building the full ElementTree.
+
+        Parameters
+        ----------
+        file_handle : BinaryIO
+            The file handle to write to.
+        prettyprint : bool, optional
+            Whether to pretty-print the XML. Default is True.
+        encoding : str, optional
+            Specifies the output encoding. Default is 'utf-8'.
+
+        Returns
+        -------
+        None
+        """
+        write_stream(self.iter_xml(), file_handle, prettyprint, encoding)
 
     def write_xml(
         self,
@@ -2729,7 +2837,7 @@ class OpenDrive(XodrBase):
         """
         if filename == None:
             filename = self.name + ".xodr"
-        printToFile(self.get_element(), filename, prettyprint, encoding)
+        printToFile(self.iter_xml(), filename, prettyprint, encoding)
 
 
 class _Type(XodrBase):
@@ -2862,10 +2970,10 @@ class _Type(XodrBase):
         ET.Element
             The XML ElementTree representation of the _Type.
         """
-        element = ET.Element("type", attrib=self.get_attributes())
+        element = Element("type", attrib=self.get_attributes())
         self._add_additional_data_to_element(element)
         if self.speed:
-            ET.SubElement(
+            SubElement(
                 element,
                 "speed",
                 attrib={"max": str(self.speed), "unit": self.speed_unit},
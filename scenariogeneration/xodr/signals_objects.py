@@ -13,7 +13,7 @@ Copyright (c) 2022 The scenariogeneration Authors.
 import xml.etree.ElementTree as ET
 from typing import Optional, Union
 
-from ..helpers import enum2str
+from ..helpers import Element, SubElement, enum2str
 from ..xosc.utils import get_bool_string
 from .enumerations import (
     Access,
@@ -471,7 +471,7 @@ class Signal(_SignalObjectBase):
         ET.Element
             The XML ElementTree representation of the Signal.
         """
-        element = ET.Element("signal", attrib=self.get_attributes())
+        element = Element("signal", attrib=self.get_attributes())
         self._add_additional_data_to_element(element)
         if self.validity:
             element.append(self.validity.get_element())
@@ -537,7 +537,7 @@ class Validity(XodrBase):
         ET.Element
             The XML ElementTree representation of the Validity.
         """
-        element = ET.Element("validity", attrib=self.get_attributes())
+        element = Element("validity", attrib=self.get_attributes())
         self._add_additional_data_to_element(element)
         return element
 
@@ -600,7 +600,7 @@ class Dependency(XodrBase):
         ET.Element
             The XML ElementTree representation of the Dependency.
         """
-        element = ET.Element("dependency", attrib=self.get_attributes())
+        element = Element("dependency", attrib=self.get_attributes())
         self._add_additional_data_to_element(element)
         return element
 
@@ -763,7 +763,7 @@ class SignalReference(XodrBase):
         ET.Element
             The XML ElementTree representation of the SignalReference.
         """
-        element = ET.Element("signalReference", attrib=self.get_attributes())
+        element = Element("signalReference", attrib=self.get_attributes())
         self._add_additional_data_to_element(element)
         if self.validity:
             element.append(self.validity.get_element())
@@ -1219,25 +1219,25 @@ class Object(_SignalObjectBase):
                         )
                     )
 
-        element = ET.Element("object", attrib=self.get_attributes())
+        element = Element("object", attrib=self.get_attributes())
         self._add_additional_data_to_element(element)
         for _repeat in self._repeats:
-            ET.SubElement(element, "repeat", attrib=_repeat)
+            SubElement(element, "repeat", attrib=_repeat)
         if self.validity:
             element.append(self.validity.get_element())
         if self.parking_space:
             element.append(self.parking_space.get_element())
         if self.outlines:
-            outlines_element = ET.SubElement(element, "outlines")
+            outlines_element = SubElement(element, "outlines")
             for outline in self.outlines:
                 outlines_element.append(outline.get_element())
         if self.markings:
-            markings_element = ET.SubElement(element, "markings")
+            markings_element = SubElement(element, "markings")
             for marking in self.markings:
                 markings_element.append(marking.get_element())
         if self.materials:
             for material in self.materials:
-                ET.SubElement(element, "material", attrib=material)
+                SubElement(element, "material", attrib=material)
         return element
 
 
@@ -1339,7 +1339,7 @@ class Tunnel(XodrBase):
         ET.Element
             The XML ElementTree representation of the Tunnel.
         """
-        element = ET.Element("tunnel", attrib=self.get_attributes())
+        element = Element("tunnel", attrib=self.get_attributes())
         return element
 
 
@@ -1428,7 +1428,7 @@ class CornerLocal(XodrBase):
         ET.Element
             The XML ElementTree representation of the CornerLocal.
         """
-        element = ET.Element("cornerLocal", attrib=self.get_attributes())
+        element = Element("cornerLocal", attrib=self.get_attributes())
         self._add_additional_data_to_element(element)
         return element
 
@@ -1518,7 +1518,7 @@ class CornerRoad(XodrBase):
         ET.Element
             The XML ElementTree representation of the CornerRoad.
         """
-        element = ET.Element("cornerRoad", attrib=self.get_attributes())
+        element = Element("cornerRoad", attrib=self.get_attributes())
         self._add_additional_data_to_element(element)
         return element
 
@@ -1656,7 +1656,7 @@ class Outline(XodrBase):
         ET.Element
             The XML ElementTree representation of the Outline.
         """
-        element = ET.Element("outline", attrib=self.get_attributes())
+        element = Element("outline", attrib=self.get_attributes())
         self._add_additional_data_to_element(element)
         for corner in self.corners:
             element.append(corner.get_element())
@@ -1731,7 +1731,7 @@ class ParkingSpace(XodrBase):
         ET.Element
             The XML ElementTree representation of the ParkingSpace.
         """
-        element = ET.Element("parkingSpace", attrib=self.get_attributes())
+        element = Element("parkingSpace", attrib=self.get_attributes())
         self._add_additional_data_to_element(element)
 
         return element
@@ -1852,10 +1852,10 @@ class Marking(XodrBase):
         ET.Element
             The XML ElementTree representation of the Marking.
         """
-        element = ET.Element("marking", attrib=self.get_attributes())
+        element = Element("marking", attrib=self.get_attributes())
         self._add_additional_data_to_element(element)
         for cornerReference in self.cornerReferences:
-            ET.SubElement(
+            SubElement(
                 element, "cornerReference", attrib={"id": str(cornerReference)}
             )
 
@@ -11,11 +11,18 @@ Copyright (c) 2022 The scenariogeneration Authors.
 """
 
 import xml.etree.ElementTree as ET
-from typing import Optional
+from typing import Optional, Union
 
 import numpy as np
 
-from ..helpers import enum2str
+from ..helpers import (
+    CachedElementBase,
+    Element,
+    StreamElement,
+    SubElement,
+    enum2str,
+    import_element,
+)
 from .enumerations import ContactPoint
 
 
@@ -111,7 +118,31 @@ def get_coeffs_for_poly3(
     return np.linalg.solve(A, B)
 
 
-class XodrBase:
+def _get_attributes_fingerprint(attributes: dict) -> int:
+    """Create a hash of an attribute dict (order independent), unhashable
+    values are hashed by their string representation.
+
+    Parameters
+    ----------
+    attributes : dict
+        the attributes (eg. from get_attributes)
+
+    Returns
+    -------
+    int
+        the hash of the attributes
+    """
+    items = []
+    for key, value in attributes.items():
+        try:
+            hash(value)
+        except TypeError:
+            value = str(value)
+        items.append((key, value))
+    return hash(frozenset(items))
+
+
+class XodrBase(CachedElementBase):
     """Sets up common functionality for xodr-generating classes by enabling
     userdata inputs.
 
@@ -154,6 +185,24 @@ class XodrBase:
 
         return False
 
+    def get_fingerprint(self) -> int:
+        """Return a structural fingerprint of the xodr entry.
+
+        Entries that are equal (==) always have the same fingerprint, so the
+        fingerprint can be used to look up candidates in a dict before the
+        full (deep) comparison is made. Different entries might still share
+        a fingerprint.
+
+        Note: the fingerprint is not cached, it reflects the entry at the
+        time of the call.
+
+        Returns
+        -------
+        int
+            The fingerprint of the entry.
+        """
+        return hash(len(self.user_data))
+
     def add_userdata(self, userdata: "UserData") -> None:
         """Add a userdata entry to the xodr entry.
 
@@ -203,14 +252,33 @@ class XodrBase:
         ET.Element
             The updated XML element.
         """
+        for additional_data in self._iter_additional_data():
+            element.append(additional_data)
+        return element
+
+    def _iter_additional_data(self):
+        """Yield the elements of the userdata and data quality."""
         for ud in self.user_data:
-            element.append(ud.get_element())
+            yield ud.get_element()
         if self.data_quality:
-            element.append(self.data_quality.get_element())
-        return element
+            yield self.data_quality.get_element()
+
+    def iter_xml(self) -> Union[ET.Element, StreamElement]:
+        """Return the XML representation of the xodr entry for streaming
+        (see helpers.write_stream).
+
+        Entries with large contents return a StreamElement producing the
+        children lazily, others return get_element().
+
+        Returns
+        -------
+        ET.Element | StreamElement
+            The XML representation of the entry.
+        """
+        return self.get_element()
 
 
-class UserData:
+class UserData(CachedElementBase):
     """Sets up additional data for any entry of OpenDRIVE.
 
     Attributes
@@ -318,13 +386,13 @@ class UserData:
         ET.Element
             The XML ElementTree representation of the UserData.
         """
-        element = ET.Element("userData", attrib=self.get_attributes())
+        element = Element("userData", attrib=self.get_attributes())
         for i in self.userdata_content:
-            element.append(i)
+            element.append(import_element(i))
         return element
 
 
-class DataQuality:
+class DataQuality(CachedElementBase):
     """Sets up DataQuality for any entry of OpenDRIVE.
 
     Attributes
@@ -476,7 +544,7 @@ class DataQuality:
         ET.Element
             The XML ElementTree representation of the DataQuality.
         """
-        element = ET.Element("dataQuality")
+        element = Element("dataQuality")
         if self._raw_data_added:
             raw_data_attrib = {
                 "date": self.date,
@@ -490,10 +558,10 @@ class DataQuality:
             if self.source_comment is not None:
                 raw_data_attrib["sourceComment"] = self.source_comment
 
-            ET.SubElement(element, "rawData", attrib=raw_data_attrib)
+            SubElement(element, "rawData", attrib=raw_data_attrib)
 
         if self._error_added:
-            ET.SubElement(
+            SubElement(
                 element,
                 "error",
                 attrib={
@@ -13,6 +13,7 @@ Copyright (c) 2022 The scenariogeneration Authors.
 import xml.etree.ElementTree as ET
 from typing import Any, Optional, Union
 
+from ..helpers import Element, SubElement
 from .enumerations import (
     AutomaticGearType,
     CoordinateSystem,
@@ -275,7 +276,7 @@ class _Action(VersionBase):
 
     def get_element(self) -> ET.Element:
         """Returns the elementTree of the _Action."""
-        element = ET.Element("Action", attrib=self.get_attributes())
+        element = Element("Action", attrib=self.get_attributes())
         element.append(self.action.get_element())
         return element
 
@@ -382,16 +383,16 @@ class AbsoluteSpeedAction(_PrivateActionType):
         xml.etree.ElementTree.Element
             The ElementTree representation of the AbsoluteSpeedAction.
         """
-        element = ET.Element("PrivateAction")
-        longaction = ET.SubElement(element, "LongitudinalAction")
-        speedaction = ET.SubElement(longaction, "SpeedAction")
+        element = Element("PrivateAction")
+        longaction = SubElement(element, "LongitudinalAction")
+        speedaction = SubElement(longaction, "SpeedAction")
 
         speedaction.append(
             self.transition_dynamics.get_element("SpeedActionDynamics")
         )
-        speedactiontarget = ET.SubElement(speedaction, "SpeedActionTarget")
+        speedactiontarget = SubElement(speedaction, "SpeedActionTarget")
 
-        ET.SubElement(
+        SubElement(
             speedactiontarget, "AbsoluteTargetSpeed", self.get_attributes()
         )
 
@@ -535,15 +536,15 @@ class RelativeSpeedAction(_PrivateActionType):
         xml.etree.ElementTree.Element
             The ElementTree representation of the RelativeSpeedAction.
         """
-        element = ET.Element("PrivateAction")
-        longaction = ET.SubElement(element, "LongitudinalAction")
-        speedaction = ET.SubElement(longaction, "SpeedAction")
+        element = Element("PrivateAction")
+        longaction = SubElement(element, "LongitudinalAction")
+        speedaction = SubElement(longaction, "SpeedAction")
         speedaction.append(
             self.transition_dynamics.get_element("SpeedActionDynamics")
         )
-        speedactiontarget = ET.SubElement(speedaction, "SpeedActionTarget")
+        speedactiontarget = SubElement(speedaction, "SpeedActionTarget")
 
-        ET.SubElement(
+        SubElement(
             speedactiontarget, "RelativeTargetSpeed", self.get_attributes()
         )
 
@@ -808,10 +809,10 @@ class LongitudinalDistanceAction(_PrivateActionType):
             LongitudinalDistanceAction.
         """
 
-        element = ET.Element("PrivateAction")
-        longact = ET.SubElement(element, "LongitudinalAction")
+        element = Element("PrivateAction")
+        longact = SubElement(element, "LongitudinalAction")
 
-        longdistaction = ET.SubElement(
+        longdistaction = SubElement(
             longact, "LongitudinalDistanceAction", attrib=self.get_attributes()
         )
         if self.dynamic_constraint.is_filled():
@@ -994,9 +995,9 @@ class SpeedProfileAction(_PrivateActionType):
             raise OpenSCENARIOVersionError(
                 "SpeedProfileAction was introduced in OpenSCENARIO V1.2"
             )
-        element = ET.Element("PrivateAction")
-        longaction = ET.SubElement(element, "LongitudinalAction")
-        speedaction = ET.SubElement(
+        element = Element("PrivateAction")
+        longaction = SubElement(element, "LongitudinalAction")
+        speedaction = SubElement(
             longaction, "SpeedProfileAction", attrib=self.get_attributes()
         )
         if self.dynamics_constraint is not None:
@@ -1006,7 +1007,7 @@ class SpeedProfileAction(_PrivateActionType):
             tmp_dict = {"speed": str(speed)}
             if self.times:
                 tmp_dict["time"] = str(self.times[i])
-            ET.SubElement(speedaction, "SpeedProfileEntry", attrib=tmp_dict)
+            SubElement(speedaction, "SpeedProfileEntry", attrib=tmp_dict)
 
         return element
 
@@ -1137,21 +1138,21 @@ class AbsoluteLaneChangeAction(_PrivateActionType):
             The root XML element representing the
             AbsoluteLaneChangeAction.
         """
-        element = ET.Element("PrivateAction")
+        element = Element("PrivateAction")
         laneoffset = {}
-        lataction = ET.SubElement(element, "LateralAction")
+        lataction = SubElement(element, "LateralAction")
         if self.target_lane_offset:
             laneoffset = {"targetLaneOffset": str(self.target_lane_offset)}
-        lanechangeaction = ET.SubElement(
+        lanechangeaction = SubElement(
             lataction, "LaneChangeAction", attrib=laneoffset
         )
 
         lanechangeaction.append(
             self.transition_dynamics.get_element("LaneChangeActionDynamics")
         )
-        lanchangetarget = ET.SubElement(lanechangeaction, "LaneChangeTarget")
+        lanchangetarget = SubElement(lanechangeaction, "LaneChangeTarget")
 
-        ET.SubElement(
+        SubElement(
             lanchangetarget, "AbsoluteTargetLane", self.get_attributes()
         )
         return element
@@ -1290,21 +1291,21 @@ class RelativeLaneChangeAction(_PrivateActionType):
         xml.etree.ElementTree.Element
             The XML element representing the RelativeLaneChangeAction.
         """
-        element = ET.Element("PrivateAction")
+        element = Element("PrivateAction")
         laneoffset = {}
-        lataction = ET.SubElement(element, "LateralAction")
+        lataction = SubElement(element, "LateralAction")
         if self.target_lane_offset is not None:
             laneoffset = {"targetLaneOffset": str(self.target_lane_offset)}
-        lanechangeaction = ET.SubElement(
+        lanechangeaction = SubElement(
             lataction, "LaneChangeAction", attrib=laneoffset
         )
 
         lanechangeaction.append(
             self.transition_dynamics.get_element("LaneChangeActionDynamics")
         )
-        lanchangetarget = ET.SubElement(lanechangeaction, "LaneChangeTarget")
+        lanchangetarget = SubElement(lanechangeaction, "LaneChangeTarget")
 
-        ET.SubElement(
+        SubElement(
             lanchangetarget, "RelativeTargetLane", self.get_attributes()
         )
         return element
@@ -1446,14 +1447,14 @@ class AbsoluteLaneOffsetAction(_PrivateActionType):
             The root XML element representing the
             AbsoluteLaneOffsetAction.
         """
-        element = ET.Element("PrivateAction")
-        lataction = ET.SubElement(element, "LateralAction")
-        laneoffsetaction = ET.SubElement(
+        element = Element("PrivateAction")
+        lataction = SubElement(element, "LateralAction")
+        laneoffsetaction = SubElement(
             lataction,
             "LaneOffsetAction",
             attrib={"continuous": get_bool_string(self.continuous)},
         )
-        ET.SubElement(
+        SubElement(
             laneoffsetaction,
             "LaneOffsetActionDynamics",
             {
@@ -1461,8 +1462,8 @@ class AbsoluteLaneOffsetAction(_PrivateActionType):
                 "dynamicsShape": self.dynshape.get_name(),
             },
         )
-        laneoftarget = ET.SubElement(laneoffsetaction, "LaneOffsetTarget")
-        ET.SubElement(
+        laneoftarget = SubElement(laneoffsetaction, "LaneOffsetTarget")
+        SubElement(
             laneoftarget, "AbsoluteTargetLaneOffset", self.get_attributes()
         )
 
@@ -1615,14 +1616,14 @@ class RelativeLaneOffsetAction(_PrivateActionType):
             The root XML element representing the
             RelativeLaneOffsetAction.
         """
-        element = ET.Element("PrivateAction")
-        lataction = ET.SubElement(element, "LateralAction")
-        laneoffsetaction = ET.SubElement(
+        element = Element("PrivateAction")
+        lataction = SubElement(element, "LateralAction")
+        laneoffsetaction = SubElement(
             lataction,
             "LaneOffsetAction",
             attrib={"continuous": get_bool_string(self.continuous)},
         )
-        ET.SubElement(
+        SubElement(
             laneoffsetaction,
             "LaneOffsetActionDynamics",
             {
@@ -1630,8 +1631,8 @@ class RelativeLaneOffsetAction(_PrivateActionType):
                 "dynamicsShape": self.dynshape.get_name(),
             },
         )
-        laneoftarget = ET.SubElement(laneoffsetaction, "LaneOffsetTarget")
-        ET.SubElement(
+        laneoftarget = SubElement(laneoffsetaction, "LaneOffsetTarget")
+        SubElement(
             laneoftarget,
             "RelativeTargetLaneOffset",
             attrib=self.get_attributes(),
@@ -1847,9 +1848,9 @@ class LateralDistanceAction(_PrivateActionType):
         ET.Element
             The root XML element representing the LateralDistanceAction.
         """
-        element = ET.Element("PrivateAction")
-        lataction = ET.SubElement(element, "LateralAction")
-        lateraldistanceaction = ET.SubElement(
+        element = Element("PrivateAction")
+        lataction = SubElement(element, "LateralAction")
+        lateraldistanceaction = SubElement(
             lataction, "LateralDistanceAction", attrib=self.get_attributes()
         )
         if self.dynamic_constraint.is_filled():
@@ -1929,8 +1930,8 @@ class TeleportAction(_PrivateActionType):
         xml.etree.ElementTree.Element
             The XML element representing the TeleportAction.
         """
-        element = ET.Element("PrivateAction")
-        telact = ET.SubElement(element, "TeleportAction")
+        element = Element("PrivateAction")
+        telact = SubElement(element, "TeleportAction")
         telact.append(self.position.get_element())
         return element
 
@@ -1988,9 +1989,9 @@ class RandomRouteAction(_PrivateActionType):
             raise OpenSCENARIOVersionError(
                 "RandomRouteAction was introduced in OSC V1.3"
             )
-        element = ET.Element("PrivateAction")
-        routeaction = ET.SubElement(element, "RoutingAction")
-        ET.SubElement(routeaction, "RandomRouteAction")
+        element = Element("PrivateAction")
+        routeaction = SubElement(element, "RoutingAction")
+        SubElement(routeaction, "RandomRouteAction")
 
         return element
 
@@ -2075,9 +2076,9 @@ class AssignRouteAction(_PrivateActionType):
         xml.etree.ElementTree.Element
             The root XML element representing the AssignRouteAction.
         """
-        element = ET.Element("PrivateAction")
-        routeaction = ET.SubElement(element, "RoutingAction")
-        assignrouteaction = ET.SubElement(routeaction, "AssignRouteAction")
+        element = Element("PrivateAction")
+        routeaction = SubElement(element, "RoutingAction")
+        assignrouteaction = SubElement(routeaction, "AssignRouteAction")
         assignrouteaction.append(self.route.get_element())
 
         return element
@@ -2159,9 +2160,9 @@ class AcquirePositionAction(_PrivateActionType):
             nested RoutingAction and AcquirePositionAction elements.
         """
 
-        element = ET.Element("PrivateAction")
-        routeaction = ET.SubElement(element, "RoutingAction")
-        posaction = ET.SubElement(routeaction, "AcquirePositionAction")
+        element = Element("PrivateAction")
+        routeaction = SubElement(element, "RoutingAction")
+        posaction = SubElement(routeaction, "AcquirePositionAction")
         posaction.append(self.position.get_element())
 
         return element
@@ -2346,18 +2347,18 @@ class FollowTrajectoryAction(_PrivateActionType):
         ET.Element
             The root XML element representing the FollowTrajectoryAction
         """
-        element = ET.Element("PrivateAction")
-        routeaction = ET.SubElement(element, "RoutingAction")
-        trajaction = ET.SubElement(
+        element = Element("PrivateAction")
+        routeaction = SubElement(element, "RoutingAction")
+        trajaction = SubElement(
             routeaction, "FollowTrajectoryAction", attrib=self.get_attributes()
         )
         if self.isVersion(minor=0):
             trajaction.append(self.trajectory.get_element())
         else:
-            trajref = ET.SubElement(trajaction, "TrajectoryRef")
+            trajref = SubElement(trajaction, "TrajectoryRef")
             trajref.append(self.trajectory.get_element())
         trajaction.append(self.timeref.get_element())
-        ET.SubElement(
+        SubElement(
             trajaction,
             "TrajectoryFollowingMode",
             attrib={"followingMode": self.following_mode.get_name()},
@@ -2527,8 +2528,8 @@ class ControllerAction(_PrivateActionType):
                     "activateControllerAction is not parameter in version 1.0."
                 )
 
-        element = ET.Element("PrivateAction")
-        controlleraction = ET.SubElement(element, "ControllerAction")
+        element = Element("PrivateAction")
+        controlleraction = SubElement(element, "ControllerAction")
 
         if self.activateControllerAction is not None:
             pa_element = self.activateControllerAction.get_element()
@@ -2666,7 +2667,7 @@ class ObjectController(VersionBase):
         xml.etree.ElementTree.Element
             The XML element representing the ObjectController.
         """
-        element = ET.Element("ObjectController", attrib=self.get_attributes())
+        element = Element("ObjectController", attrib=self.get_attributes())
         if self.catalog_ref is not None:
             element.append(self.catalog_ref.get_element())
         elif self.controller is not None:
@@ -2834,16 +2835,16 @@ class ActivateControllerAction(_PrivateActionType):
         ET.Element
             The XML element representing the ActivateControllerAction.
         """
-        element = ET.Element("PrivateAction")
+        element = Element("PrivateAction")
         if self.isVersion(minor=0):
-            ET.SubElement(
+            SubElement(
                 element,
                 "ActivateControllerAction",
                 attrib=self.get_attributes(),
             )
         else:
-            subelem = ET.SubElement(element, "ControllerAction")
-            ET.SubElement(
+            subelem = SubElement(element, "ControllerAction")
+            SubElement(
                 subelem,
                 "ActivateControllerAction",
                 attrib=self.get_attributes(),
@@ -3059,9 +3060,9 @@ class AssignControllerAction(_PrivateActionType):
                 "AssignControllerAction cannot be used alone in OSC 1.0, "
                 "please add it to a ControllerAction."
             )
-        element = ET.Element("PrivateAction")
-        controlleraction = ET.SubElement(element, "ControllerAction")
-        assigncontrolleraction = ET.SubElement(
+        element = Element("PrivateAction")
+        controlleraction = SubElement(element, "ControllerAction")
+        assigncontrolleraction = SubElement(
             controlleraction, "AssignControllerAction", self.get_attributes()
         )
         if self.isVersionEqLarger(minor=3):
@@ -3559,9 +3560,9 @@ class OverrideControllerValueAction(_PrivateActionType):
                 "OverrideControllerValueAction cannot be used alone in "
                 "OSC 1.0, please add it to a ControllerAction"
             )
-        element = ET.Element("PrivateAction")
-        controlleraction = ET.SubElement(element, "ControllerAction")
-        overrideaction = ET.SubElement(
+        element = Element("PrivateAction")
+        controlleraction = SubElement(element, "ControllerAction")
+        overrideaction = SubElement(
             controlleraction, "OverrideControllerValueAction"
         )
 
@@ -3591,14 +3592,14 @@ class OverrideControllerValueAction(_PrivateActionType):
                 raise OpenSCENARIOVersionError(
                     "maxRate was introduced in OpenSCENARIO v1.2"
                 )
-            ET.SubElement(
+            SubElement(
                 overrideaction,
                 "Throttle",
                 throttle_dict,
             )
         if self.brake_active is not None:
             if not self.isVersionEqLarger(minor=2):
-                ET.SubElement(
+                SubElement(
                     overrideaction,
                     "Brake",
                     {
@@ -3607,7 +3608,7 @@ class OverrideControllerValueAction(_PrivateActionType):
                     },
                 )
             else:
-                override_brake = ET.SubElement(
+                override_brake = SubElement(
                     overrideaction,
                     "Brake",
                     {"active": get_bool_string(self.brake_active)},
@@ -3616,11 +3617,9 @@ class OverrideControllerValueAction(_PrivateActionType):
                 if self.brake_rate is not None:
                     brake_dict["maxRate"] = str(self.brake_rate)
                 if self.brake_force:
-                    ET.SubElement(
-                        override_brake, "BrakeForce", attrib=brake_dict
-                    )
+                    SubElement(override_brake, "BrakeForce", attrib=brake_dict)
                 else:
-                    ET.SubElement(
+                    SubElement(
                         override_brake, "BrakePercent", attrib=brake_dict
                     )
 
@@ -3649,14 +3648,14 @@ class OverrideControllerValueAction(_PrivateActionType):
                 raise OpenSCENARIOVersionError(
                     "maxRate was introduced in OpenSCENARIO v1.2"
                 )
-            ET.SubElement(
+            SubElement(
                 overrideaction,
                 "Clutch",
                 clutch_dict,
             )
         if self.parkingbrake_active is not None:
             if not self.isVersionEqLarger(minor=2):
-                ET.SubElement(
+                SubElement(
                     overrideaction,
                     "ParkingBrake",
                     {
@@ -3665,7 +3664,7 @@ class OverrideControllerValueAction(_PrivateActionType):
                     },
                 )
             else:
-                override_parking = ET.SubElement(
+                override_parking = SubElement(
                     overrideaction,
                     "ParkingBrake",
                     {"active": get_bool_string(self.parkingbrake_active)},
@@ -3674,13 +3673,13 @@ class OverrideControllerValueAction(_PrivateActionType):
                 if self.parkingbrake_rate is not None:
                     parkingbrake_dict["maxRate"] = str(self.parkingbrake_rate)
                 if self.parkingbrake_force:
-                    ET.SubElement(
+                    SubElement(
                         override_parking,
                         "BrakeForce",
                         attrib=parkingbrake_dict,
                     )
                 else:
-                    ET.SubElement(
+                    SubElement(
                         override_parking,
                         "BrakePercent",
                         attrib=parkingbrake_dict,
@@ -3704,7 +3703,7 @@ class OverrideControllerValueAction(_PrivateActionType):
                     raise OpenSCENARIOVersionError(
                         "maxRate was introduced in OpenSCENARIO v1.2"
                     )
-            ET.SubElement(
+            SubElement(
                 overrideaction,
                 "SteeringWheel",
                 steering_dict,
@@ -3712,7 +3711,7 @@ class OverrideControllerValueAction(_PrivateActionType):
 
         if self.gear_active is not None:
             if not self.isVersionEqLarger(minor=2):
-                ET.SubElement(
+                SubElement(
                     overrideaction,
                     "Gear",
                     {
@@ -3721,7 +3720,7 @@ class OverrideControllerValueAction(_PrivateActionType):
                     },
                 )
             else:
-                override_gear_action = ET.SubElement(
+                override_gear_action = SubElement(
                     overrideaction,
                     "Gear",
                     {
@@ -3729,13 +3728,13 @@ class OverrideControllerValueAction(_PrivateActionType):
                     },
                 )
                 if self._gear_maunal:
-                    ET.SubElement(
+                    SubElement(
                         override_gear_action,
                         "ManualGear",
                         {"number": str(int(self.gear_value))},
                     )
                 else:
-                    ET.SubElement(
+                    SubElement(
                         override_gear_action,
                         "AutomaticGear",
                         {"gear": self.gear_value.get_name()},
@@ -3873,8 +3872,8 @@ class VisibilityAction(_PrivateActionType):
         ET.Element
             The XML element representing the VisibilityAction.
         """
-        element = ET.Element("PrivateAction")
-        visibility_element = ET.SubElement(
+        element = Element("PrivateAction")
+        visibility_element = SubElement(
             element, "VisibilityAction", self.get_attributes()
         )
         if self.sensor_refs:
@@ -3882,11 +3881,11 @@ class VisibilityAction(_PrivateActionType):
                 raise OpenSCENARIOVersionError(
                     "SensorReference was added in OSC V1.2"
                 )
-            sensor_ref_element = ET.SubElement(
+            sensor_ref_element = SubElement(
                 visibility_element, "SensorReferenceSet"
             )
             for sensor in self.sensor_refs:
-                ET.SubElement(
+                SubElement(
                     sensor_ref_element,
                     "SensorReference",
                     {"name": str(sensor)},
@@ -4099,8 +4098,8 @@ class SynchronizeAction(_PrivateActionType):
         ET.Element
             The XML element representing the AbsoluteSynchronizeAction.
         """
-        element = ET.Element("PrivateAction")
-        syncaction = ET.SubElement(
+        element = Element("PrivateAction")
+        syncaction = SubElement(
             element, "SynchronizeAction", self.get_attributes()
         )
         syncaction.append(
@@ -4272,16 +4271,16 @@ class LightStateAction(_PrivateActionType):
 
     def get_element(self) -> ET.Element:
         """Returns the elementTree of the LightStateAction."""
-        element = ET.Element("PrivateAction")
-        appear_element = ET.SubElement(element, "AppearanceAction")
-        light_element = ET.SubElement(
+        element = Element("PrivateAction")
+        appear_element = SubElement(element, "AppearanceAction")
+        light_element = SubElement(
             appear_element, "LightStateAction", self.get_attributes()
         )
         light_element.append(self.lightstate.get_element())
 
-        light_type_element = ET.SubElement(light_element, "LightType")
+        light_type_element = SubElement(light_element, "LightType")
         if hasattr(VehicleLightType, str(self.light_type)):
-            ET.SubElement(
+            SubElement(
                 light_type_element,
                 "VehicleLight",
                 attrib={"vehicleLightType": self.light_type.get_name()},
@@ -4456,18 +4455,16 @@ class AnimationAction(_PrivateActionType):
             The root XML element representing the AnimationAction.
         """
 
-        element = ET.Element("PrivateAction")
-        appear_element = ET.SubElement(element, "AppearanceAction")
-        animation_element = ET.SubElement(
+        element = Element("PrivateAction")
+        appear_element = SubElement(element, "AppearanceAction")
+        animation_element = SubElement(
             appear_element, "AnimationAction", self.get_attributes()
         )
 
-        animation_type_element = ET.SubElement(
-            animation_element, "AnimationType"
-        )
+        animation_type_element = SubElement(animation_element, "AnimationType")
         animation_type_element.append(self.animation_type.get_element())
         if self.state is not None:
-            ET.SubElement(
+            SubElement(
                 animation_element,
                 "AnimationState",
                 attrib={"state": str(self.state)},
@@ -4561,9 +4558,9 @@ class ConnectTrailerAction(_PrivateActionType):
             raise OpenSCENARIOVersionError(
                 "ConnectTrailerAction was added in OSC V1.3"
             )
-        element = ET.Element("PrivateAction")
-        trailer_element = ET.SubElement(element, "TrailerAction")
-        ET.SubElement(
+        element = Element("PrivateAction")
+        trailer_element = SubElement(element, "TrailerAction")
+        SubElement(
             trailer_element, "ConnectTrailerAction", self.get_attributes()
         )
         return element
@@ -4615,9 +4612,9 @@ class DisconnectTrailerAction(_PrivateActionType):
             raise OpenSCENARIOVersionError(
                 "DisconnectTrailerAction was added in OSC V1.3"
             )
-        element = ET.Element("PrivateAction")
-        trailer_element = ET.SubElement(element, "TrailerAction")
-        ET.SubElement(trailer_element, "DisconnectTrailerAction")
+        element = Element("PrivateAction")
+        trailer_element = SubElement(element, "TrailerAction")
+        SubElement(trailer_element, "DisconnectTrailerAction")
         return element
 
 
@@ -4722,13 +4719,13 @@ class ParameterAddAction(_ActionType):
             raise OpenSCENARIOVersionError(
                 "ParameterAddAction was deprecated in OSC 1.2, please use VariableAddAction instead"
             )
-        element = ET.Element("GlobalAction")
-        paramaction = ET.SubElement(
+        element = Element("GlobalAction")
+        paramaction = SubElement(
             element, "ParameterAction", {"parameterRef": self.parameter_ref}
         )
-        modifaction = ET.SubElement(paramaction, "ModifyAction")
-        rule = ET.SubElement(modifaction, "Rule")
-        ET.SubElement(rule, "AddValue", self.get_attributes())
+        modifaction = SubElement(paramaction, "ModifyAction")
+        rule = SubElement(modifaction, "Rule")
+        SubElement(rule, "AddValue", self.get_attributes())
 
         return element
 
@@ -4834,13 +4831,13 @@ class ParameterMultiplyAction(_ActionType):
                 "ParameterMultiplyAction was deprecated in OSC 1.2, "
                 "please use VariableMultiplyAction instead"
             )
-        element = ET.Element("GlobalAction")
-        paramaction = ET.SubElement(
+        element = Element("GlobalAction")
+        paramaction = SubElement(
             element, "ParameterAction", {"parameterRef": self.parameter_ref}
         )
-        modifaction = ET.SubElement(paramaction, "ModifyAction")
-        rule = ET.SubElement(modifaction, "Rule")
-        ET.SubElement(rule, "MultiplyByValue", self.get_attributes())
+        modifaction = SubElement(paramaction, "ModifyAction")
+        rule = SubElement(modifaction, "Rule")
+        SubElement(rule, "MultiplyByValue", self.get_attributes())
 
         return element
 
@@ -4942,11 +4939,11 @@ class ParameterSetAction(_ActionType):
             raise OpenSCENARIOVersionError(
                 "ParameterSetAction was deprecated in OSC 1.2, please use VariableSetAction instead"
             )
-        element = ET.Element("GlobalAction")
-        paramaction = ET.SubElement(
+        element = Element("GlobalAction")
+        paramaction = SubElement(
             element, "ParameterAction", {"parameterRef": self.parameter_ref}
         )
-        ET.SubElement(paramaction, "SetAction", self.get_attributes())
+        SubElement(paramaction, "SetAction", self.get_attributes())
 
         return element
 
@@ -5051,13 +5048,13 @@ class VariableAddAction(_ActionType):
             raise OpenSCENARIOVersionError(
                 "VariableActions were added in OSC 1.2"
             )
-        element = ET.Element("GlobalAction")
-        paramaction = ET.SubElement(
+        element = Element("GlobalAction")
+        paramaction = SubElement(
             element, "VariableAction", {"variableRef": self.variable_ref}
         )
-        modifaction = ET.SubElement(paramaction, "ModifyAction")
-        rule = ET.SubElement(modifaction, "Rule")
-        ET.SubElement(rule, "AddValue", self.get_attributes())
+        modifaction = SubElement(paramaction, "ModifyAction")
+        rule = SubElement(modifaction, "Rule")
+        SubElement(rule, "AddValue", self.get_attributes())
 
         return element
 
@@ -5156,13 +5153,13 @@ class VariableMultiplyAction(_ActionType):
             raise OpenSCENARIOVersionError(
                 "VariableActions were added in OSC 1.2"
             )
-        element = ET.Element("GlobalAction")
-        paramaction = ET.SubElement(
+        element = Element("GlobalAction")
+        paramaction = SubElement(
             element, "VariableAction", {"variableRef": self.variable_ref}
         )
-        modifaction = ET.SubElement(paramaction, "ModifyAction")
-        rule = ET.SubElement(modifaction, "Rule")
-        ET.SubElement(rule, "MultiplyByValue", self.get_attributes())
+        modifaction = SubElement(paramaction, "ModifyAction")
+        rule = SubElement(modifaction, "Rule")
+        SubElement(rule, "MultiplyByValue", self.get_attributes())
 
         return element
 
@@ -5262,11 +5259,11 @@ class VariableSetAction(_ActionType):
             raise OpenSCENARIOVersionError(
                 "VariableActions were added in OSC 1.2"
             )
-        element = ET.Element("GlobalAction")
-        paramaction = ET.SubElement(
+        element = Element("GlobalAction")
+        paramaction = SubElement(
             element, "VariableAction", {"variableRef": self.variable_ref}
         )
-        ET.SubElement(paramaction, "SetAction", self.get_attributes())
+        SubElement(paramaction, "SetAction", self.get_attributes())
 
         return element
 
@@ -5365,10 +5362,10 @@ class TrafficSignalStateAction(_ActionType):
             with nested InfrastructureAction and TrafficSignalAction.
         """
 
-        element = ET.Element("GlobalAction")
-        infra = ET.SubElement(element, "InfrastructureAction")
-        tsa = ET.SubElement(infra, "TrafficSignalAction")
-        ET.SubElement(tsa, "TrafficSignalStateAction", self.get_attributes())
+        element = Element("GlobalAction")
+        infra = SubElement(element, "InfrastructureAction")
+        tsa = SubElement(infra, "TrafficSignalAction")
+        SubElement(tsa, "TrafficSignalStateAction", self.get_attributes())
 
         return element
 
@@ -5465,11 +5462,11 @@ class AddEntityAction(_ActionType):
         ET.Element
             The XML element representing the AddEntityAction.
         """
-        element = ET.Element("GlobalAction")
-        entityact = ET.SubElement(
+        element = Element("GlobalAction")
+        entityact = SubElement(
             element, "EntityAction", attrib=self.get_attributes()
         )
-        addentity = ET.SubElement(entityact, "AddEntityAction")
+        addentity = SubElement(entityact, "AddEntityAction")
         addentity.append(self.position.get_element())
 
         return element
@@ -5555,11 +5552,11 @@ class DeleteEntityAction(_ActionType):
         ET.Element
             The XML element representing the DeleteEntityAction.
         """
-        element = ET.Element("GlobalAction")
-        entityact = ET.SubElement(
+        element = Element("GlobalAction")
+        entityact = SubElement(
             element, "EntityAction", attrib=self.get_attributes()
         )
-        ET.SubElement(entityact, "DeleteEntityAction")
+        SubElement(entityact, "DeleteEntityAction")
 
         return element
 
@@ -5661,12 +5658,10 @@ class TrafficSignalControllerAction(_ActionType):
         ET.Element
             The XML element representing the TrafficSignalControllerAction.
         """
-        element = ET.Element("GlobalAction")
-        infra = ET.SubElement(element, "InfrastructureAction")
-        tsa = ET.SubElement(infra, "TrafficSignalAction")
-        ET.SubElement(
-            tsa, "TrafficSignalControllerAction", self.get_attributes()
-        )
+        element = Element("GlobalAction")
+        infra = SubElement(element, "InfrastructureAction")
+        tsa = SubElement(infra, "TrafficSignalAction")
+        SubElement(tsa, "TrafficSignalControllerAction", self.get_attributes())
 
         return element
 
@@ -5838,7 +5833,7 @@ class TrafficSourceAction(_ActionType):
 
     def get_element(self) -> ET.Element:
         """Returns the elementTree of the TrafficSourceAction."""
-        element = ET.Element("GlobalAction")
+        element = Element("GlobalAction")
         traffic_attrib = {}
         if self.name and not self.isVersion(minor=0):
             traffic_attrib = {"trafficName": self.name}
@@ -5856,10 +5851,10 @@ class TrafficSourceAction(_ActionType):
                 "TrafficSourceAction with TrafficDistribution was first introduced in OSC 1.3"
             )
 
-        trafficaction = ET.SubElement(
+        trafficaction = SubElement(
             element, "TrafficAction", attrib=traffic_attrib
         )
-        sourceaction = ET.SubElement(
+        sourceaction = SubElement(
             trafficaction, "TrafficSourceAction", attrib=self.get_attributes()
         )
         sourceaction.append(self.position.get_element())
@@ -6028,14 +6023,14 @@ class TrafficSinkAction(_ActionType):
                 "TrafficSinkAction with TrafficDefinition was depricated in OSC 1.3"
             )
 
-        element = ET.Element("GlobalAction")
+        element = Element("GlobalAction")
         traffic_attrib = {}
         if self.name and not self.isVersion(minor=0):
             traffic_attrib = {"trafficName": self.name}
-        trafficaction = ET.SubElement(
+        trafficaction = SubElement(
             element, "TrafficAction", attrib=traffic_attrib
         )
-        sinkaction = ET.SubElement(
+        sinkaction = SubElement(
             trafficaction, "TrafficSinkAction", attrib=self.get_attributes()
         )
         sinkaction.append(self.position.get_element())
@@ -6287,15 +6282,15 @@ class TrafficSwarmAction(_ActionType):
         ET.Element
             The XML element representing the TrafficSwarmAction.
         """
-        element = ET.Element("GlobalAction")
+        element = Element("GlobalAction")
         traffic_attrib = {}
         if self.name and not self.isVersion(minor=0):
             traffic_attrib = {"trafficName": self.name}
-        trafficaction = ET.SubElement(
+        trafficaction = SubElement(
             element, "TrafficAction", attrib=traffic_attrib
         )
 
-        swarmaction = ET.SubElement(
+        swarmaction = SubElement(
             trafficaction, "TrafficSwarmAction", attrib=self.get_attributes()
         )
 
@@ -6312,7 +6307,7 @@ class TrafficSwarmAction(_ActionType):
                 "TrafficSourceAction with TrafficDistribution was first introduced in OSC 1.3"
             )
         swarmaction.append(self.trafficdefinition.get_element())
-        ET.SubElement(
+        SubElement(
             swarmaction,
             "CentralObject",
             attrib={"entityRef": self.centralobject},
@@ -6522,19 +6517,19 @@ class TrafficAreaAction(_ActionType):
                 "TrafficAreaAction was introduced in OpenSCENARIO V1.3"
             )
 
-        element = ET.Element("GlobalAction")
+        element = Element("GlobalAction")
         traffic_attrib = {}
         if self.name and not self.isVersion(minor=0):
             traffic_attrib = {"trafficName": self.name}
-        trafficaction = ET.SubElement(
+        trafficaction = SubElement(
             element, "TrafficAction", attrib=traffic_attrib
         )
 
-        areaaction = ET.SubElement(
+        areaaction = SubElement(
             trafficaction, "TrafficAreaAction", attrib=self.get_attributes()
         )
 
-        trafficarea = ET.SubElement(areaaction, "TrafficArea")
+        trafficarea = SubElement(areaaction, "TrafficArea")
         if isinstance(self.trafficarea, Polygon):
             trafficarea.append(self.trafficarea.get_element())
         elif isinstance(self.trafficarea, RoadRange):
@@ -6632,11 +6627,11 @@ class TrafficStopAction(_ActionType):
             The root XML element representing the GlobalAction
             with a nested TrafficAction and TrafficStopAction.
         """
-        element = ET.Element("GlobalAction")
-        trafficaction = ET.SubElement(
+        element = Element("GlobalAction")
+        trafficaction = SubElement(
             element, "TrafficAction", attrib=self.get_attributes()
         )
-        ET.SubElement(trafficaction, "TrafficStopAction")
+        SubElement(trafficaction, "TrafficStopAction")
 
         return element
 
@@ -6720,8 +6715,8 @@ class EnvironmentAction(_ActionType):
             "EnvironmentAction" sub-element with the environment details.
         """
 
-        element = ET.Element("GlobalAction")
-        envaction = ET.SubElement(element, "EnvironmentAction")
+        element = Element("GlobalAction")
+        envaction = SubElement(element, "EnvironmentAction")
         envaction.append(self.environment.get_element())
 
         return element
@@ -6805,7 +6800,7 @@ class CustomCommandAction(_ActionType):
         ET.Element
             An XML element representing the CustomCommandAction.
         """
-        element = ET.Element("CustomCommandAction", attrib={"type": self.type})
+        element = Element("CustomCommandAction", attrib={"type": self.type})
         element.text = self.content
         return element
 
@@ -6866,7 +6861,7 @@ class UserDefinedAction(_ActionType):
         xml.etree.ElementTree.Element
             The root XML element representing the UserDefinedAction.
         """
-        element = ET.Element("UserDefinedAction")
+        element = Element("UserDefinedAction")
         element.append(self.custom_command_action.get_element())
         return element
 
@@ -6945,10 +6940,8 @@ class SetMonitorAction(_ActionType):
             raise OpenSCENARIOVersionError(
                 "SetMonitorAction was introduced in OpenSCENARIO V1.3"
             )
-        element = ET.Element("GlobalAction")
-        ET.SubElement(
-            element, "SetMonitorAction", attrib=self.get_attributes()
-        )
+        element = Element("GlobalAction")
+        SubElement(element, "SetMonitorAction", attrib=self.get_attributes())
         return element
 
     @staticmethod
@@ -14,6 +14,7 @@ import xml.etree.ElementTree as ET
 from typing import Optional, Union
 from collections import namedtuple
 
+from ..helpers import Element, SubElement
 from .enumerations import (
     MiscObjectCategory,
     ObjectType,
@@ -164,7 +165,7 @@ class Axle(VersionBase):
         xml.etree.ElementTree.Element
             The ElementTree representation of the Axle.
         """
-        return ET.Element(elementname, attrib=self.get_attributes())
+        return Element(elementname, attrib=self.get_attributes())
 
 
 class Axles(VersionBase):
@@ -269,7 +270,7 @@ class Axles(VersionBase):
         xml.etree.ElementTree.Element
             The ElementTree representation of the Axles.
         """
-        element = ET.Element("Axles")
+        element = Element("Axles")
         if self.frontaxle is None and self.isVersionEqLess(minor=2):
             raise OpenSCENARIOVersionError(
                 "A front axle is required for OSC versions up to 1.2."
@@ -417,14 +418,14 @@ class Entity(VersionBase):
         xml.etree.ElementTree.Element
             The ElementTree representation of the Entity.
         """
-        element = ET.Element("EntitySelection", attrib=self.get_attributes())
-        members = ET.SubElement(element, "Members")
+        element = Element("EntitySelection", attrib=self.get_attributes())
+        members = SubElement(element, "Members")
         if self.entity:
             for entity in self.entity:
                 members.append(entity.get_element())
         if self.object_type:
             for object_type in self.object_type:
-                ET.SubElement(
+                SubElement(
                     members,
                     "ByType",
                     attrib={"objectType": object_type.get_name()},
@@ -652,7 +653,7 @@ class Pedestrian(_BaseCatalog):
         xml.etree.ElementTree.Element
             The ElementTree representation of the pedestrian.
         """
-        element = ET.Element("Pedestrian", attrib=self.get_attributes())
+        element = Element("Pedestrian", attrib=self.get_attributes())
         self.add_parameters_to_element(element)
         element.append(self.boundingbox.get_element())
         prop_obj = self.properties.get_element()
@@ -850,7 +851,7 @@ class MiscObject(_BaseCatalog):
         xml.etree.ElementTree.Element
             The ElementTree representation of the MiscObject.
         """
-        element = ET.Element("MiscObject", attrib=self.get_attributes())
+        element = Element("MiscObject", attrib=self.get_attributes())
         self.add_parameters_to_element(element)
         element.append(self.boundingbox.get_element())
         prop_obj = self.properties.get_element()
@@ -1254,7 +1255,7 @@ class Vehicle(_BaseCatalog):
         xml.etree.ElementTree.Element
             The ElementTree representation of the Vehicle.
         """
-        element = ET.Element("Vehicle", attrib=self.get_attributes())
+        element = Element("Vehicle", attrib=self.get_attributes())
         self.add_parameters_to_element(element)
         element.append(self.boundingbox.get_element())
         element.append(self.dynamics.get_element("Performance"))
@@ -1268,7 +1269,7 @@ class Vehicle(_BaseCatalog):
             element.append(self.trailer_coupler.get_element("Coupler"))
         if self.trailer is not None:
 
-            trailer_element = ET.SubElement(element, "Trailer")
+            trailer_element = SubElement(element, "Trailer")
             if isinstance(self.trailer, str):
                 trailer_element.append(
                     EntityRef(self.trailer).get_element("TrailerRef")
@@ -1359,9 +1360,7 @@ class ExternalObjectReference(VersionBase):
             raise OpenSCENARIOVersionError(
                 "ExternalObjectReference was introduced in OSC 1.1"
             )
-        return ET.Element(
-            "ExternalObjectReference", attrib=self.get_attributes()
-        )
+        return Element("ExternalObjectReference", attrib=self.get_attributes())
 
 
 class Entities(VersionBase):
@@ -1504,7 +1503,7 @@ class Entities(VersionBase):
         xml.etree.ElementTree.Element
             The ElementTree representation of the Entities.
         """
-        element = ET.Element("Entities")
+        element = Element("Entities")
         for i in self.scenario_objects:
             element.append(i.get_element())
 
@@ -1721,7 +1720,7 @@ class ScenarioObject(VersionBase):
         xml.etree.ElementTree.Element
             The ElementTree representation of the Entity.
         """
-        element = ET.Element(elementname, attrib=self.get_attributes())
+        element = Element(elementname, attrib=self.get_attributes())
 
         element.append(self.entityobject.get_element())
         if self.controller:
@@ -1731,7 +1730,7 @@ class ScenarioObject(VersionBase):
                 )
 
             for cnt in self.controller:
-                objcont = ET.SubElement(element, "ObjectController")
+                objcont = SubElement(element, "ObjectController")
                 objcont.append(cnt.get_element())
 
         return element
@@ -1911,14 +1910,14 @@ class EntityDistribution(VersionBase):
                 "EntityDistribution must contain at least one EntityDistributionEntry"
             )
 
-        element = ET.Element("EntityDistribution")
+        element = Element("EntityDistribution")
         for entry in self.entity_distribution_entries:
             # Unpack tuple: (weight, entityobject, controller)
             # weight, entityobject, controller = entry
-            entry_el = ET.Element(
+            entry_el = Element(
                 "EntityDistributionEntry", attrib={"weight": str(entry.weight)}
             )
-            scenario_object_template_element = ET.SubElement(
+            scenario_object_template_element = SubElement(
                 entry_el, "ScenarioObjectTemplate"
             )
             scenario_object_template_element.append(
@@ -1932,7 +1931,7 @@ class EntityDistribution(VersionBase):
                     else [entry.controller]
                 )
                 for cnt in controllers:
-                    objcont = ET.SubElement(
+                    objcont = SubElement(
                         scenario_object_template_element, "ObjectController"
                     )
                     objcont.append(cnt.get_element())
@@ -2031,13 +2030,13 @@ class TrafficDistribution(VersionBase):
                 "TrafficDistribution must contain at least one TrafficDistributionEntry"
             )
 
-        element = ET.Element("TrafficDistribution")
+        element = Element("TrafficDistribution")
         for (
             weight,
             entity_distribution,
             properties,
         ) in self.traffic_distribution_entries:
-            entry_el = ET.Element(
+            entry_el = Element(
                 "TrafficDistributionEntry", attrib={"weight": str(weight)}
             )
             entry_el.append(entity_distribution.get_element())
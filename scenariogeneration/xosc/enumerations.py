@@ -13,13 +13,16 @@ XMLNS = "http://www.w3.org/2001/XMLSchema-instance"
 XSI = "OpenScenario.xsd"
 
 import warnings
+import xml.etree.ElementTree as ET
+from typing import Union
 
+from ..helpers import CachedElementBase, StreamElement
 from .exceptions import OpenSCENARIOVersionError
 
 _MINOR_VERSION = 3
 
 
-class VersionBase:
+class VersionBase(CachedElementBase):
     """Base class for checking different versions of OpenSCENARIO."""
 
     version_major = 1
@@ -38,6 +41,26 @@ class VersionBase:
         VersionBase.version_major = major
         VersionBase.version_minor = minor
 
+    def _element_cache_key(self) -> tuple:
+        return super()._element_cache_key() + (
+            self.version_major,
+            self.version_minor,
+        )
+
+    def iter_xml(self) -> Union[ET.Element, StreamElement]:
+        """Returns the XML representation of the class for streaming (see
+        helpers.write_stream).
+
+        Classes with large contents return a StreamElement producing the
+        children lazily, others return get_element().
+
+        Returns
+        -------
+        ET.Element | StreamElement
+            The XML representation of the class.
+        """
+        return self.get_element()
+
 
 class _OscEnum(VersionBase):
     """Custom "enum" class to handle different versions of enums in
@@ -13,7 +13,7 @@ Copyright (c) 2022 The scenariogeneration Authors.
 import xml.etree.ElementTree as ET
 from typing import Optional, Union
 
-from ..helpers import printToFile
+from ..helpers import Element, SubElement, printToFile
 from .enumerations import _MINOR_VERSION, XMLNS, XSI, VersionBase
 from .exceptions import (
     NotAValidElement,
@@ -181,7 +181,7 @@ class Range(VersionBase):
         xml.etree.ElementTree.Element
             The ElementTree representation of the Range.
         """
-        element = ET.Element(elementname, self.get_attributes())
+        element = Element(elementname, self.get_attributes())
         return element
 
 
@@ -279,7 +279,7 @@ class _HistogramBin(VersionBase):
         xml.etree.ElementTree.Element
             The ElementTree representation of the HistogramBin.
         """
-        element = ET.Element("Bin", self.get_attributes())
+        element = Element("Bin", self.get_attributes())
         element.append(self.range.get_element())
         return element
 
@@ -373,7 +373,7 @@ class _ProbabilityDistributionSetElement(VersionBase):
             The ElementTree representation of the
             _ProbabilityDistributionSetElement.
         """
-        element = ET.Element("Element", self.get_attributes())
+        element = Element("Element", self.get_attributes())
         return element
 
 
@@ -509,11 +509,11 @@ class Stochastic(VersionBase):
         NotEnoughInputArguments
             If no distribution has been added.
         """
-        element = ET.Element("Stochastic", self.get_attributes())
+        element = Element("Stochastic", self.get_attributes())
         if not self.distributions:
             raise NotEnoughInputArguments("No distribution has been added")
         for key, value in self.distributions.items():
-            dist = ET.SubElement(
+            dist = SubElement(
                 element,
                 "StochasticDistribution",
                 attrib={"parameterName": key},
@@ -634,7 +634,7 @@ class NormalDistribution(_StochasticDistributionType):
         xml.etree.ElementTree.Element
             The ElementTree representation of the NormalDistribution.
         """
-        element = ET.Element("NormalDistribution", self.get_attributes())
+        element = Element("NormalDistribution", self.get_attributes())
         if self.range:
             element.append(self.range.get_element())
         return element
@@ -763,7 +763,7 @@ class LogNormalDistribution(_StochasticDistributionType):
             raise OpenSCENARIOVersionError(
                 "LogNormalDistribution was introduced in OSC V1.3"
             )
-        element = ET.Element("LogNormalDistribution", self.get_attributes())
+        element = Element("LogNormalDistribution", self.get_attributes())
         if self.range:
             element.append(self.range.get_element())
         return element
@@ -836,7 +836,7 @@ class UniformDistribution(_StochasticDistributionType):
         xml.etree.ElementTree.Element
             The ElementTree representation of the UniformDistribution.
         """
-        element = ET.Element("UniformDistribution")
+        element = Element("UniformDistribution")
         element.append(self.range.get_element())
         return element
 
@@ -935,7 +935,7 @@ class PoissonDistribution(_StochasticDistributionType):
         xml.etree.ElementTree.Element
             The ElementTree representation of the PoissonDistribution.
         """
-        element = ET.Element("PoissonDistribution", self.get_attributes())
+        element = Element("PoissonDistribution", self.get_attributes())
         if self.range:
             element.append(self.range.get_element())
         return element
@@ -1015,7 +1015,7 @@ class Histogram(_StochasticDistributionType):
         NotEnoughInputArguments
             If the Histogram has no bins.
         """
-        element = ET.Element("Histogram")
+        element = Element("Histogram")
         if not self.bins:
             raise NotEnoughInputArguments(
                 "The Histogram has no bins, please use add_bin to add at least one."
@@ -1101,7 +1101,7 @@ class ProbabilityDistributionSet(_StochasticDistributionType):
         NotEnoughInputArguments
             If no sets were added to the ProbabilityDistributionSet.
         """
-        element = ET.Element("ProbabilityDistributionSet")
+        element = Element("ProbabilityDistributionSet")
         if not self.sets:
             raise NotEnoughInputArguments(
                 "No sets were added to the ProbabilityDistributionSet, please use add_set"
@@ -1188,7 +1188,7 @@ class ParameterValueSet(VersionBase):
         NotEnoughInputArguments
             If no sets have been added.
         """
-        element = ET.Element("ParameterValueSet")
+        element = Element("ParameterValueSet")
         if not self.sets:
             raise NotEnoughInputArguments("No sets have been added")
         for s in self.sets:
@@ -1285,8 +1285,8 @@ class DeterministicMultiParameterDistribution(VersionBase):
         NotEnoughInputArguments
             If no sets have been added.
         """
-        element = ET.Element("DeterministicMultiParameterDistribution")
-        value_set_element = ET.SubElement(element, "ValueSetDistribution")
+        element = Element("DeterministicMultiParameterDistribution")
+        value_set_element = SubElement(element, "ValueSetDistribution")
         if not self.sets:
             raise NotEnoughInputArguments("No sets have been added")
         for d in self.sets:
@@ -1393,7 +1393,7 @@ class DistributionRange(VersionBase):
         xml.etree.ElementTree.Element
             The ElementTree representation of the DistributionRange.
         """
-        element = ET.Element("DistributionRange", attrib=self.get_attributes())
+        element = Element("DistributionRange", attrib=self.get_attributes())
         element.append(self.range.get_element())
         return element
 
@@ -1472,13 +1472,13 @@ class DistributionSet(VersionBase):
         NotEnoughInputArguments
             If no values have been added to the DistributionSet.
         """
-        element = ET.Element("DistributionSet")
+        element = Element("DistributionSet")
         if not self.value_elements:
             raise NotEnoughInputArguments(
                 "No values have been added to the DistributionSet"
             )
         for value in self.value_elements:
-            ET.SubElement(element, "Element", attrib={"value": value})
+            SubElement(element, "Element", attrib={"value": value})
         return element
 
 
@@ -1611,11 +1611,11 @@ class Deterministic(VersionBase):
         xml.etree.ElementTree.Element
             The ElementTree representation of the Deterministic.
         """
-        element = ET.Element("Deterministic")
+        element = Element("Deterministic")
         for md in self.multi_distributions:
             element.append(md.get_element())
         for d, sing_dist in self.single_distributions.items():
-            dist = ET.SubElement(
+            dist = SubElement(
                 element,
                 "DeterministicSingleParameterDistribution",
                 attrib={"parameterName": d},
@@ -1798,7 +1798,7 @@ class ParameterValueDistribution(VersionBase):
                 "Everything related to ParameterValueDistribution was "
                 "introduced in OpenSCENARIO V1.1"
             )
-        element = ET.Element(
+        element = Element(
             "OpenSCENARIO",
             attrib={
                 "xmlns:xsi": self._XMLNS,
@@ -1806,8 +1806,8 @@ class ParameterValueDistribution(VersionBase):
             },
         )
         element.append(self.header.get_element())
-        parameterdist = ET.SubElement(element, "ParameterValueDistribution")
-        ET.SubElement(
+        parameterdist = SubElement(element, "ParameterValueDistribution")
+        SubElement(
             parameterdist,
             "ScenarioFile",
             attrib={"filepath": self.scenario_file},
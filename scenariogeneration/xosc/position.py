@@ -13,6 +13,7 @@ Copyright (c) 2022 The scenariogeneration Authors.
 import xml.etree.ElementTree as ET
 from typing import Optional, Union
 
+from ..helpers import Element, StreamElement, SubElement, is_element
 from .enumerations import RouteStrategy
 from .exceptions import (
     NotAValidElement,
@@ -237,8 +238,8 @@ class WorldPosition(_PositionType):
         xml.etree.ElementTree.Element
             The ElementTree representation of the WorldPosition.
         """
-        element = ET.Element(elementname)
-        ET.SubElement(element, "WorldPosition", attrib=self.get_attributes())
+        element = Element(elementname)
+        SubElement(element, "WorldPosition", attrib=self.get_attributes())
         return element
 
 
@@ -384,8 +385,8 @@ class RelativeWorldPosition(_PositionType):
         xml.etree.ElementTree.Element
             The ElementTree representation of the RelativeWorldPosition.
         """
-        element = ET.Element(elementname)
-        relpos = ET.SubElement(
+        element = Element(elementname)
+        relpos = SubElement(
             element, "RelativeWorldPosition", attrib=self.get_attributes()
         )
         if self.orient.is_filled():
@@ -539,8 +540,8 @@ class RelativeObjectPosition(_PositionType):
         xml.etree.ElementTree.Element
             The ElementTree representation of the RelativeObjectPosition.
         """
-        element = ET.Element(elementname)
-        relpos = ET.SubElement(
+        element = Element(elementname)
+        relpos = SubElement(
             element, "RelativeObjectPosition", attrib=self.get_attributes()
         )
         if self.orient.is_filled():
@@ -676,8 +677,8 @@ class RoadPosition(_PositionType):
         xml.etree.ElementTree.Element
             The ElementTree representation of the RoadPosition.
         """
-        element = ET.Element(elementname)
-        roadpos = ET.SubElement(
+        element = Element(elementname)
+        roadpos = SubElement(
             element, "RoadPosition", attrib=self.get_attributes()
         )
         if self.orient.is_filled():
@@ -817,8 +818,8 @@ class RelativeRoadPosition(_PositionType):
         xml.etree.ElementTree.Element
             The ElementTree representation of the RelativeRoadPosition.
         """
-        element = ET.Element(elementname)
-        roadpos = ET.SubElement(
+        element = Element(elementname)
+        roadpos = SubElement(
             element, "RelativeRoadPosition", attrib=self.get_attributes()
         )
         if self.orient.is_filled():
@@ -965,8 +966,8 @@ class LanePosition(_PositionType):
         xml.etree.ElementTree.Element
             The ElementTree representation of the LanePosition.
         """
-        element = ET.Element(elementname)
-        lanepos = ET.SubElement(
+        element = Element(elementname)
+        lanepos = SubElement(
             element, "LanePosition", attrib=self.get_attributes()
         )
         if self.orient.is_filled():
@@ -1150,8 +1151,8 @@ class RelativeLanePosition(_PositionType):
         xml.etree.ElementTree.Element
             The ElementTree representation of the RelativeLanePosition.
         """
-        element = ET.Element(elementname)
-        lanepos = ET.SubElement(
+        element = Element(elementname)
+        lanepos = SubElement(
             element, "RelativeLanePosition", attrib=self.get_attributes()
         )
         if self.orient.is_filled():
@@ -1273,13 +1274,13 @@ class RoutePositionOfCurrentEntity(_PositionType):
             The ElementTree representation of the
             RoutePositionOfCurrentEntity.
         """
-        element = ET.Element(elementname)
-        relement = ET.SubElement(element, "RoutePosition")
-        routeref = ET.SubElement(relement, "RouteRef")
+        element = Element(elementname)
+        relement = SubElement(element, "RoutePosition")
+        routeref = SubElement(relement, "RouteRef")
         routeref.append(self.route_ref.get_element())
         relement.append(self.orientation.get_element())
-        inroute = ET.SubElement(relement, "InRoutePosition")
-        ET.SubElement(
+        inroute = SubElement(relement, "InRoutePosition")
+        SubElement(
             inroute, "FromCurrentEntity", attrib={"entityRef": self.entity}
         )
         return element
@@ -1409,13 +1410,13 @@ class RoutePositionInRoadCoordinates(_PositionType):
             The ElementTree representation of the
             RoutePositionInRoadCoordinates.
         """
-        element = ET.Element(elementname)
-        relement = ET.SubElement(element, "RoutePosition")
-        routeref = ET.SubElement(relement, "RouteRef")
+        element = Element(elementname)
+        relement = SubElement(element, "RoutePosition")
+        routeref = SubElement(relement, "RouteRef")
         routeref.append(self.route_ref.get_element())
         relement.append(self.orientation.get_element())
-        inroute = ET.SubElement(relement, "InRoutePosition")
-        ET.SubElement(
+        inroute = SubElement(relement, "InRoutePosition")
+        SubElement(
             inroute,
             "FromRoadCoordinates",
             attrib={"pathS": str(self.s), "t": str(self.t)},
@@ -1562,13 +1563,13 @@ class RoutePositionInLaneCoordinates(_PositionType):
             The ElementTree representation of the
             RoutePositionInLaneCoordinates.
         """
-        element = ET.Element(elementname)
-        relement = ET.SubElement(element, "RoutePosition")
-        routeref = ET.SubElement(relement, "RouteRef")
+        element = Element(elementname)
+        relement = SubElement(element, "RoutePosition")
+        routeref = SubElement(relement, "RouteRef")
         routeref.append(self.route_ref.get_element())
         relement.append(self.orientation.get_element())
-        inroute = ET.SubElement(relement, "InRoutePosition")
-        ET.SubElement(
+        inroute = SubElement(relement, "InRoutePosition")
+        SubElement(
             inroute,
             "FromLaneCoordinates",
             attrib={
@@ -1726,11 +1727,11 @@ class TrajectoryPosition(_PositionType):
                 "TrajectoryPosition was introduced in OpenSCENARIO V1.1"
             )
 
-        element = ET.Element(elementname)
-        traj_element = ET.SubElement(
+        element = Element(elementname)
+        traj_element = SubElement(
             element, "TrajectoryPosition", attrib=self.get_attributes()
         )
-        trajref_element = ET.SubElement(traj_element, "TrajectoryRef")
+        trajref_element = SubElement(traj_element, "TrajectoryRef")
         trajref_element.append(self.trajectory.get_element())
         traj_element.append(self.orientation.get_element())
 
@@ -1909,8 +1910,8 @@ class GeoPosition(_PositionType):
             raise OpenSCENARIOVersionError(
                 "GeoPosition was introduced in OpenSCENARIO V1.1"
             )
-        element = ET.Element(elementname)
-        traj_element = ET.SubElement(
+        element = Element(elementname)
+        traj_element = SubElement(
             element, "GeoPosition", self.get_attributes()
         )
         traj_element.append(self.orientation.get_element())
@@ -2011,15 +2012,30 @@ class Polyline(_TrajectoryShape):
         xml.etree.ElementTree.Element
             The ElementTree representation of the Polyline.
         """
-        shape = ET.Element("Shape")
-        element = ET.SubElement(shape, ("Polyline"))
-        for i, pos in enumerate(self.positions):
-            time_dict = {}
-            if self.time:
-                time_dict = {"time": str(self.time[i])}
-            vert = ET.SubElement(element, "Vertex", attrib=time_dict)
-            vert.append(pos.get_element())
-        return shape
+        return self.iter_xml().to_element()
+
+    def iter_xml(self) -> StreamElement:
+        """Return the Polyline as a StreamElement, producing the vertices
+        lazily.
+
+        Returns
+        -------
+        StreamElement
+            The streamable representation of the Polyline.
+        """
+
+        def vertices():
+            for i, pos in enumerate(self.positions):
+                time_dict = {}
+                if self.time:
+                    time_dict = {"time": str(self.time[i])}
+                vert = Element("Vertex", attrib=time_dict)
+                vert.append(pos.get_element())
+                yield vert
+
+        return StreamElement(
+            "Shape", children=[StreamElement("Polyline", children=vertices())]
+        )
 
 
 class Clothoid(_TrajectoryShape):
@@ -2196,10 +2212,8 @@ class Clothoid(_TrajectoryShape):
         xml.etree.ElementTree.Element
             The ElementTree representation of the Clothoid.
         """
-        shape = ET.Element("Shape")
-        element = ET.SubElement(
-            shape, "Clothoid", attrib=self.get_attributes()
-        )
+        shape = Element("Shape")
+        element = SubElement(shape, "Clothoid", attrib=self.get_attributes())
         element.append(self.startposition.get_element())
 
         return shape
@@ -2321,7 +2335,7 @@ class ControlPoint(VersionBase):
         xml.etree.ElementTree.Element
             The ElementTree representation of the ControlPoint.
         """
-        element = ET.Element("ControlPoint", attrib=self.get_attributes())
+        element = Element("ControlPoint", attrib=self.get_attributes())
         element.append(self.position.get_element())
         return element
 
@@ -2417,7 +2431,7 @@ class Waypoint(VersionBase):
         xml.etree.ElementTree.Element
             The ElementTree representation of the Waypoint.
         """
-        element = ET.Element("Waypoint", attrib=self.get_attributes())
+        element = Element("Waypoint", attrib=self.get_attributes())
         element.append(self.position.get_element())
         return element
 
@@ -2550,7 +2564,7 @@ class Route(_BaseCatalog):
         """
         if len(self.waypoints) < 2:
             raise ValueError("Too few waypoints")
-        element = ET.Element("Route", attrib=self.get_attributes())
+        element = Element("Route", attrib=self.get_attributes())
         self.add_parameters_to_element(element)
         for w in self.waypoints:
             element.append(w.get_element())
@@ -2642,7 +2656,7 @@ class Trajectory(_BaseCatalog):
         pos_element = find_mandatory_field(element, "Shape")
         shape = _ShapeFactory.parse_shape(pos_element)
         params_element = element.find("ParameterDeclarations")
-        if type(params_element) is ET.Element:
+        if is_element(params_element):
             params = ParameterDeclarations.parse(params_element)
         else:
             params = ParameterDeclarations()
@@ -2686,15 +2700,29 @@ class Trajectory(_BaseCatalog):
         xml.etree.ElementTree.Element
             The ElementTree representation of the Trajectory.
         """
-        element = ET.Element("Trajectory", attrib=self.get_attributes())
-        self.add_parameters_to_element(element)
-        if self.shapes:
-            element.append(self.shapes.get_element())
-        else:
+        return self.iter_xml().to_element()
+
+    def iter_xml(self) -> StreamElement:
+        """Return the Trajectory as a StreamElement, producing the shape
+        lazily.
+
+        Returns
+        -------
+        StreamElement
+            The streamable representation of the Trajectory.
+        """
+        if not self.shapes:
             raise NotEnoughInputArguments(
                 "No shape has been added to the trajectory"
             )
-        return element
+
+        def children():
+            parameters = self.parameters.get_element()
+            if parameters:
+                yield parameters
+            yield self.shapes.iter_xml()
+
+        return StreamElement("Trajectory", self.get_attributes(), children())
 
 
 class Nurbs(_TrajectoryShape):
@@ -2828,8 +2856,8 @@ class Nurbs(_TrajectoryShape):
         xml.etree.ElementTree.Element
             The ElementTree representation of the Nurbs.
         """
-        shape = ET.Element("Shape")
-        element = ET.SubElement(shape, "Nurbs", attrib=self.get_attributes())
+        shape = Element("Shape")
+        element = SubElement(shape, "Nurbs", attrib=self.get_attributes())
         if (len(self.controlpoints) + self.order) != len(self.knots):
             raise ValueError(
                 "Number of knots is not equal to the number of contactpoints + order"
@@ -2837,7 +2865,7 @@ class Nurbs(_TrajectoryShape):
         for c in self.controlpoints:
             element.append(c.get_element())
         for k in self.knots:
-            ET.SubElement(element, "Knot", attrib={"value": str(k)})
+            SubElement(element, "Knot", attrib={"value": str(k)})
 
         return shape
 
@@ -2909,7 +2937,7 @@ class Polygon(VersionBase):
                 "Polygon was introduced in OpenSCENARIO V1.3"
             )
 
-        element = ET.Element("Polygon")
+        element = Element("Polygon")
         for pos in self.positions:
             element.append(pos.get_element())
         return element
@@ -3032,16 +3060,16 @@ class RoadRange(VersionBase):
                 "At least two road cursors are required for a RoadRange"
             )
 
-        element = ET.Element("RoadRange", attrib=self.get_attributes())
+        element = Element("RoadRange", attrib=self.get_attributes())
 
         for roadid, s, lanes in self.roadcursors:
             road_cursor_attributes = {"roadId": str(roadid), "s": str(s)}
-            cursor_el = ET.SubElement(
+            cursor_el = SubElement(
                 element, "RoadCursor", attrib=road_cursor_attributes
             )
             if lanes is not None:
                 for lane in lanes:
-                    ET.SubElement(cursor_el, "Lane", {"id": str(lane)})
+                    SubElement(cursor_el, "Lane", {"id": str(lane)})
         return element
 
 
@@ -3179,7 +3207,7 @@ class ClothoidSplineSegment(VersionBase):
             raise OpenSCENARIOVersionError(
                 "ClothoidSplineSegment was introduced in OpenSCENARIO V1.3"
             )
-        element = ET.Element(
+        element = Element(
             "ClothoidSplineSegment", attrib=self.get_attributes()
         )
         if self.position_start:
@@ -3294,8 +3322,8 @@ class ClothoidSpline(_TrajectoryShape):
                 "ClothoidSpline was introduced in OpenSCENARIO V1.3"
             )
 
-        shape = ET.Element("Shape")
-        element = ET.SubElement(
+        shape = Element("Shape")
+        element = SubElement(
             shape, "ClothoidSpline", attrib=self.get_attributes()
         )
         for segment in self.segments:
@@ -14,7 +14,13 @@ import datetime
 import xml.etree.ElementTree as ET
 from typing import Optional
 
-from ..helpers import printToFile
+from ..helpers import (
+    Element,
+    StreamElement,
+    SubElement,
+    printToFile,
+    write_stream,
+)
 from .entities import Entities
 from .enumerations import _MINOR_VERSION, XMLNS, XSI, VersionBase
 from .exceptions import NotEnoughInputArguments, OpenSCENARIOVersionError
@@ -267,27 +273,59 @@ class Scenario(VersionBase):
         xml.etree.ElementTree.Element
             The ElementTree representation of the Scenario.
         """
-        element = ET.Element(
+        return self.iter_xml().to_element()
+
+    def iter_xml(self) -> StreamElement:
+        """Returns the Scenario as a StreamElement, producing the parts of
+        the scenario (and each story of the storyboard) when they are
+        written.
+
+        Returns
+        -------
+        StreamElement
+            The streamable representation of the Scenario.
+        """
+
+        def children():
+            yield self.header.get_element()
+            parameters = self.parameters.get_element()
+            if parameters:
+                yield parameters
+            if self.variable_declaration:
+                yield self.variable_declaration.get_element()
+            if self.monitor_declarations:
+                if self.isVersionEqLarger(minor=3):
+                    yield self.monitor_declarations.get_element()
+            yield self.catalog.get_element()
+            yield self.roadnetwork.get_element()
+            yield self.entities.get_element()
+            yield self.storyboard.iter_xml()
+
+        return StreamElement(
             "OpenSCENARIO",
-            attrib={
+            {
                 "xmlns:xsi": self._XMLNS,
                 "xsi:noNamespaceSchemaLocation": self._XSI,
             },
+            children(),
         )
-        element.append(self.header.get_element())
-        if self.parameters.get_element():
-            element.append(self.parameters.get_element())
-        if self.variable_declaration:
-            element.append(self.variable_declaration.get_element())
-        if self.monitor_declarations:
-            if self.isVersionEqLarger(minor=3):
-                element.append(self.monitor_declarations.get_element())
-        element.append(self.catalog.get_element())
-        element.append(self.roadnetwork.get_element())
-        element.append(self.entities.get_element())
-        element.append(self.storyboard.get_element())
-
-        return element
+
+    def write_stream(
+        self, file_handle, prettyprint: bool = True, encoding: str = "utf-8"
+    ) -> None:
+        """Writes the OpenSCENARIO XML to a (binary) file handle, one story
+        at a time, without building the full ElementTree.
+
+        Parameters
+        ----------
+        file_handle : BinaryIO
+            The file handle to write to.
+        prettyprint : bool, optional
+            Pretty print or ugly print? Default is True.
+        encoding : str, optional
+            Specifies the output encoding. Default is 'utf-8'.
+        """
+        write_stream(self.iter_xml(), file_handle, prettyprint, encoding)
 
     def write_xml(
         self, filename: str, prettyprint: bool = True, encoding: str = "utf-8"
@@ -303,7 +341,7 @@ class Scenario(VersionBase):
         encoding : str, optional
             Specifies the output encoding. Default is 'utf-8'.
         """
-        printToFile(self.get_element(), filename, prettyprint, encoding)
+        printToFile(self.iter_xml(), filename, prettyprint, encoding)
 
 
 class RoadNetwork(VersionBase):
@@ -453,17 +491,13 @@ class RoadNetwork(VersionBase):
         xml.etree.ElementTree.Element
             The ElementTree representation of the RoadNetwork.
         """
-        roadnetwork = ET.Element("RoadNetwork")
+        roadnetwork = Element("RoadNetwork")
         if self.road_file:
-            ET.SubElement(
-                roadnetwork, "LogicFile", {"filepath": self.road_file}
-            )
+            SubElement(roadnetwork, "LogicFile", {"filepath": self.road_file})
         if self.scene:
-            ET.SubElement(
-                roadnetwork, "SceneGraphFile", {"filepath": self.scene}
-            )
+            SubElement(roadnetwork, "SceneGraphFile", {"filepath": self.scene})
         if self.traffic_signals:
-            trafsign_element = ET.SubElement(roadnetwork, "TrafficSignals")
+            trafsign_element = SubElement(roadnetwork, "TrafficSignals")
             for ts in self.traffic_signals:
                 trafsign_element.append(ts.get_element())
         if len(self.used_area_positions) == 1:
@@ -476,7 +510,7 @@ class RoadNetwork(VersionBase):
                 "was introduced in OpenSCENARIO V1.1"
             )
         if len(self.used_area_positions) > 1 and not self.isVersion(minor=0):
-            usedarea = ET.SubElement(roadnetwork, "UsedArea")
+            usedarea = SubElement(roadnetwork, "UsedArea")
             for p in self.used_area_positions:
                 usedarea.append(p.get_element())
 
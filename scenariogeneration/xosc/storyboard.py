@@ -13,6 +13,7 @@ Copyright (c) 2022 The scenariogeneration Authors.
 import xml.etree.ElementTree as ET
 from typing import List, Optional, Union
 
+from ..helpers import Element, StreamElement, SubElement
 from .actions import (
     CustomCommandAction,
     _Action,
@@ -209,7 +210,7 @@ class Event(VersionBase):
         if self.isVersion(minor=0) and not self.trigger:
             raise ValueError("no trigger set")
 
-        element = ET.Element("Event", attrib=self.get_attributes())
+        element = Element("Event", attrib=self.get_attributes())
         for action in self.action:
             element.append(action.get_element())
         if self.trigger:
@@ -353,8 +354,8 @@ class Init(VersionBase):
         xml.etree.ElementTree.Element
             The ElementTree representation of the Init.
         """
-        element = ET.Element("Init")
-        actions = ET.SubElement(element, "Actions")
+        element = Element("Init")
+        actions = SubElement(element, "Actions")
 
         # add global actions
         for i in self.global_actions:
@@ -366,9 +367,7 @@ class Init(VersionBase):
 
         # add private actions
         for key, val in self.initactions.items():
-            private = ET.SubElement(
-                actions, "Private", attrib={"entityRef": key}
-            )
+            private = SubElement(actions, "Private", attrib={"entityRef": key})
             for j in val:
                 private.append(j.get_element())
 
@@ -475,7 +474,7 @@ class _Actors(VersionBase):
         xml.etree.ElementTree.Element
             The ElementTree representation of the _Actors.
         """
-        element = ET.Element("Actors", attrib=self.get_attributes())
+        element = Element("Actors", attrib=self.get_attributes())
         for ent in self.actors:
             element.append(ent.get_element())
         return element
@@ -610,7 +609,7 @@ class Maneuver(_BaseCatalog):
         if not self.events:
             raise ValueError("no events added to the maneuver")
 
-        element = ET.Element("Maneuver", attrib=self.get_attributes())
+        element = Element("Maneuver", attrib=self.get_attributes())
         self.add_parameters_to_element(element)
         for event in self.events:
             element.append(event.get_element())
@@ -764,7 +763,7 @@ class ManeuverGroup(VersionBase):
         xml.etree.ElementTree.Element
             The ElementTree representation of the ManeuverGroup.
         """
-        element = ET.Element("ManeuverGroup", attrib=self.get_attributes())
+        element = Element("ManeuverGroup", attrib=self.get_attributes())
         element.append(self.actors.get_element())
         for man in self.maneuvers:
             element.append(man.get_element())
@@ -972,7 +971,7 @@ class Act(VersionBase):
         """
         if not self.maneuvergroup:
             raise ValueError("no maneuver group added to the act")
-        element = ET.Element("Act", attrib=self.get_attributes())
+        element = Element("Act", attrib=self.get_attributes())
         for mangr in self.maneuvergroup:
             element.append(mangr.get_element())
         starttrigger = self.starttrigger
@@ -1113,14 +1112,27 @@ class Story(VersionBase):
         xml.etree.ElementTree.Element
             The ElementTree representation of the Story.
         """
-        element = ET.Element("Story", attrib=self.get_attributes())
-        if self.parameter.get_element():
-            element.append(self.parameter.get_element())
+        return self.iter_xml().to_element()
+
+    def iter_xml(self) -> StreamElement:
+        """Returns the Story as a StreamElement, producing the acts lazily.
+
+        Returns
+        -------
+        StreamElement
+            The streamable representation of the Story.
+        """
         if not self.acts:
             raise ValueError("no acts added to the story")
-        for a in self.acts:
-            element.append(a.get_element())
-        return element
+
+        def children():
+            parameters = self.parameter.get_element()
+            if parameters:
+                yield parameters
+            for a in self.acts:
+                yield a.get_element()
+
+        return StreamElement("Story", self.get_attributes(), children())
 
 
 class StoryBoard(VersionBase):
@@ -1391,19 +1403,30 @@ class StoryBoard(VersionBase):
         xml.etree.ElementTree.Element
             The ElementTree representation of the StoryBoard.
         """
-        element = ET.Element("Storyboard")
-        element.append(self.init.get_element())
+        return self.iter_xml().to_element()
+
+    def iter_xml(self) -> StreamElement:
+        """Returns the StoryBoard as a StreamElement, producing each story
+        when it is written.
 
+        Returns
+        -------
+        StreamElement
+            The streamable representation of the StoryBoard.
+        """
         # if not self.stories:
         #     raise ValueError('no stories available for storyboard')
 
         if not self.stories and self.isVersionEqLess(minor=1):
             self.add_maneuver_group(ManeuverGroup("empty"), Trigger())
-        for story in self.stories:
-            element.append(story.get_element())
 
-        stoptrigger = self.stoptrigger
-        if stoptrigger is not None:
-            element.append(stoptrigger.get_element())
+        def children():
+            yield self.init.get_element()
+            for story in self.stories:
+                yield story.iter_xml()
 
-        return element
+            stoptrigger = self.stoptrigger
+            if stoptrigger is not None:
+                yield stoptrigger.get_element()
+
+        return StreamElement("Storyboard", children=children())
@@ -14,6 +14,7 @@ import warnings
 import xml.etree.ElementTree as ET
 from typing import Union, Optional
 
+from ..helpers import Element, SubElement
 from .enumerations import (
     ConditionEdge,
     CoordinateSystem,
@@ -348,8 +349,8 @@ class EntityTrigger(_TriggerType):
         xml.etree.ElementTree.Element
             The XML element representing the EntityTrigger.
         """
-        condition = ET.Element("Condition", attrib=self.get_attributes())
-        byentity = ET.SubElement(condition, "ByEntityCondition")
+        condition = Element("Condition", attrib=self.get_attributes())
+        byentity = SubElement(condition, "ByEntityCondition")
         byentity.append(self.triggerentity.get_element())
         byentity.append(self.entitycondition.get_element())
 
@@ -357,20 +358,20 @@ class EntityTrigger(_TriggerType):
             return condition
         # Could create a new Trigger ConditionGroup here, but went with
         # this solution for now.
-        element = ET.Element(self._triggerpoint)
-        condgroup = ET.SubElement(element, "ConditionGroup")
+        element = Element(self._triggerpoint)
+        condgroup = SubElement(element, "ConditionGroup")
         condgroup.append(condition)
         return element
-        condition = ET.Element("Condition", attrib=self.get_attributes())
-        byentity = ET.SubElement(condition, "ByEntityCondition")
+        condition = Element("Condition", attrib=self.get_attributes())
+        byentity = SubElement(condition, "ByEntityCondition")
         byentity.append(self.triggerentity.get_element())
         byentity.append(self.entitycondition.get_element())
 
         if self._used_by_parent:
             return condition
         # could create a new Trigger ConditionGroup here, but went with this solution for now
-        element = ET.Element(self._triggerpoint)
-        condgroup = ET.SubElement(element, "ConditionGroup")
+        element = Element(self._triggerpoint)
+        condgroup = SubElement(element, "ConditionGroup")
         condgroup.append(condition)
         return element
 
@@ -556,14 +557,14 @@ class ValueTrigger(_TriggerType):
         xml.etree.ElementTree.Element
             The XML element representing the LaneOffsetAction.
         """
-        condition = ET.Element("Condition", attrib=self.get_attributes())
-        byvalue = ET.SubElement(condition, "ByValueCondition")
+        condition = Element("Condition", attrib=self.get_attributes())
+        byvalue = SubElement(condition, "ByValueCondition")
         byvalue.append(self.valuecondition.get_element())
         if self._used_by_parent:
             return condition
         # could create a new Trigger ConditionGroup here, but went with this solution for now
-        element = ET.Element(self._triggerpoint)
-        condgroup = ET.SubElement(element, "ConditionGroup")
+        element = Element(self._triggerpoint)
+        condgroup = SubElement(element, "ConditionGroup")
         condgroup.append(condition)
         return element
 
@@ -710,7 +711,7 @@ class ConditionGroup(_TriggerType):
 
         if not self.conditions:
             raise ValueError("No conditions were added to the ConditionGroup")
-        condgroup = ET.Element("ConditionGroup")
+        condgroup = Element("ConditionGroup")
 
         for c in self.conditions:
             condgroup.append(c.get_element())
@@ -718,7 +719,7 @@ class ConditionGroup(_TriggerType):
         if self._used_by_parent:
             return condgroup
         # could create a new Trigger here, but went with this solution for now
-        element = ET.Element(self._triggerpoint)
+        element = Element(self._triggerpoint)
         element.append(condgroup)
         return element
 
@@ -857,7 +858,7 @@ class Trigger(_TriggerType):
             condition groups.
         """
 
-        element = ET.Element(self._triggerpoint)
+        element = Element(self._triggerpoint)
         for c in self.conditiongroups:
             element.append(c.get_element())
         return element
@@ -977,9 +978,7 @@ class TriggeringEntities(VersionBase):
         xml.etree.ElementTree.Element
             The XML element representing the LaneOffsetAction.
         """
-        element = ET.Element(
-            "TriggeringEntities", attrib=self.get_attributes()
-        )
+        element = Element("TriggeringEntities", attrib=self.get_attributes())
         if len(self.entity) == 0:
             raise NotEnoughInputArguments(
                 "No TriggereingEntities has been added"
@@ -1073,10 +1072,8 @@ class EndOfRoadCondition(_EntityTriggerType):
         xml.etree.ElementTree.Element
             The XML element representing the EndOfRoadCondition.
         """
-        element = ET.Element("EntityCondition")
-        ET.SubElement(
-            element, "EndOfRoadCondition", attrib=self.get_attributes()
-        )
+        element = Element("EntityCondition")
+        SubElement(element, "EndOfRoadCondition", attrib=self.get_attributes())
         return element
 
 
@@ -1157,12 +1154,12 @@ class CollisionCondition(_EntityTriggerType):
         ET.Element
             The root XML element for the CollisionCondition.
         """
-        element = ET.Element("EntityCondition")
-        colcond = ET.SubElement(element, "CollisionCondition")
+        element = Element("EntityCondition")
+        colcond = SubElement(element, "CollisionCondition")
         if isinstance(self.entity, str):
             colcond.append(EntityRef(self.entity).get_element())
         else:
-            ET.SubElement(colcond, "ByType", {"type": self.entity.get_name()})
+            SubElement(colcond, "ByType", {"type": self.entity.get_name()})
         return element
 
 
@@ -1243,10 +1240,8 @@ class OffroadCondition(_EntityTriggerType):
         xml.etree.ElementTree.Element
             The XML element representing the OffroadCondition.
         """
-        element = ET.Element("EntityCondition")
-        ET.SubElement(
-            element, "OffroadCondition", attrib=self.get_attributes()
-        )
+        element = Element("EntityCondition")
+        SubElement(element, "OffroadCondition", attrib=self.get_attributes())
         return element
 
 
@@ -1440,8 +1435,8 @@ class TimeHeadwayCondition(_EntityTriggerType):
 
     def get_element(self) -> ET.Element:
         """Returns the elementTree of the TimeHeadwayCondition."""
-        element = ET.Element("EntityCondition")
-        ET.SubElement(
+        element = Element("EntityCondition")
+        SubElement(
             element, "TimeHeadwayCondition", attrib=self.get_attributes()
         )
         return element
@@ -1710,12 +1705,12 @@ class TimeToCollisionCondition(_EntityTriggerType):
         ET.Element
             The XML element representing the TimeToCollisionCondition.
         """
-        element = ET.Element("EntityCondition")
-        collisionevent = ET.SubElement(
+        element = Element("EntityCondition")
+        collisionevent = SubElement(
             element, "TimeToCollisionCondition", attrib=self.get_attributes()
         )
 
-        targetelement = ET.SubElement(
+        targetelement = SubElement(
             collisionevent, "TimeToCollisionConditionTarget"
         )
 
@@ -1851,8 +1846,8 @@ class AccelerationCondition(_EntityTriggerType):
         xml.etree.ElementTree.Element
             The XML element representing the AccelerationCondition.
         """
-        element = ET.Element("EntityCondition")
-        ET.SubElement(
+        element = Element("EntityCondition")
+        SubElement(
             element, "AccelerationCondition", attrib=self.get_attributes()
         )
         return element
@@ -1937,8 +1932,8 @@ class StandStillCondition(_EntityTriggerType):
         xml.etree.ElementTree.Element
             The XML element representing the StandStillCondition.
         """
-        element = ET.Element("EntityCondition")
-        ET.SubElement(
+        element = Element("EntityCondition")
+        SubElement(
             element, "StandStillCondition", attrib=self.get_attributes()
         )
         return element
@@ -2060,8 +2055,8 @@ class SpeedCondition(_EntityTriggerType):
         xml.etree.ElementTree.Element
             The XML element representing the SpeedCondition.
         """
-        element = ET.Element("EntityCondition")
-        ET.SubElement(element, "SpeedCondition", attrib=self.get_attributes())
+        element = Element("EntityCondition")
+        SubElement(element, "SpeedCondition", attrib=self.get_attributes())
         return element
 
 
@@ -2204,8 +2199,8 @@ class RelativeSpeedCondition(_EntityTriggerType):
             </EntityCondition>
         """
         """Returns the elementTree of the RelativeSpeedCondition."""
-        element = ET.Element("EntityCondition")
-        ET.SubElement(
+        element = Element("EntityCondition")
+        SubElement(
             element, "RelativeSpeedCondition", attrib=self.get_attributes()
         )
         return element
@@ -2293,8 +2288,8 @@ class TraveledDistanceCondition(_EntityTriggerType):
             a TraveledDistanceCondition as a child element.
         """
         """Returns the elementTree of the TraveledDistanceCondition."""
-        element = ET.Element("EntityCondition")
-        ET.SubElement(
+        element = Element("EntityCondition")
+        SubElement(
             element, "TraveledDistanceCondition", attrib=self.get_attributes()
         )
         return element
@@ -2393,8 +2388,8 @@ class ReachPositionCondition(_EntityTriggerType):
         xml.etree.ElementTree.Element
             The XML element representing the ReachPositionCondition.
         """
-        element = ET.Element("EntityCondition")
-        reachposcond = ET.SubElement(
+        element = Element("EntityCondition")
+        reachposcond = SubElement(
             element, "ReachPositionCondition", attrib=self.get_attributes()
         )
         reachposcond.append(self.position.get_element())
@@ -2625,8 +2620,8 @@ class DistanceCondition(_EntityTriggerType):
             The XML element representing the DistanceCondition.
         """
 
-        element = ET.Element("EntityCondition")
-        distancecond = ET.SubElement(
+        element = Element("EntityCondition")
+        distancecond = SubElement(
             element, "DistanceCondition", attrib=self.get_attributes()
         )
         distancecond.append(self.position.get_element())
@@ -2833,8 +2828,8 @@ class RelativeDistanceCondition(_EntityTriggerType):
         ET.Element
             The XML element representing the RelativeDistanceCondition.
         """
-        element = ET.Element("EntityCondition")
-        ET.SubElement(
+        element = Element("EntityCondition")
+        SubElement(
             element, "RelativeDistanceCondition", attrib=self.get_attributes()
         )
         return element
@@ -3026,12 +3021,12 @@ class RelativeClearanceCondition(_EntityTriggerType):
             raise OpenSCENARIOVersionError(
                 "RelativeClearanceCondition was added in OSC 1.2"
             )
-        element = ET.Element("EntityCondition")
-        relative_clearence_element = ET.SubElement(
+        element = Element("EntityCondition")
+        relative_clearence_element = SubElement(
             element, "RelativeClearanceCondition", attrib=self.get_attributes()
         )
         for r in self.lane_ranges:
-            ET.SubElement(
+            SubElement(
                 relative_clearence_element,
                 "RelativeLaneRange",
                 {"from": str(r[0]), "to": str(r[1])},
@@ -3142,7 +3137,7 @@ class ParameterCondition(_ValueTriggerType):
         xml.etree.ElementTree.Element
             The XML element representing the ParameterCondition.
         """
-        return ET.Element("ParameterCondition", attrib=self.get_attributes())
+        return Element("ParameterCondition", attrib=self.get_attributes())
 
 
 class VariableCondition(_ValueTriggerType):
@@ -3244,7 +3239,7 @@ class VariableCondition(_ValueTriggerType):
             raise OpenSCENARIOVersionError(
                 "VariableCondition was added in OSC 1.2"
             )
-        return ET.Element("VariableCondition", attrib=self.get_attributes())
+        return Element("VariableCondition", attrib=self.get_attributes())
 
 
 class TimeOfDayCondition(_ValueTriggerType):
@@ -3396,7 +3391,7 @@ class TimeOfDayCondition(_ValueTriggerType):
         ET.Element
             The XML element representing the TimeOfDayCondition.
         """
-        return ET.Element("TimeOfDayCondition", attrib=self.get_attributes())
+        return Element("TimeOfDayCondition", attrib=self.get_attributes())
 
 
 class SimulationTimeCondition(_ValueTriggerType):
@@ -3487,9 +3482,7 @@ class SimulationTimeCondition(_ValueTriggerType):
         ET.Element
             The XML element representing the SimulationTimeCondition.
         """
-        return ET.Element(
-            "SimulationTimeCondition", attrib=self.get_attributes()
-        )
+        return Element("SimulationTimeCondition", attrib=self.get_attributes())
 
 
 class StoryboardElementStateCondition(_ValueTriggerType):
@@ -3597,7 +3590,7 @@ class StoryboardElementStateCondition(_ValueTriggerType):
         ET.Element
             The XML element representing the StoryboardElementStateCondition.
         """
-        return ET.Element(
+        return Element(
             "StoryboardElementStateCondition", attrib=self.get_attributes()
         )
 
@@ -3697,7 +3690,7 @@ class UserDefinedValueCondition(_ValueTriggerType):
         ET.Element
             The XML element representing the UserDefinedValueCondition.
         """
-        return ET.Element(
+        return Element(
             "UserDefinedValueCondition", attrib=self.get_attributes()
         )
 
@@ -3787,9 +3780,7 @@ class TrafficSignalCondition(_ValueTriggerType):
         ET.Element
             The XML element representing the TrafficSignalCondition.
         """
-        return ET.Element(
-            "TrafficSignalCondition", attrib=self.get_attributes()
-        )
+        return Element("TrafficSignalCondition", attrib=self.get_attributes())
 
 
 class TrafficSignalControllerCondition(_ValueTriggerType):
@@ -3865,7 +3856,7 @@ class TrafficSignalControllerCondition(_ValueTriggerType):
 
     def get_element(self) -> ET.Element:
         """Returns the elementTree of the TrafficSignalControllerCondition."""
-        return ET.Element(
+        return Element(
             "TrafficSignalControllerCondition", attrib=self.get_attributes()
         )
 
@@ -3980,8 +3971,8 @@ class AngleCondition(_EntityTriggerType):
             raise OpenSCENARIOVersionError(
                 "AngleCondition was added in OSC 1.3"
             )
-        element = ET.Element("EntityCondition")
-        ET.SubElement(element, "AngleCondition", attrib=self.get_attributes())
+        element = Element("EntityCondition")
+        SubElement(element, "AngleCondition", attrib=self.get_attributes())
         return element
 
 
@@ -4106,8 +4097,8 @@ class RelativeAngleCondition(_EntityTriggerType):
             raise OpenSCENARIOVersionError(
                 "RelativeAngleCondition was added in OSC 1.3"
             )
-        element = ET.Element("EntityCondition")
-        ET.SubElement(
+        element = Element("EntityCondition")
+        SubElement(
             element, "RelativeAngleCondition", attrib=self.get_attributes()
         )
         return element
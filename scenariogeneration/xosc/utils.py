@@ -15,7 +15,13 @@ import warnings
 import xml.etree.ElementTree as ET
 from typing import Any, Optional, Type, Union
 
-from ..helpers import printToFile
+from ..helpers import (
+    Element,
+    SubElement,
+    get_creation_date,
+    parse_file,
+    printToFile,
+)
 from .enumerations import (
     _MINOR_VERSION,
     XMLNS,
@@ -234,7 +240,7 @@ class Properties(VersionBase):
         ET.Element
             The ElementTree representation of the Properties.
         """
-        element = ET.Element("Properties")
+        element = Element("Properties")
         if (
             len(self.files) == 0
             and len(self.properties) == 0
@@ -242,11 +248,11 @@ class Properties(VersionBase):
         ):
             return None
         for p in self.properties:
-            ET.SubElement(
+            SubElement(
                 element, "Property", attrib={"name": p[0], "value": p[1]}
             )
         for f in self.files:
-            ET.SubElement(element, "File", attrib={"filepath": f})
+            SubElement(element, "File", attrib={"filepath": f})
 
         return element
 
@@ -349,7 +355,7 @@ class ValueConstraint(VersionBase):
             raise OpenSCENARIOVersionError(
                 "ValueConstraint was introduced in OpenSCENARIO V1.1"
             )
-        element = ET.Element("ValueConstraint", attrib=self.get_attributes())
+        element = Element("ValueConstraint", attrib=self.get_attributes())
         return element
 
 
@@ -462,7 +468,7 @@ class BoundingBox(VersionBase):
         ET.Element
             The ElementTree representation of the BoundingBox.
         """
-        element = ET.Element("BoundingBox")
+        element = Element("BoundingBox")
         element.append(self.center.get_element())
         element.append(self.boundingbox.get_element())
         return element
@@ -554,7 +560,7 @@ class ValueConstraintGroup(VersionBase):
             raise OpenSCENARIOVersionError(
                 "ValueConstraintGroup was introduced in OpenSCENARIO V1.1"
             )
-        element = ET.Element("ConstraintGroup")
+        element = Element("ConstraintGroup")
         if not self.value_constraints:
             raise ValueError(
                 "No Value Constraints in the Value Contraint Group"
@@ -703,9 +709,7 @@ class Parameter(VersionBase):
         ET.Element
             The ElementTree representation of the Parameter.
         """
-        element = ET.Element(
-            "ParameterDeclaration", attrib=self.get_attributes()
-        )
+        element = Element("ParameterDeclaration", attrib=self.get_attributes())
         if self.constraint_groups:
             for constraint_group in self.constraint_groups:
                 element.append(constraint_group.get_element())
@@ -821,9 +825,7 @@ class Variable(VersionBase):
             raise OpenSCENARIOVersionError(
                 "Variables were introduced in OSC 1.2"
             )
-        element = ET.Element(
-            "VariableDeclaration", attrib=self.get_attributes()
-        )
+        element = Element("VariableDeclaration", attrib=self.get_attributes())
         return element
 
 
@@ -1040,9 +1042,9 @@ class CatalogReference(VersionBase):
         ET.Element
             The ElementTree representation of the CatalogReference.
         """
-        element = ET.Element("CatalogReference", attrib=self.get_attributes())
+        element = Element("CatalogReference", attrib=self.get_attributes())
         if self.parameterassignments:
-            parameterassigns = ET.SubElement(element, "ParameterAssignments")
+            parameterassigns = SubElement(element, "ParameterAssignments")
             for parass in self.parameterassignments:
                 parameterassigns.append(parass.get_element())
         return element
@@ -1186,7 +1188,7 @@ class Controller(_BaseCatalog):
         ET.Element
             The ElementTree representation of the Controller.
         """
-        element = ET.Element("Controller", attrib=self.get_attributes())
+        element = Element("Controller", attrib=self.get_attributes())
         self.add_parameters_to_element(element)
         prop_obj = self.properties.get_element()
         if prop_obj is not None:
@@ -1275,7 +1277,7 @@ class ParameterDeclarations(VersionBase):
             or None if no parameters exist.
         """
         if self.parameters:
-            element = ET.Element("ParameterDeclarations")
+            element = Element("ParameterDeclarations")
             for p in self.parameters:
                 element.append(p.get_element())
             return element
@@ -1365,7 +1367,7 @@ class VariableDeclarations(VersionBase):
             raise OpenSCENARIOVersionError(
                 "Variables were introduced in OSC 1.2"
             )
-        element = ET.Element("VariableDeclarations")
+        element = Element("VariableDeclarations")
         for p in self.variables:
             element.append(p.get_element())
         return element
@@ -1452,7 +1454,7 @@ class EntityRef(VersionBase):
         ET.Element
             The ElementTree representation of the EntityRef.
         """
-        return ET.Element(elementname, attrib=self.get_attributes())
+        return Element(elementname, attrib=self.get_attributes())
 
 
 class Orientation(VersionBase):
@@ -1600,7 +1602,7 @@ class Orientation(VersionBase):
         ET.Element
             The ElementTree representation of the Orientation.
         """
-        return ET.Element("Orientation", attrib=self.get_attributes())
+        return Element("Orientation", attrib=self.get_attributes())
 
 
 class TransitionDynamics(VersionBase):
@@ -1729,7 +1731,7 @@ class TransitionDynamics(VersionBase):
         ET.Element
             The ElementTree representation of the TransitionDynamics.
         """
-        return ET.Element(name, self.get_attributes())
+        return Element(name, self.get_attributes())
 
 
 class DynamicsConstraints(VersionBase):
@@ -1908,7 +1910,7 @@ class DynamicsConstraints(VersionBase):
         ET.Element
             The ElementTree representation of the DynamicsConstraints.
         """
-        return ET.Element(name, attrib=self.get_attributes())
+        return Element(name, attrib=self.get_attributes())
 
 
 class License(VersionBase):
@@ -2023,7 +2025,7 @@ class License(VersionBase):
             raise OpenSCENARIOVersionError(
                 "License was introduced in OpenSCENARIO V1.1"
             )
-        element = ET.Element("License", attrib=self.get_attributes())
+        element = Element("License", attrib=self.get_attributes())
 
         return element
 
@@ -2042,7 +2044,8 @@ class FileHeader(VersionBase):
     license : License, optional
         License (valid from OpenSCENARIO V1.1). Default is None.
     creation_date : datetime.datetime, optional
-        Optional hardcoded creation date. Default is datetime.datetime.now().
+        Optional hardcoded creation date. Default is the current time (or
+        the pinned timestamp, see helpers.set_deterministic_timestamp).
     properties : Properties, optional
         Additional info about the scenario. Default is None.
 
@@ -2094,7 +2097,8 @@ class FileHeader(VersionBase):
         license : License, optional
             License (valid from OpenSCENARIO V1.1). Default is None.
         creation_date : datetime.datetime, optional
-            Optional hardcoded creation date. Default is datetime.datetime.now().
+            Optional hardcoded creation date. Default is the current time (or
+        the pinned timestamp, see helpers.set_deterministic_timestamp).
         properties : Properties, optional
             Additional info about the scenario. Default is None.
         """
@@ -2169,7 +2173,7 @@ class FileHeader(VersionBase):
         if self.creation_date is not None:
             retdict["date"] = self.creation_date.isoformat()
         else:
-            retdict["date"] = dt.datetime.now().isoformat()
+            retdict["date"] = get_creation_date().isoformat()
         return retdict
 
     def get_element(self) -> ET.Element:
@@ -2180,7 +2184,7 @@ class FileHeader(VersionBase):
         ET.Element
             The ElementTree representation of the FileHeader.
         """
-        element = ET.Element("FileHeader", attrib=self.get_attributes())
+        element = Element("FileHeader", attrib=self.get_attributes())
         if self.license:
             if self.isVersionEqLarger(minor=1):
                 element.append(self.license.get_element())
@@ -2333,11 +2337,11 @@ class TimeReference(VersionBase):
         ET.Element
             The ElementTree representation of the TimeReference.
         """
-        element = ET.Element("TimeReference")
+        element = Element("TimeReference")
         if self._only_nones:
-            ET.SubElement(element, "None")
+            SubElement(element, "None")
         else:
-            ET.SubElement(element, "Timing", self.get_attributes())
+            SubElement(element, "Timing", self.get_attributes())
 
         return element
 
@@ -2429,7 +2433,7 @@ class _TrafficSignalState(VersionBase):
         ET.Element
             The ElementTree representation of the _TrafficSignalState.
         """
-        return ET.Element("TrafficSignalState", attrib=self.get_attributes())
+        return Element("TrafficSignalState", attrib=self.get_attributes())
 
 
 class Phase(VersionBase):
@@ -2568,7 +2572,7 @@ class Phase(VersionBase):
         ET.Element
             The ElementTree representation of the Phase.
         """
-        element = ET.Element("Phase", attrib=self.get_attributes())
+        element = Element("Phase", attrib=self.get_attributes())
         for s in self.signalstates:
             element.append(s.get_element())
         if self.traffic_group_state is not None:
@@ -2577,7 +2581,7 @@ class Phase(VersionBase):
                 raise OpenSCENARIOVersionError(
                     "TrafficSignalGroupStage was added in OSC 1.2."
                 )
-            ET.SubElement(
+            SubElement(
                 element,
                 "TrafficeSignalGroupState",
                 attrib={"state": self.traffic_group_state},
@@ -2728,7 +2732,7 @@ class TrafficSignalController(VersionBase):
         ET.Element
             The ElementTree representation of the TrafficSignalController.
         """
-        element = ET.Element(
+        element = Element(
             "TrafficSignalController", attrib=self.get_attributes()
         )
         for ph in self.phases:
@@ -2965,11 +2969,11 @@ class TrafficDefinition(VersionBase):
         if not self.vehiclecategories:
             raise ValueError("No Vehicles defined for the TrafficDefinition")
 
-        element = ET.Element("TrafficDefinition", attrib=self.get_attributes())
+        element = Element("TrafficDefinition", attrib=self.get_attributes())
 
-        veh_element = ET.SubElement(element, "VehicleCategoryDistribution")
+        veh_element = SubElement(element, "VehicleCategoryDistribution")
         for i, vehicle_category in enumerate(self.vehiclecategories):
-            ET.SubElement(
+            SubElement(
                 veh_element,
                 "VehicleCategoryDistributionEntry",
                 attrib={
@@ -2978,9 +2982,9 @@ class TrafficDefinition(VersionBase):
                 },
             )
 
-        cnt_element = ET.SubElement(element, "ControllerDistribution")
+        cnt_element = SubElement(element, "ControllerDistribution")
         for i, controller in enumerate(self.controllers):
-            tmp_controller = ET.SubElement(
+            tmp_controller = SubElement(
                 cnt_element,
                 "ControllerDistributionEntry",
                 attrib={"weight": str(self.controllerweights[i])},
@@ -2991,9 +2995,9 @@ class TrafficDefinition(VersionBase):
                 raise OpenSCENARIOVersionError(
                     "VehicleRoleDistribution was added in OSC V1.2"
                 )
-            role_element = ET.SubElement(element, "VehicleRoleDistribution")
+            role_element = SubElement(element, "VehicleRoleDistribution")
             for i, role in enumerate(self.vehicle_roles):
-                ET.SubElement(
+                SubElement(
                     role_element,
                     "VehicleRoleDistributionEntry",
                     attrib={
@@ -3090,10 +3094,10 @@ class CatalogFile(VersionBase):
         Parameters
         ----------
         filename : str
-            Path to the catalog file.
+            Path to the catalog file (.gz files are decompressed).
         """
         self.filename = filename
-        tree = ET.parse(self.filename)
+        tree = parse_file(self.filename)
         self.catalog_element = tree.getroot()
 
     def create_catalog(
@@ -3171,7 +3175,7 @@ class CatalogFile(VersionBase):
         ET.Element
             The created catalog element.
         """
-        element = ET.Element(
+        element = Element(
             "OpenSCENARIO",
             attrib={
                 "xmlns:xsi": XMLNS,
@@ -3187,7 +3191,7 @@ class CatalogFile(VersionBase):
             properties=properties,
         )
         element.append(header.get_element())
-        ET.SubElement(element, "Catalog", attrib={"name": catalogtype})
+        SubElement(element, "Catalog", attrib={"name": catalogtype})
 
         return element
 
@@ -3416,11 +3420,11 @@ class Catalog(VersionBase):
         ET.Element
             The ElementTree representation of the Catalog.
         """
-        catloc = ET.Element("CatalogLocations")
+        catloc = Element("CatalogLocations")
 
         for i, catalog in self.catalogs.items():
-            tmpel = ET.SubElement(catloc, i)
-            ET.SubElement(tmpel, "Directory", {"path": catalog})
+            tmpel = SubElement(catloc, i)
+            SubElement(tmpel, "Directory", {"path": catalog})
         return catloc
 
 
@@ -3513,7 +3517,7 @@ class ParameterAssignment(VersionBase):
         ET.Element
             The ElementTree representation of the ParameterAssignment.
         """
-        return ET.Element("ParameterAssignment", attrib=self.get_attributes())
+        return Element("ParameterAssignment", attrib=self.get_attributes())
 
 
 class TimeOfDay(VersionBase):
@@ -3664,7 +3668,7 @@ class TimeOfDay(VersionBase):
         ET.Element
             The ElementTree representation of the TimeOfDay.
         """
-        return ET.Element("TimeOfDay", attrib=self.get_attributes())
+        return Element("TimeOfDay", attrib=self.get_attributes())
 
 
 class Fog(VersionBase):
@@ -3765,7 +3769,7 @@ class Fog(VersionBase):
         ET.Element
             The ElementTree representation of the Fog.
         """
-        element = ET.Element("Fog", attrib=self.get_attributes())
+        element = Element("Fog", attrib=self.get_attributes())
         if self.bounding_box is not None:
             element.append(self.bounding_box.get_element())
 
@@ -3876,7 +3880,7 @@ class Sun(VersionBase):
         ET.Element
             The ElementTree representation of the Sun.
         """
-        element = ET.Element("Sun", attrib=self.get_attributes())
+        element = Element("Sun", attrib=self.get_attributes())
 
         return element
 
@@ -3983,7 +3987,7 @@ class Precipitation(VersionBase):
         ET.Element
             The ElementTree representation of the Precipitation.
         """
-        element = ET.Element("Precipitation", attrib=self.get_attributes())
+        element = Element("Precipitation", attrib=self.get_attributes())
 
         return element
 
@@ -4074,7 +4078,7 @@ class Wind(VersionBase):
         """
         if self.isVersion(minor=0):
             raise OpenSCENARIOVersionError("Wind was introduced in OSC 1.1")
-        element = ET.Element("Wind", attrib=self.get_attributes())
+        element = Element("Wind", attrib=self.get_attributes())
 
         return element
 
@@ -4353,7 +4357,7 @@ class Weather(VersionBase):
                 raise OpenSCENARIOVersionError(
                     "In OpenScenario 1.0, Precipitation is required."
                 )
-        element = ET.Element("Weather", attrib=self.get_attributes())
+        element = Element("Weather", attrib=self.get_attributes())
         if self.sun:
             element.append(self.sun.get_element())
         if self.fog:
@@ -4376,10 +4380,8 @@ class Weather(VersionBase):
             dome_attr = {}
             if self.dome_azimuth_offset:
                 dome_attr["azimuthOffset"] = str(self.dome_azimuth_offset)
-            dome_element = ET.SubElement(
-                element, "DomeImage", attrib=dome_attr
-            )
-            ET.SubElement(
+            dome_element = SubElement(element, "DomeImage", attrib=dome_attr)
+            SubElement(
                 dome_element, "DomeFile", attrib={"filepath": self.dome_image}
             )
         return element
@@ -4497,7 +4499,7 @@ class RoadCondition(VersionBase):
         ET.Element
             The ElementTree representation of the RoadCondition.
         """
-        element = ET.Element("RoadCondition", attrib=self.get_attributes())
+        element = Element("RoadCondition", attrib=self.get_attributes())
         if self.properties:
             element.append(self.properties.get_element())
         return element
@@ -4660,7 +4662,7 @@ class Environment(_BaseCatalog):
         ET.Element
             The ElementTree representation of the Environment.
         """
-        element = ET.Element("Environment", attrib=self.get_attributes())
+        element = Element("Environment", attrib=self.get_attributes())
         if self.timeofday:
             element.append(self.timeofday.get_element())
         if self.weather:
@@ -4763,7 +4765,7 @@ class Center(VersionBase):
         ET.Element
             The ElementTree representation of the Center.
         """
-        element = ET.Element("Center", attrib=self.get_attributes())
+        element = Element("Center", attrib=self.get_attributes())
         return element
 
 
@@ -4862,7 +4864,7 @@ class Dimensions(VersionBase):
         ET.Element
             The ElementTree representation of the Dimensions.
         """
-        element = ET.Element("Dimensions", attrib=self.get_attributes())
+        element = Element("Dimensions", attrib=self.get_attributes())
         return element
 
 
@@ -4952,7 +4954,7 @@ class TargetDistanceSteadyState(VersionBase):
             raise OpenSCENARIOVersionError(
                 "TargetDistanceSteadyState was introduced in OpenSCENARIO V1.1"
             )
-        return ET.Element(
+        return Element(
             "TargetDistanceSteadyState", attrib=self.get_attributes()
         )
 
@@ -5042,9 +5044,7 @@ class TargetTimeSteadyState(VersionBase):
             raise OpenSCENARIOVersionError(
                 "TargetTimeSteadyState was introduced in OpenSCENARIO V1.1"
             )
-        return ET.Element(
-            "TargetTimeSteadyState", attrib=self.get_attributes()
-        )
+        return Element("TargetTimeSteadyState", attrib=self.get_attributes())
 
 
 class AbsoluteSpeed(VersionBase):
@@ -5169,8 +5169,8 @@ class AbsoluteSpeed(VersionBase):
         ET.Element
             The ElementTree representation of the AbsoluteSpeed.
         """
-        elementFinalSpeed = ET.Element("FinalSpeed")
-        elementAbsoluteSpeed = ET.SubElement(
+        elementFinalSpeed = Element("FinalSpeed")
+        elementAbsoluteSpeed = SubElement(
             elementFinalSpeed, "AbsoluteSpeed", attrib=self.get_attributes()
         )
         if self.steadyState:
@@ -5178,7 +5178,7 @@ class AbsoluteSpeed(VersionBase):
                 raise OpenSCENARIOVersionError(
                     "steadyState was introduced in OpenSCENARIO V1.1"
                 )
-            ET.SubElement(
+            SubElement(
                 elementAbsoluteSpeed,
                 self.steadyState.__class__.__name__,
                 attrib=self.steadyState.get_attributes(),
@@ -5320,8 +5320,8 @@ class RelativeSpeedToMaster(VersionBase):
         ET.Element
             The ElementTree representation of the RelativeSpeedToMaster.
         """
-        elementFinalSpeed = ET.Element("FinalSpeed")
-        elementRelativeSpeed = ET.SubElement(
+        elementFinalSpeed = Element("FinalSpeed")
+        elementRelativeSpeed = SubElement(
             elementFinalSpeed,
             "RelativeSpeedToMaster",
             attrib=self.get_attributes(),
@@ -5331,7 +5331,7 @@ class RelativeSpeedToMaster(VersionBase):
                 raise OpenSCENARIOVersionError(
                     "steadyState was introduced in OpenSCENARIO V1.1"
                 )
-            ET.SubElement(
+            SubElement(
                 elementRelativeSpeed,
                 self.steadyState.__class__.__name__,
                 attrib=self.steadyState.get_attributes(),
@@ -5656,7 +5656,7 @@ class ColorRGB(_ColorDefinition):
             raise OpenSCENARIOVersionError(
                 "ColorRGB was introduced in OpenSCENARIO V1.2"
             )
-        element = ET.Element("ColorRgb", attrib=self.get_attributes())
+        element = Element("ColorRgb", attrib=self.get_attributes())
         return element
 
 
@@ -5775,7 +5775,7 @@ class ColorCMYK(_ColorDefinition):
             raise OpenSCENARIOVersionError(
                 "ColorCMYK was introduced in OpenSCENARIO V1.2"
             )
-        element = ET.Element("ColorCmyk", attrib=self.get_attributes())
+        element = Element("ColorCmyk", attrib=self.get_attributes())
         return element
 
 
@@ -5883,7 +5883,7 @@ class Color(VersionBase):
             raise OpenSCENARIOVersionError(
                 "Color was introduced in OpenSCENARIO V1.2"
             )
-        element = ET.Element("Color", attrib=self.get_attributes())
+        element = Element("Color", attrib=self.get_attributes())
         element.append(self.color_definition.get_element())
         return element
 
@@ -5956,7 +5956,7 @@ class UserDefinedLight(VersionBase):
             raise OpenSCENARIOVersionError(
                 "UserDefinedLight was introduced in OSC 1.2"
             )
-        element = ET.Element(
+        element = Element(
             "UserDefinedLight", attrib={"userDefinedLightType": self.type}
         )
         return element
@@ -6118,7 +6118,7 @@ class _LightState(VersionBase):
         ET.Element
             The ElementTree representation of the _LightState.
         """
-        element = ET.Element("LightState", attrib=self.get_attributes())
+        element = Element("LightState", attrib=self.get_attributes())
         if self.color:
             element.append(self.color.get_element())
         return element
@@ -6223,9 +6223,9 @@ class AnimationFile(_AnimationType):
                 "AnimationFile was introduced in OpenSCENARIO V1.2"
             )
 
-        element = ET.Element("AnimationFile", attrib=self.get_attributes())
+        element = Element("AnimationFile", attrib=self.get_attributes())
         if self.file:
-            ET.SubElement(element, "File", {"filepath": self.file})
+            SubElement(element, "File", {"filepath": self.file})
         return element
 
 
@@ -6322,7 +6322,7 @@ class DirectionOfTravelDistribution(VersionBase):
                 "DirectionOfTravelDistribution was introduced in OpenSCENARIO V1.2"
             )
 
-        element = ET.Element(
+        element = Element(
             "DirectionOfTravelDistribution", attrib=self.get_attributes()
         )
         return element
@@ -6417,9 +6417,7 @@ class UserDefinedAnimation(_AnimationType):
                 "UserDefinedAnimation was introduced in OpenSCENARIO V1.2"
             )
 
-        element = ET.Element(
-            "UserDefinedAnimation", attrib=self.get_attributes()
-        )
+        element = Element("UserDefinedAnimation", attrib=self.get_attributes())
         return element
 
 
@@ -6506,9 +6504,7 @@ class UserDefinedComponent(_AnimationType):
                 "UserDefinedComponent was introduced in OpenSCENARIO V1.2"
             )
 
-        element = ET.Element(
-            "UserDefinedComponent", attrib=self.get_attributes()
-        )
+        element = Element("UserDefinedComponent", attrib=self.get_attributes())
         return element
 
 
@@ -6641,11 +6637,9 @@ class PedestrianAnimation(_AnimationType):
                 "PedestrianAnimation was introduced in OpenSCENARIO V1.2"
             )
 
-        element = ET.Element(
-            "PedestrianAnimation", attrib=self.get_attributes()
-        )
+        element = Element("PedestrianAnimation", attrib=self.get_attributes())
         for gesture in self.gestures:
-            ET.SubElement(
+            SubElement(
                 element,
                 "PedestrianGesture",
                 attrib={"gesture": gesture.get_name()},
@@ -6739,7 +6733,7 @@ class _VehicleComponent(VersionBase):
                 "VehicleComponent was introduced in OpenSCENARIO V1.2"
             )
 
-        element = ET.Element("VehicleComponent", attrib=self.get_attributes())
+        element = Element("VehicleComponent", attrib=self.get_attributes())
         return element
 
 
@@ -6835,7 +6829,7 @@ class _ComponentAnimation(_AnimationType):
                 "ComponentAnimation was introduced in OpenSCENARIO V1.2"
             )
 
-        element = ET.Element("ComponentAnimation")
+        element = Element("ComponentAnimation")
         if isinstance(_VehicleComponent, type(self.component)):
             element.append(self.component.get_element())
         else:
@@ -6927,9 +6921,7 @@ class HitchCoupler(VersionBase):
             raise OpenSCENARIOVersionError(
                 f"Trailer{element_name} was " "introduced in OpenScenario 1.3"
             )
-        return ET.Element(
-            f"Trailer{element_name}", attrib=self.get_attributes()
-        )
+        return Element(f"Trailer{element_name}", attrib=self.get_attributes())
 
 
 class Monitor(VersionBase):
@@ -7032,9 +7024,7 @@ class Monitor(VersionBase):
             raise OpenSCENARIOVersionError(
                 "MonitorDeclaration was introduced in OpenSCENARIO V1.3"
             )
-        element = ET.Element(
-            "MonitorDeclaration", attrib=self.get_attributes()
-        )
+        element = Element("MonitorDeclaration", attrib=self.get_attributes())
         return element
 
 
@@ -7121,7 +7111,7 @@ class MonitorDeclarations(VersionBase):
             raise OpenSCENARIOVersionError(
                 "Monitors were introduced in OSC 1.3"
             )
-        element = ET.Element("MonitorDeclarations")
+        element = Element("MonitorDeclarations")
         for m in self.monitors:
             element.append(m.get_element())
         return element
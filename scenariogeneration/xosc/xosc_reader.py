@@ -11,52 +11,273 @@ Copyright (c) 2022 The scenariogeneration Authors.
 """
 
 import os
+import pickle
+import sqlite3
 import warnings
 import xml.etree.ElementTree as ET
+from collections import OrderedDict, namedtuple
+from multiprocessing import Pool
+from multiprocessing.pool import ThreadPool
+from pathlib import Path
 from venv import logger
 
 import xmlschema
-from pathlib import Path
+from lxml import etree
+
+from ..helpers import COMPRESSED_EXTENSION, get_library_hash, open_file
 from .entities import MiscObject, Pedestrian, Vehicle
-from .exceptions import NoCatalogFoundError, NotAValidElement
+from .exceptions import (
+    NoCatalogFoundError,
+    NotAValidElement,
+    XMLStructureError,
+)
 from .parameters import ParameterValueDistribution
 from .position import Route, Trajectory
-from .scenario import Catalog, Scenario
+from .scenario import Catalog, RoadNetwork, Scenario
 from .storyboard import Maneuver
 from .utils import (
     CatalogReference,
     Controller,
     Environment,
+    FileHeader,
     ParameterDeclarations,
     find_mandatory_field,
 )
 
 
+def _get_catalog_file(catalog_path, catalog_name):
+    """Returns the path to the catalog file, catalog_name.xosc or (if only
+    that exists) the compressed catalog_name.xosc.gz."""
+    fullpath = os.path.join(catalog_path, catalog_name + ".xosc")
+    if not os.path.exists(fullpath) and os.path.exists(
+        fullpath + COMPRESSED_EXTENSION
+    ):
+        return fullpath + COMPRESSED_EXTENSION
+    return fullpath
+
+
+# the classes of the catalog entries, by tag
+_CATALOG_ENTRY_CLASSES = {
+    "Vehicle": Vehicle,
+    "Pedestrian": Pedestrian,
+    "Controller": Controller,
+    "MiscObject": MiscObject,
+    "Environment": Environment,
+    "Maneuver": Maneuver,
+    "Trajectory": Trajectory,
+    "Route": Route,
+}
+
+
+def _is_catalog_file(filename):
+    """Returns True for .xosc and .xosc.gz files."""
+    return filename.endswith(".xosc") or filename.endswith(
+        ".xosc" + COMPRESSED_EXTENSION
+    )
+
+
+def _get_catalog_name(filename):
+    """Returns the name of a catalog file (without .xosc/.xosc.gz)."""
+    if filename.endswith(COMPRESSED_EXTENSION):
+        filename = filename[: -len(COMPRESSED_EXTENSION)]
+    return filename[: -len(".xosc")]
+
+
+def _read_catalog_file(fullpath):
+    """Parses a catalog file and all its entries.
+
+    Returns
+    -------
+        catalog_element (ET.Element): the Catalog element, None if the file
+            is not a catalog
+
+        entries (dict): the pickled entries, by name
+    """
+    with open_file(fullpath, "r", encoding="utf-8") as f:
+        catalog_element = ET.parse(f).find("Catalog")
+    if catalog_element is None:
+        return None, {}
+    entries = {}
+    for entry in catalog_element:
+        if entry.tag in _CATALOG_ENTRY_CLASSES:
+            name = entry.attrib["name"]
+            if name not in entries:
+                entries[name] = pickle.dumps(
+                    _CATALOG_ENTRY_CLASSES[entry.tag].parse(entry),
+                    pickle.HIGHEST_PROTOCOL,
+                )
+    return catalog_element, entries
+
+
+def _index_catalog(catalog_element):
+    """Indexes the entries of a Catalog element by name (the first entry of
+    a name is used, as when searching the catalog)."""
+    index = {}
+    for entry in catalog_element:
+        if entry.tag in _CATALOG_ENTRY_CLASSES:
+            index.setdefault(entry.attrib["name"], entry)
+    return index
+
+
+class CatalogCache:
+    """CatalogCache is a persistent (SQLite) cache of parsed catalog files,
+    used by CatalogLoader.load_catalog_directory.
+
+    The pickled entries of each catalog file are stored by name, and are
+    valid as long as the path, modification time and size of the file, and
+    the version of scenariogeneration (see get_library_hash), are the same.
+    No XML is stored, hence a cached catalog is used without parsing any
+    XML. The cache can be shared by several processes.
+
+    Parameters
+    ----------
+        filename (str): path to the cache file
+    """
+
+    # stored with the entries, bumped if the stored format changes
+    format_version = 3
+
+    _columns = ["path", "mtime_ns", "size", "library", "entries"]
+
+    def __init__(self, filename):
+        """Opens (or creates) the cache file.
+
+        Parameters
+        ----------
+            filename (str): path to the cache file
+        """
+        self.path = filename
+        self._library = str(self.format_version) + "-" + get_library_hash()
+        self._connection = sqlite3.connect(filename, timeout=60)
+        columns = [
+            row[1]
+            for row in self._connection.execute("PRAGMA table_info(catalogs)")
+        ]
+        if columns and columns != self._columns:
+            # created by an older version
+            self._connection.execute("DROP TABLE catalogs")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS catalogs ("
+            "path TEXT PRIMARY KEY, "
+            "mtime_ns INTEGER, "
+            "size INTEGER, "
+            "library TEXT, "
+            "entries BLOB)"
+        )
+        self._connection.commit()
+
+    def get(self, fullpath):
+        """get returns the cached entries of a catalog file, if the file has
+        not changed since they were stored.
+
+        Parameters
+        ----------
+            fullpath (str): path to the catalog file
+
+        Returns
+        -------
+            entries (dict): the pickled entries by name, None if not cached
+        """
+        stat = os.stat(fullpath)
+        row = self._connection.execute(
+            "SELECT entries FROM catalogs WHERE path = ? "
+            "AND mtime_ns = ? AND size = ? AND library = ?",
+            (
+                os.path.abspath(fullpath),
+                stat.st_mtime_ns,
+                stat.st_size,
+                self._library,
+            ),
+        ).fetchone()
+        if row is None:
+            return None
+        return pickle.loads(row[0])
+
+    def record(self, fullpath, entries, stat):
+        """record stores the entries of a catalog file.
+
+        Parameters
+        ----------
+            fullpath (str): path to the catalog file
+
+            entries (dict): the pickled entries by name
+
+            stat (os.stat_result): stat of the file before it was read
+        """
+        self._connection.execute(
+            "INSERT OR REPLACE INTO catalogs VALUES (?, ?, ?, ?, ?)",
+            (
+                os.path.abspath(fullpath),
+                stat.st_mtime_ns,
+                stat.st_size,
+                self._library,
+                pickle.dumps(entries, pickle.HIGHEST_PROTOCOL),
+            ),
+        )
+
+    def commit(self):
+        """commit writes the recorded entries to disk."""
+        self._connection.commit()
+
+    def close(self):
+        """close commits and closes the cache file."""
+        self._connection.commit()
+        self._connection.close()
+
+
 class CatalogLoader:
     """CatalogLoader makes it possible to read certain elements from a catalog.
 
+    The entries of a loaded catalog are indexed by name, and only parsed
+    when they are asked for. The most recently parsed entries are kept
+    (cache_size), and copies of them are returned.
+
+    Parameters
+    ----------
+        cache_size (int): max number of parsed entries kept, 0 to disable,
+            None for no limit
+            Default: 128
+
     Attributes
     ----------
 
-        all_catalogs (dict with all catalogs): all catalogs loaded
+        all_catalogs (dict with all catalogs): all catalogs loaded (the
+            catalogs loaded from a CatalogCache are read when all_catalogs
+            is first used)
+
+        cache_size (int): max number of parsed entries kept
 
     Methods
     -------
         load_catalog(catalog_reference,catalog_path)
             loads a catalog that can be parsed later on
 
+        load_catalog_directory(catalog_path, cache_file, number_of_threads)
+            loads all catalogs of a directory
+
         get_entry(catalog_reference)
             reads a loaded catalog and returns the object
     """
 
-    def __init__(self):
+    def __init__(self, cache_size=128):
         """CatalogLoader makes it possible to read certain elements from a
         catalog.
 
         Main use case for this is to be able to parametrize and write
         scenarios based on a catalog based entry
+
+        Parameters
+        ----------
+            cache_size (int): max number of parsed entries kept, 0 to
+                disable, None for no limit
+                Default: 128
         """
-        self.all_catalogs = {}
+        self._all_catalogs = {}
+        self._unread_catalogs = {}
+        self.cache_size = cache_size
+        self._catalog_indices = {}
+        self._parsed_entries = OrderedDict()
+        self._catalog_entries = {}
 
     def load_catalog(self, catalog_reference, catalog_path):
         """CatalogLoader makes it possible to read certain elements from a
@@ -66,20 +287,118 @@ class CatalogLoader:
         ----------
             catalog_reference (CatalogReference or str): name/reference to the catalog
 
-            catalog_path (str): path to the catalog
+            catalog_path (str): path to the catalog (catalogname.xosc, or
+                catalogname.xosc.gz if only that exists)
         """
         if isinstance(catalog_reference, CatalogReference):
-            fullpath = os.path.join(
-                catalog_path, catalog_reference.catalogname + ".xosc"
-            )
             name_ref = catalog_reference.catalogname
         else:
-            fullpath = os.path.join(catalog_path, catalog_reference + ".xosc")
             name_ref = catalog_reference
+        fullpath = _get_catalog_file(catalog_path, name_ref)
 
-        with open(fullpath, "r", encoding="utf-8") as f:
+        with open_file(fullpath, "r", encoding="utf-8") as f:
             catalog_element = find_mandatory_field(ET.parse(f), "Catalog")
-            self.all_catalogs[name_ref] = catalog_element
+        self._add_catalog(name_ref, catalog_element)
+
+    @property
+    def all_catalogs(self):
+        """all_catalogs (dict with all catalogs): all catalogs loaded"""
+        if self._unread_catalogs:
+            # loaded from a CatalogCache, the entries are already parsed
+            for name_ref, fullpath in self._unread_catalogs.items():
+                with open_file(fullpath, "r", encoding="utf-8") as f:
+                    catalog_element = find_mandatory_field(
+                        ET.parse(f), "Catalog"
+                    )
+                self._all_catalogs[name_ref] = catalog_element
+                self._catalog_indices[name_ref] = _index_catalog(
+                    catalog_element
+                )
+            self._unread_catalogs.clear()
+        return self._all_catalogs
+
+    def _add_catalog(self, name_ref, catalog_element):
+        """Adds a catalog element and indexes its entries by name."""
+        self._all_catalogs[name_ref] = catalog_element
+        self._unread_catalogs.pop(name_ref, None)
+        self._catalog_indices[name_ref] = _index_catalog(catalog_element)
+        self._catalog_entries.pop(name_ref, None)
+        for key in [k for k in self._parsed_entries if k[0] == name_ref]:
+            del self._parsed_entries[key]
+
+    def load_catalog_directory(
+        self, catalog_path, cache_file=None, number_of_threads=None
+    ):
+        """load_catalog_directory loads all catalogs (.xosc and .xosc.gz
+        files with a Catalog) of a directory, named by their filenames.
+
+        All entries of the catalogs are parsed when they are loaded. With a
+        cache_file, the parsed entries are stored in a CatalogCache, and
+        the entries of catalog files that have not changed since are not
+        parsed again.
+
+        Parameters
+        ----------
+            catalog_path (str): path to the directory
+
+            cache_file (str): path to a CatalogCache file (created if
+                needed)
+                Default: None (no cache)
+
+            number_of_threads (int): number of threads reading the catalogs
+                that are not cached
+                Default: None (os.cpu_count())
+
+        Returns
+        -------
+            catalog_names (list of str): the names of the loaded catalogs
+        """
+        filenames = {}
+        for filename in sorted(os.listdir(catalog_path)):
+            if _is_catalog_file(filename):
+                # name.xosc is used before name.xosc.gz, as in load_catalog
+                filenames.setdefault(_get_catalog_name(filename), filename)
+
+        cache = None if cache_file is None else CatalogCache(cache_file)
+        try:
+            loaded = {}
+            to_read = []
+            for name, filename in filenames.items():
+                fullpath = os.path.join(catalog_path, filename)
+                entries = None if cache is None else cache.get(fullpath)
+                if entries is None:
+                    to_read.append((name, fullpath, os.stat(fullpath)))
+                else:
+                    # the Catalog element is only read if all_catalogs is
+                    # used, a placeholder keeps the order of the catalogs
+                    self._all_catalogs[name] = None
+                    self._unread_catalogs[name] = fullpath
+                    self._catalog_indices.pop(name, None)
+                    loaded[name] = entries
+            if to_read:
+                with ThreadPool(number_of_threads) as pool:
+                    results = pool.map(
+                        _read_catalog_file,
+                        [fullpath for _, fullpath, _ in to_read],
+                    )
+                for (name, fullpath, stat), (catalog_element, entries) in zip(
+                    to_read, results
+                ):
+                    if catalog_element is None:
+                        continue
+                    self._add_catalog(name, catalog_element)
+                    loaded[name] = entries
+                    if cache is not None:
+                        cache.record(fullpath, entries, stat)
+        finally:
+            if cache is not None:
+                cache.close()
+
+        for name, entries in loaded.items():
+            for key in [k for k in self._parsed_entries if k[0] == name]:
+                del self._parsed_entries[key]
+            self._catalog_entries[name] = entries
+        return [name for name in filenames if name in loaded]
 
     def parse(self, catalog_reference):
         """Parse reads reads a specific entry from a loaded catalog.
@@ -92,40 +411,43 @@ class CatalogLoader:
         -------
             The catalog entry
         """
-        if not catalog_reference.catalogname in self.all_catalogs:
+        if catalog_reference.catalogname in self._catalog_entries:
+            entry = self._catalog_entries[catalog_reference.catalogname].get(
+                catalog_reference.entryname
+            )
+            if entry is None:
+                raise NotImplementedError(
+                    "This catalogtype is not supported yet."
+                )
+            return pickle.loads(entry)
+        if not catalog_reference.catalogname in self._all_catalogs:
             raise NoCatalogFoundError(
                 "Catalog "
                 + catalog_reference.catalogname
                 + " is not loaded yet."
             )
-        catalog = self.all_catalogs[catalog_reference.catalogname]
-        for entry in catalog:
-            if entry.tag == "Vehicle":
-                if entry.attrib["name"] == catalog_reference.entryname:
-                    return Vehicle.parse(entry)
-            elif entry.tag == "Pedestrian":
-                if entry.attrib["name"] == catalog_reference.entryname:
-                    return Pedestrian.parse(entry)
-            elif entry.tag == "Controller":
-                if entry.attrib["name"] == catalog_reference.entryname:
-                    return Controller.parse(entry)
-            elif entry.tag == "MiscObject":
-                if entry.attrib["name"] == catalog_reference.entryname:
-                    return MiscObject.parse(entry)
-            elif entry.tag == "Environment":
-                if entry.attrib["name"] == catalog_reference.entryname:
-                    return Environment.parse(entry)
-            elif entry.tag == "Maneuver":
-                if entry.attrib["name"] == catalog_reference.entryname:
-                    return Maneuver.parse(entry)
-            elif entry.tag == "Trajectory":
-                if entry.attrib["name"] == catalog_reference.entryname:
-                    return Trajectory.parse(entry)
-            elif entry.tag == "Route":
-                if entry.attrib["name"] == catalog_reference.entryname:
-                    return Route.parse(entry)
-
-        raise NotImplementedError("This catalogtype is not supported yet.")
+        key = (catalog_reference.catalogname, catalog_reference.entryname)
+        if key in self._parsed_entries:
+            self._parsed_entries.move_to_end(key)
+            return pickle.loads(self._parsed_entries[key])
+
+        entry = self._catalog_indices[catalog_reference.catalogname].get(
+            catalog_reference.entryname
+        )
+        if entry is None:
+            raise NotImplementedError("This catalogtype is not supported yet.")
+        parsed_entry = _CATALOG_ENTRY_CLASSES[entry.tag].parse(entry)
+        if self.cache_size != 0:
+            # kept pickled, unpickling is the fastest way to copy it
+            self._parsed_entries[key] = pickle.dumps(
+                parsed_entry, pickle.HIGHEST_PROTOCOL
+            )
+            if (
+                self.cache_size is not None
+                and len(self._parsed_entries) > self.cache_size
+            ):
+                self._parsed_entries.popitem(last=False)
+        return parsed_entry
 
     def read_entry(self, catalog_reference, catalog_path):
         """read_entry loads and reads a catalog directly (both load_catalog,
@@ -165,43 +487,20 @@ def CatalogReader(catalog_reference, catalog_path):
     # TODO: add a raised error if the catalog doesn't contain the correct data
     loaded_catalog = catalog_reference.catalogname
 
-    with open(
-        os.path.join(catalog_path, catalog_reference.catalogname + ".xosc"),
-        "r",
+    with open_file(
+        _get_catalog_file(catalog_path, catalog_reference.catalogname), "r"
     ) as f:
         loaded_catalog = ET.parse(f)
 
         catalog = find_mandatory_field(loaded_catalog, "Catalog")
 
         for entry in catalog:
-            if entry.tag == "Vehicle":
-                if entry.attrib["name"] == catalog_reference.entryname:
-                    return Vehicle.parse(entry)
-            elif entry.tag == "Pedestrian":
-                if entry.attrib["name"] == catalog_reference.entryname:
-                    return Pedestrian.parse(entry)
-            elif entry.tag == "Controller":
-                if entry.attrib["name"] == catalog_reference.entryname:
-                    return Controller.parse(entry)
-            elif entry.tag == "MiscObject":
-                if entry.attrib["name"] == catalog_reference.entryname:
-                    return MiscObject.parse(entry)
-            elif entry.tag == "Environment":
-                if entry.attrib["name"] == catalog_reference.entryname:
-                    return Environment.parse(entry)
-            elif entry.tag == "Maneuver":
-                if entry.attrib["name"] == catalog_reference.entryname:
-                    return Maneuver.parse(entry)
-            elif entry.tag == "Trajectory":
-                if entry.attrib["name"] == catalog_reference.entryname:
-                    return Trajectory.parse(entry)
-            elif entry.tag == "Route":
-                if entry.attrib["name"] == catalog_reference.entryname:
-                    return Route.parse(entry)
-            else:
+            if entry.tag not in _CATALOG_ENTRY_CLASSES:
                 raise NotImplementedError(
                     "This catalogtype is not supported yet."
                 )
+            if entry.attrib["name"] == catalog_reference.entryname:
+                return _CATALOG_ENTRY_CLASSES[entry.tag].parse(entry)
 
         raise NoCatalogFoundError(
             "A catalog entry with the name "
@@ -210,78 +509,439 @@ def CatalogReader(catalog_reference, catalog_path):
         )
 
 
+# order of the (top level) elements of a Scenario file
+_SCENARIO_ELEMENT_ORDER = {
+    tag: index
+    for index, tag in enumerate(
+        [
+            "FileHeader",
+            "ParameterDeclarations",
+            "VariableDeclarations",
+            "MonitorDeclarations",
+            "CatalogLocations",
+            "RoadNetwork",
+            "Entities",
+            "Storyboard",
+        ]
+    )
+}
+
+# first element after the FileHeader, by type of file
+_FILE_TYPES = {
+    "ParameterDeclarations": "Scenario",
+    "VariableDeclarations": "Scenario",
+    "MonitorDeclarations": "Scenario",
+    "CatalogLocations": "Scenario",
+    "Catalog": "Catalog",
+    "ParameterValueDistribution": "ParameterValueDistribution",
+}
+
+
+def _iterparse_top_element(file_path, tag):
+    """Reads a top level element of a xosc file with iterparse.
+
+    The file is only read until the element is complete, or until an
+    element that comes after it (in a Scenario) is found.
+
+    Parameters
+    ----------
+        file_path (str): path to the xosc file (.xosc.gz files are
+            decompressed while they are read)
+
+        tag (str): tag of the element
+
+    Returns
+    -------
+        element (ET.Element): the element, None if it is not in the file
+    """
+    position = _SCENARIO_ELEMENT_ORDER[tag]
+    depth = 0
+    with open_file(file_path, "rb") as f:
+        for event, element in ET.iterparse(f, ("start", "end")):
+            if event == "start":
+                depth += 1
+                if (
+                    depth == 2
+                    and _SCENARIO_ELEMENT_ORDER.get(element.tag, position + 1)
+                    > position
+                ):
+                    return None
+            else:
+                depth -= 1
+                if depth == 1:
+                    if element.tag == tag:
+                        return element
+                    element.clear()
+    return None
+
+
+def _read_top_element(file_path, tag):
+    """Reads a mandatory top level element of a xosc file, see
+    _iterparse_top_element."""
+    element = _iterparse_top_element(file_path, tag)
+    if element is None:
+        raise XMLStructureError(
+            f"Mandatory field {tag} not found in {file_path}"
+        )
+    return element
+
+
 def ParameterDeclarationReader(file_path):
     """ParameterDeclarationReader reads the parameter declaration of a xosc
     file and creates a ParameterDeclaration object from it.
 
+    Only the beginning of the file (until the ParameterDeclarations) is read.
+
     Parameters
     ----------
-        file_path (str): path to the xosc file wanted to be parsed
+        file_path (str): path to the xosc file wanted to be parsed (.xosc.gz
+            files are decompressed while they are read)
     """
-    param_decl = ParameterDeclarations()
-    with open(file_path, "r") as f:
-        loaded_xosc = ET.parse(f)
-        paramdec = find_mandatory_field(loaded_xosc, "ParameterDeclarations")
-        param_decl = ParameterDeclarations.parse(paramdec)
+    return ParameterDeclarations.parse(
+        _read_top_element(file_path, "ParameterDeclarations")
+    )
 
-    return param_decl
 
+def FileHeaderReader(file_path):
+    """FileHeaderReader reads the FileHeader of a xosc file (of any type)
+    and creates a FileHeader object from it.
+
+    Only the beginning of the file (until the FileHeader) is read.
+
+    Parameters
+    ----------
+        file_path (str): path to the xosc file wanted to be parsed (.xosc.gz
+            files are decompressed while they are read)
+    """
+    return FileHeader.parse(_read_top_element(file_path, "FileHeader"))
+
+
+def CatalogLocationsReader(file_path):
+    """CatalogLocationsReader reads the CatalogLocations of a scenario file
+    and creates a Catalog object from it.
+
+    Only the beginning of the file (until the CatalogLocations) is read.
+
+    Parameters
+    ----------
+        file_path (str): path to the xosc file wanted to be parsed (.xosc.gz
+            files are decompressed while they are read)
+    """
+    return Catalog.parse(_read_top_element(file_path, "CatalogLocations"))
+
+
+def RoadNetworkReader(file_path):
+    """RoadNetworkReader reads the RoadNetwork of a scenario file and
+    creates a RoadNetwork object from it.
+
+    Only the beginning of the file (until the RoadNetwork) is read.
 
-def validate_schema(loaded_xosc: ET.ElementTree) -> bool:
-    """validate_schema checks if the loaded xosc file is valid according to
-    the OpenSCENARIO schema. It returns True if valid, False otherwise.
     Parameters
     ----------
-        loaded_xosc (ElementTree): loaded xosc file
+        file_path (str): path to the xosc file wanted to be parsed (.xosc.gz
+            files are decompressed while they are read)
+    """
+    return RoadNetwork.parse(_read_top_element(file_path, "RoadNetwork"))
+
+
+def FileTypeReader(file_path):
+    """FileTypeReader finds the type of a xosc file, only the beginning of
+    the file (until the first element after the FileHeader) is read.
+
+    Parameters
+    ----------
+        file_path (str): path to the xosc file (.xosc.gz files are
+            decompressed while they are read)
+
     Returns
     -------
-        matched (bool): True if valid, False otherwise
+        file_type (str): "Scenario", "Catalog" or
+            "ParameterValueDistribution"
     """
+    depth = 0
+    with open_file(file_path, "rb") as f:
+        for event, element in ET.iterparse(f, ("start", "end")):
+            if event == "end":
+                depth -= 1
+                continue
+            depth += 1
+            if depth == 2 and element.tag != "FileHeader":
+                if element.tag in _FILE_TYPES:
+                    return _FILE_TYPES[element.tag]
+                break
+    raise NotAValidElement(
+        "The provided file is not on a OpenSCENARIO compatible format."
+    )
+
+
+# compiled schemas, by (backend, major version, minor version)
+_compiled_schemas = {}
+
+# parser of the lxml fast path, the trees are then used as ElementTrees
+_lxml_parser = etree.XMLParser(remove_comments=True, remove_pis=True)
+
+VALIDATION_MODES = [True, False, "lazy"]
+
 
-    minor_version = loaded_xosc.find("FileHeader").attrib["revMinor"]
-    major_version = loaded_xosc.find("FileHeader").attrib["revMajor"]
+def _get_schema_version(loaded_xosc) -> tuple[str, str]:
+    """Returns the (major, minor) version of the loaded xosc file, as
+    written in its FileHeader, and checks that a schema exists for it."""
+    file_header = find_mandatory_field(loaded_xosc, "FileHeader")
+    minor_version = file_header.attrib["revMinor"]
+    major_version = file_header.attrib["revMajor"]
     print(f"OpenSCENARIO version detected: {major_version}.{minor_version}")
     if int(minor_version) > 3 or int(major_version) != 1:
         raise ValueError(
             f"OpenSCENARIO version {major_version}.{minor_version} does not exist in the schema files provided."
         )
-    if minor_version == "3" and major_version == "1":
-        minor_version = "3_1"
+    return major_version, minor_version
+
+
+def get_schema(major_version, minor_version, backend="xmlschema"):
+    """get_schema returns the compiled OpenSCENARIO schema of a version.
+
+    The schemas are compiled once per process and version, and reused
+    afterwards.
+
+    Parameters
+    ----------
+        major_version (str or int): major version of OpenSCENARIO
+
+        minor_version (str or int): minor version of OpenSCENARIO
+
+        backend (str): "xmlschema" (xmlschema.XMLSchema) or "lxml"
+            (lxml.etree.XMLSchema, much faster to compile and validate)
+            Default: "xmlschema"
+
+    Returns
+    -------
+        schema (xmlschema.XMLSchema or lxml.etree.XMLSchema)
+    """
+    key = (backend, str(major_version), str(minor_version))
+    if key in _compiled_schemas:
+        return _compiled_schemas[key]
+    if backend not in ["xmlschema", "lxml"]:
+        raise ValueError(
+            "backend can only be xmlschema or lxml, not: " + str(backend)
+        )
+    schema_version = key[1] + "_" + key[2]
+    if schema_version == "1_3":
+        schema_version = "1_3_1"
     xsd_path = os.path.join(
         Path(__file__).parent.parent.parent,
         "schemas",
-        "OpenSCENARIO_" + major_version + "_" + minor_version + ".xsd",
+        "OpenSCENARIO_" + schema_version + ".xsd",
     )
-    schema = xmlschema.XMLSchema(xsd_path)
+    if backend == "lxml":
+        schema = etree.XMLSchema(etree.parse(xsd_path))
+    else:
+        schema = xmlschema.XMLSchema(xsd_path)
+    _compiled_schemas[key] = schema
+    return schema
+
+
+def validate_schema(loaded_xosc: ET.ElementTree) -> bool:
+    """validate_schema checks if the loaded xosc file is valid according to
+    the OpenSCENARIO schema. It returns True if valid, False otherwise.
+
+    The schemas are compiled once per version (see get_schema). lxml trees
+    (see set_element_factory) are validated with lxml.etree.XMLSchema,
+    directly on the tree.
+
+    Parameters
+    ----------
+        loaded_xosc (ElementTree | lxml.etree._ElementTree | lxml.etree._Element):
+            loaded xosc file
+    Returns
+    -------
+        matched (bool): True if valid, False otherwise
+    """
+    major_version, minor_version = _get_schema_version(loaded_xosc)
+    if isinstance(loaded_xosc, (etree._ElementTree, etree._Element)):
+        schema = get_schema(major_version, minor_version, "lxml")
+        return schema.validate(loaded_xosc)
+    schema = get_schema(major_version, minor_version)
     matched = schema.is_valid(loaded_xosc)
     return matched
 
 
-def ParseOpenScenario(file_path):
+def _parse_loaded_xosc(loaded_xosc):
+    """Creates the python object of a loaded xosc file."""
+    if loaded_xosc.find("ParameterValueDistribution") is not None:
+        return ParameterValueDistribution.parse(loaded_xosc)
+    elif loaded_xosc.find("Catalog") is not None:
+        return Catalog.parse(loaded_xosc)
+    elif loaded_xosc.find("Storyboard") is not None:
+        return Scenario.parse(loaded_xosc)
+    else:
+        raise NotAValidElement(
+            "The provided file is not on a OpenSCENARIO compatible format."
+        )
+
+
+def _warn_invalid_schema():
+    warnings.warn(
+        "The provided file is not valid according to the OpenSCENARIO schema."
+    )
+
+
+def ParseOpenScenario(file_path, validate=True):
     """ParseOpenScenario parses a openscenario file (of any type) and returns
     the python object.
 
     Parameters
     ----------
-        file_path (str): full path to the .xosc file
+        file_path (str): full path to the .xosc file (.xosc.gz files are
+            decompressed while they are read)
+
+        validate (bool or str): validation against the OpenSCENARIO schema,
+            a warning is issued if the file is not valid
+            True: the file is parsed with lxml and validated with the
+                compiled lxml schema (see get_schema)
+            False: no validation
+            "lazy": only validated if the file could not be parsed
+            Default: True
 
     Returns
     -------
         xosc_object (Scenario, Catalog, or ParameterValueDistribution)
     """
-    with open(file_path, "r", encoding="utf-8") as f:
+    if validate not in VALIDATION_MODES:
+        raise ValueError(
+            "validate can only be True, False or lazy, not: " + str(validate)
+        )
+    if validate is True:
+        with open_file(file_path, "rb") as f:
+            loaded_xosc = etree.parse(f, _lxml_parser)
+        if not validate_schema(loaded_xosc):
+            _warn_invalid_schema()
+        return _parse_loaded_xosc(loaded_xosc)
+
+    with open_file(file_path, "r", encoding="utf-8") as f:
         loaded_xosc = ET.parse(f)
+    if not validate:
+        return _parse_loaded_xosc(loaded_xosc)
+    try:
+        return _parse_loaded_xosc(loaded_xosc)
+    except Exception:
         if not validate_schema(loaded_xosc):
-            warnings.warn(
-                "The provided file is not valid according to the OpenSCENARIO schema."
-            )
-        if loaded_xosc.find("ParameterValueDistribution") is not None:
-            return ParameterValueDistribution.parse(loaded_xosc)
-        elif loaded_xosc.find("Catalog") is not None:
-            return Catalog.parse(loaded_xosc)
-        elif loaded_xosc.find("Storyboard") is not None:
-            return Scenario.parse(loaded_xosc)
+            _warn_invalid_schema()
+        raise
+
+
+ParseResult = namedtuple(
+    "ParseResult", ["index", "path", "xosc_object", "error", "warnings"]
+)
+ParseResult.__doc__ = """Result of a file parsed by ParseOpenScenarios.
+
+    Attributes
+    ----------
+        index (int): position of the file in the input paths
+
+        path (str): path to the file
+
+        xosc_object (Scenario, Catalog, or ParameterValueDistribution): the
+            parsed object, None if the parsing failed
+
+        error (Exception): the error raised while parsing, None if the
+            parsing succeeded
+
+        warnings (list of str): the warnings issued while parsing (e.g.
+            schema validation)
+"""
+
+
+def _parse_in_worker(task):
+    """Parses one file of ParseOpenScenarios, errors are returned."""
+    index, file_path, validate = task
+    xosc_object = None
+    error = None
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        try:
+            xosc_object = ParseOpenScenario(file_path, validate)
+        except Exception as e:
+            error = e
+    if error is not None:
+        try:
+            pickle.dumps(error)
+        except Exception:
+            error = RuntimeError(repr(error))
+    return ParseResult(
+        index,
+        file_path,
+        xosc_object,
+        error,
+        [str(w.message) for w in caught],
+    )
+
+
+def ParseOpenScenarios(
+    paths, workers=None, validate=True, ordered=True, chunksize=None
+):
+    """ParseOpenScenarios parses many openscenario files (see
+    ParseOpenScenario) in a pool of processes, and yields the results.
+
+    A file that can not be parsed does not stop the batch, the error is
+    returned in its ParseResult instead.
+
+    Parameters
+    ----------
+        paths (iterable of str): paths to the .xosc (or .xosc.gz) files
+
+        workers (int): number of processes, 1 parses the files in the
+            calling process
+            Default: None (os.cpu_count())
+
+        validate (bool or str): validation mode, see ParseOpenScenario
+            Default: True
+
+        ordered (bool): yield the results in the order of paths, otherwise
+            as soon as they are parsed
+            Default: True
+
+        chunksize (int): number of files sent to a process at a time
+            Default: None (based on the number of files and workers)
+
+    Returns
+    -------
+        results (iterator of ParseResult)
+    """
+    if validate not in VALIDATION_MODES:
+        raise ValueError(
+            "validate can only be True, False or lazy, not: " + str(validate)
+        )
+    if workers is None:
+        workers = os.cpu_count() or 1
+    elif not isinstance(workers, int) or workers < 1:
+        raise ValueError(
+            "workers has to be a positive integer, not: " + str(workers)
+        )
+    if chunksize is None:
+        if hasattr(paths, "__len__"):
+            chunksize = max(1, min(64, len(paths) // (4 * workers)))
         else:
-            raise NotAValidElement(
-                "The provided file is not on a OpenSCENARIO compatible format."
-            )
+            chunksize = 16
+    elif not isinstance(chunksize, int) or chunksize < 1:
+        raise ValueError(
+            "chunksize has to be a positive integer, not: " + str(chunksize)
+        )
+    return _iter_parse_open_scenarios(
+        paths, workers, validate, ordered, chunksize
+    )
+
+
+def _iter_parse_open_scenarios(paths, workers, validate, ordered, chunksize):
+    """Yields the results of ParseOpenScenarios (the arguments are checked
+    by ParseOpenScenarios)."""
+    tasks = (
+        (index, file_path, validate) for index, file_path in enumerate(paths)
+    )
+    if workers == 1:
+        yield from map(_parse_in_worker, tasks)
+        return
+    with Pool(workers) as pool:
+        if ordered:
+            yield from pool.imap(_parse_in_worker, tasks, chunksize)
+        else:
+            yield from pool.imap_unordered(_parse_in_worker, tasks, chunksize)
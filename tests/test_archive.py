@@ -0,0 +1,116 @@
+"""
+scenariogeneration
+https://github.com/pyoscx/scenariogeneration
+
+This Source Code Form is subject to the terms of the Mozilla Public
+License, v. 2.0. If a copy of the MPL was not distributed with this
+file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+Copyright (c) 2022 The scenariogeneration Authors.
+
+"""
+
+import json
+import os
+import tarfile
+import xml.etree.ElementTree as ET
+import zipfile
+
+import pytest
+
+from scenariogeneration import ArchiveWriter, element_to_bytes, printToFile
+
+
+def _read_members(filename):
+    if filename.endswith(".zip"):
+        with zipfile.ZipFile(filename) as archive:
+            return {name: archive.read(name) for name in archive.namelist()}
+    with tarfile.open(filename) as archive:
+        return {
+            member.name: archive.extractfile(member).read()
+            for member in archive.getmembers()
+        }
+
+
+@pytest.mark.parametrize(
+    "archive_format, compression, extension",
+    [
+        ("tar", None, ".tar"),
+        ("tar", "gzip", ".tar.gz"),
+        ("tar", "lzma", ".tar.xz"),
+        ("zip", None, ".zip"),
+        ("zip", "gzip", ".zip"),
+        ("zip", "bzip2", ".zip"),
+    ],
+)
+def test_archive_writer(tmpdir, archive_format, compression, extension):
+    with ArchiveWriter(
+        tmpdir, "test", archive_format, compression, compression_level=1
+    ) as writer:
+        writer.add({"xosc/a.xosc": b"<a/>", "xodr/a.xodr": b"<b/>"})
+        writer.add({})
+    assert writer.archives == ["test_0000" + extension]
+    members = _read_members(os.path.join(tmpdir, writer.archives[0]))
+    assert members["xosc/a.xosc"] == b"<a/>"
+    assert members["xodr/a.xodr"] == b"<b/>"
+    assert json.loads(members["test_0000_index.json"]) == [
+        "xosc/a.xosc",
+        "xodr/a.xodr",
+    ]
+    with open(os.path.join(tmpdir, "test_index.json")) as index_file:
+        index = json.load(index_file)
+    assert index["archives"] == writer.archives
+    assert index["members"]["xodr/a.xodr"] == writer.archives[0]
+
+
+def test_archive_writer_rollover(tmpdir):
+    with ArchiveWriter(tmpdir, "test", "zip", max_size=100) as writer:
+        for i in range(3):
+            writer.add(
+                {
+                    "xosc/" + str(i) + ".xosc": b"x" * 200,
+                    "xodr/" + str(i) + ".xodr": b"y" * 200,
+                }
+            )
+    assert len(writer.archives) == 3
+    for i, filename in enumerate(writer.archives):
+        members = _read_members(os.path.join(tmpdir, filename))
+        assert "xosc/" + str(i) + ".xosc" in members
+        assert "xodr/" + str(i) + ".xodr" in members
+
+
+def test_archive_writer_wrong_input(tmpdir):
+    with pytest.raises(ValueError):
+        ArchiveWriter(tmpdir, "test", "rar")
+    with pytest.raises(ValueError):
+        ArchiveWriter(tmpdir, "test", "tar", "zstd")
+
+
+@pytest.mark.parametrize("prettyprint", [True, False])
+def test_element_to_bytes(tmpdir, prettyprint):
+    element = ET.Element("root")
+    ET.SubElement(element, "child", attrib={"a": "1"})
+    filename = os.path.join(tmpdir, "test.xml")
+    printToFile(element, filename, prettyprint)
+    with open(filename, "rb") as file_handle:
+        assert element_to_bytes(element, prettyprint) == file_handle.read()
+
+
+@pytest.mark.parametrize(
+    "archive_format, compression", [("tar", "gzip"), ("zip", "gzip")]
+)
+def test_archive_writer_deterministic(
+    tmpdir, monkeypatch, archive_format, compression
+):
+    monkeypatch.setenv("SOURCE_DATE_EPOCH", "0")
+    contents = []
+    for run in ["first", "second"]:
+        folder = os.path.join(tmpdir, run)
+        os.mkdir(folder)
+        with ArchiveWriter(
+            folder, "test", archive_format, compression
+        ) as writer:
+            writer.add({"xosc/a.xosc": b"<a/>"})
+        with open(os.path.join(folder, writer.archives[0]), "rb") as f:
+            contents.append(f.read())
+    assert contents[0] == contents[1]
@@ -0,0 +1,49 @@
+"""
+scenariogeneration
+https://github.com/pyoscx/scenariogeneration
+
+This Source Code Form is subject to the terms of the Mozilla Public
+License, v. 2.0. If a copy of the MPL was not distributed with this
+file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+Copyright (c) 2022 The scenariogeneration Authors.
+
+"""
+
+import hashlib
+import os
+
+from scenariogeneration import ContentStore
+
+
+def test_content_store(tmpdir):
+    store = ContentStore(tmpdir)
+    blob_hash = store.store(b"content")
+    assert blob_hash == hashlib.sha256(b"content").hexdigest()
+    assert store.get_path(blob_hash) == os.path.join(
+        tmpdir, "objects", blob_hash[:2], blob_hash[2:]
+    )
+    with open(store.get_path(blob_hash), "rb") as file_handle:
+        assert file_handle.read() == b"content"
+    assert store.store(b"content") == blob_hash
+    assert store.number_of_blobs_written == 1
+    assert store.number_of_duplicates == 1
+
+
+def test_content_store_link(tmpdir):
+    store = ContentStore(tmpdir)
+    first = os.path.join(tmpdir, "first.xml")
+    second = os.path.join(tmpdir, "second.xml")
+    store.link(b"same", first)
+    store.link(b"same", second)
+    assert os.path.samefile(first, second)
+    store.link(b"same", second)
+    store.link(b"other", second)
+    assert not os.path.samefile(first, second)
+    with open(second, "rb") as file_handle:
+        assert file_handle.read() == b"other"
+    # a new store in the same folder reuses the blobs
+    store = ContentStore(tmpdir)
+    store.link(b"same", os.path.join(tmpdir, "third.xml"))
+    assert store.number_of_blobs_written == 0
+    assert os.path.samefile(first, os.path.join(tmpdir, "third.xml"))
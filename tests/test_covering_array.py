@@ -0,0 +1,94 @@
+"""
+scenariogeneration
+https://github.com/pyoscx/scenariogeneration
+
+This Source Code Form is subject to the terms of the Mozilla Public
+License, v. 2.0. If a copy of the MPL was not distributed with this
+file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+Copyright (c) 2022 The scenariogeneration Authors.
+
+"""
+
+import itertools
+
+import pytest
+
+from scenariogeneration import create_covering_array
+
+
+def _is_covered(radices, strength, rows, is_allowed=None):
+    for columns in itertools.combinations(range(len(radices)), strength):
+        found = {tuple(row[c] for c in columns) for row in rows}
+        for values in itertools.product(*[range(radices[c]) for c in columns]):
+            if is_allowed is not None and not is_allowed(
+                dict(zip(columns, values))
+            ):
+                continue
+            if values not in found:
+                return False
+    return True
+
+
+@pytest.mark.parametrize(
+    "radices, strength",
+    [
+        ([3, 3, 3, 3], 2),
+        ([2, 5, 3, 4, 2], 2),
+        ([2, 5, 3, 4, 2], 3),
+        ([3, 3, 3, 3, 3, 3], 4),
+        ([4, 2], 3),
+        ([5], 1),
+    ],
+)
+def test_create_covering_array(radices, strength):
+    rows = create_covering_array(radices, strength, seed=1)
+    assert _is_covered(radices, min(strength, len(radices)), rows)
+    assert all(0 <= v < r for row in rows for v, r in zip(row, radices))
+    assert rows == create_covering_array(radices, strength, seed=1)
+
+
+def test_create_covering_array_size():
+    rows = create_covering_array([10] * 20, 2, seed=0)
+    assert _is_covered([10] * 20, 2, rows)
+    # the lower bound is 100, the full product is 10**20
+    assert len(rows) < 300
+
+
+def test_create_covering_array_is_allowed():
+    def is_allowed(assignment):
+        return not (assignment.get(0) == 0 and assignment.get(1) == 0)
+
+    rows = create_covering_array([3, 3, 3], 2, is_allowed, seed=1)
+    assert _is_covered([3, 3, 3], 2, rows, is_allowed)
+    assert all(row[:2] != [0, 0] for row in rows)
+
+
+def test_create_covering_array_is_allowed_coverage():
+    radices = [4, 1, 3, 5, 4]
+    excluded = [((3, 4), (2, 0)), ((4, 2), (1, 0)), ((0, 1), (2, 2))]
+
+    def is_allowed(assignment):
+        return not any(
+            assignment.get(a) == value_a and assignment.get(b) == value_b
+            for (a, value_a), (b, value_b) in excluded
+        )
+
+    rows = create_covering_array(radices, 3, is_allowed, seed=0)
+    assert all(is_allowed(dict(enumerate(row))) for row in rows)
+    allowed_rows = [
+        row
+        for row in itertools.product(*[range(radix) for radix in radices])
+        if is_allowed(dict(enumerate(row)))
+    ]
+    for columns in itertools.combinations(range(len(radices)), 3):
+        found = {tuple(row[c] for c in columns) for row in rows}
+        for row in allowed_rows:
+            assert tuple(row[c] for c in columns) in found
+
+
+def test_create_covering_array_edge_cases():
+    assert create_covering_array([]) == [[]]
+    assert create_covering_array([3, 0]) == []
+    with pytest.raises(ValueError):
+        create_covering_array([2, 2], 0)
@@ -12,6 +12,7 @@ Copyright (c) 2022 The scenariogeneration Authors.
 
 import copy
 import os
+import xml.etree.ElementTree as ET
 
 import pytest
 
@@ -210,6 +211,28 @@ class TestVehicle:
 
         prettyprint(simple_veh.get_element())
 
+    def test_element_cache(self, simple_veh, bb):
+        simple_veh.enable_element_cache()
+        element = simple_veh.get_element()
+        cached_element = simple_veh.get_element()
+        assert cached_element is not element
+        assert ET.tostring(cached_element) == ET.tostring(element)
+
+        bb.boundingbox.width = 3
+        dimensions = simple_veh.get_element().find("BoundingBox/Dimensions")
+        assert dimensions.get("width") == "3"
+        simple_veh.add_property("myprop", "12")
+        assert simple_veh.get_element().find("Properties/Property") is not None
+        simple_veh.setVersion(minor=0)
+        assert simple_veh.get_element().find("Properties/Property") is not None
+        simple_veh.setVersion(minor=_MINOR_VERSION)
+
+        veh_copy = copy.deepcopy(simple_veh)
+        assert veh_copy == simple_veh
+        assert ET.tostring(veh_copy.get_element()) == ET.tostring(
+            simple_veh.get_element()
+        )
+
     @pytest.mark.parametrize(
         "vehicle_to_parse",
         [
@@ -0,0 +1,99 @@
+"""
+scenariogeneration
+https://github.com/pyoscx/scenariogeneration
+
+This Source Code Form is subject to the terms of the Mozilla Public
+License, v. 2.0. If a copy of the MPL was not distributed with this
+file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+Copyright (c) 2022 The scenariogeneration Authors.
+
+"""
+
+import os
+import sqlite3
+import time
+
+import pytest
+
+from scenariogeneration import GenerationQueue
+
+
+@pytest.fixture
+def chunks():
+    return [(0, 10, 0), (10, 20, 10), (20, 25, 20)]
+
+
+def test_queue_claim_and_complete(tmpdir, chunks):
+    filename = os.path.join(tmpdir, GenerationQueue.filename)
+    with GenerationQueue(filename, chunks, worker_id="w1") as q1:
+        with GenerationQueue(filename, chunks, worker_id="w2") as q2:
+            claimed = [(q1, q1.claim()), (q2, q2.claim()), (q1, q1.claim())]
+            assert [c[0] for _, c in claimed] == [1, 2, 3]
+            assert claimed[1][1][1:] == (10, 20, 10)
+            assert q2.claim() is None
+            assert not q1.complete(claimed[1][1][0])
+            for queue, chunk in claimed:
+                assert not q1.is_done()
+                assert queue.complete(chunk[0])
+            assert q2.is_done()
+
+
+def test_queue_lease_expires(tmpdir, chunks):
+    filename = os.path.join(tmpdir, GenerationQueue.filename)
+    with GenerationQueue(filename, chunks[:1], 1.0, "dead") as dead:
+        dead_chunk = dead.claim()
+    with GenerationQueue(filename, chunks[:1], 1.0, "alive") as alive:
+        assert alive.claim() is None
+        time.sleep(1.1)
+        assert alive.claim() == dead_chunk
+
+
+def test_queue_other_permutations(tmpdir, chunks):
+    filename = os.path.join(tmpdir, GenerationQueue.filename)
+    GenerationQueue(filename, chunks).close()
+    with pytest.raises(ValueError):
+        GenerationQueue(filename, chunks[:2])
+
+
+def test_queue_lease_renewed(tmpdir, chunks):
+    filename = os.path.join(tmpdir, GenerationQueue.filename)
+    with GenerationQueue(filename, chunks[:1], 0.4, "slow") as slow:
+        chunk = slow.claim()
+        with GenerationQueue(filename, chunks[:1], 0.4, "other") as other:
+            time.sleep(1.0)
+            assert other.claim() is None
+        assert slow.is_claimed(chunk[0])
+        assert slow.complete(chunk[0])
+
+
+def test_queue_lease_lost(tmpdir, chunks):
+    filename = os.path.join(tmpdir, GenerationQueue.filename)
+    with GenerationQueue(filename, chunks[:1], 60, "stalled") as stalled:
+        chunk = stalled.claim()
+        connection = sqlite3.connect(filename)
+        with connection:
+            connection.execute("UPDATE chunks SET lease_expires = 0")
+        connection.close()
+        with GenerationQueue(filename, chunks[:1], 60, "other") as other:
+            assert other.claim() == chunk
+            assert not stalled.renew(chunk[0])
+            assert not stalled.is_claimed(chunk[0])
+            assert not stalled.complete(chunk[0])
+            assert not other.is_done()
+            assert other.complete(chunk[0])
+            assert other.is_done()
+
+
+def test_queue_restart_finished(tmpdir, chunks):
+    filename = os.path.join(tmpdir, GenerationQueue.filename)
+    with GenerationQueue(filename, chunks[:1], generation_key="a") as queue:
+        queue.complete(queue.claim()[0])
+    # late workers of the same generation have nothing to do
+    with GenerationQueue(filename, chunks[:1], generation_key="a") as queue:
+        assert queue.is_done()
+    with GenerationQueue(filename, chunks[:2], generation_key="b") as queue:
+        assert not queue.is_done()
+        assert queue.claim()[0] == 1
+        with pytest.raises(ValueError):
+            GenerationQueue(filename, chunks[:2], generation_key="c")
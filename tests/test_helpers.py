@@ -0,0 +1,270 @@
+"""
+scenariogeneration
+https://github.com/pyoscx/scenariogeneration
+
+This Source Code Form is subject to the terms of the Mozilla Public
+License, v. 2.0. If a copy of the MPL was not distributed with this
+file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+Copyright (c) 2022 The scenariogeneration Authors.
+
+"""
+
+import gzip
+import io
+import os
+import subprocess
+import sys
+import xml.etree.ElementTree as ET
+
+import pytest
+from lxml import etree
+
+from scenariogeneration import (
+    Element,
+    StreamElement,
+    SubElement,
+    open_file,
+    prettify,
+    printToFile,
+    set_deterministic_timestamp,
+    set_element_factory,
+    write_prettified,
+    write_stream,
+    xodr,
+    xosc,
+)
+
+
+@pytest.fixture
+def element():
+    root = ET.Element("root", attrib={"name": "a  b", "value": '1 < 2 & "3"'})
+    child = ET.SubElement(root, "child")
+    ET.SubElement(child, "leaf", attrib={"x": "1"})
+    ET.SubElement(root, "text").text = "some  text > 0"
+    ET.SubElement(root, "data").text = "<![CDATA[x < y && z]]>"
+    return root
+
+
+def test_prettify(element):
+    assert prettify(element) == (
+        b"<?xml version='1.0' encoding='utf-8'?>\n"
+        b'<root name="a  b" value="1 &lt; 2 &amp; &quot;3&quot;">\n'
+        b"    <child>\n"
+        b'        <leaf x="1"/>\n'
+        b"    </child>\n"
+        b"    <text>some  text &gt; 0</text>\n"
+        b"    <data><![CDATA[x < y && z]]></data>\n"
+        b"</root>\n"
+    )
+
+
+def test_prettify_roundtrip(element):
+    parsed = ET.fromstring(prettify(element))
+    assert parsed.attrib == element.attrib
+    assert parsed.find("text").text == "some  text > 0"
+    assert parsed.find("data").text == "x < y && z"
+
+
+def test_prettify_mixed_content():
+    root = ET.Element("root")
+    mixed = ET.SubElement(root, "mixed")
+    mixed.text = "before"
+    inner = ET.SubElement(mixed, "inner")
+    inner.tail = "after"
+    assert prettify(root, xml_declaration=False) == (
+        b"<root>\n    <mixed>before<inner/>after</mixed>\n</root>\n"
+    )
+
+
+def test_prettify_encoding():
+    root = ET.Element("root", attrib={"name": "ä"})
+    assert prettify(root, "iso-8859-1", False) == b'<root name="\xe4"/>\n'
+    assert prettify(root, "ascii", False) == b'<root name="&#228;"/>\n'
+    with pytest.raises(LookupError):
+        prettify(root, "not-an-encoding")
+
+
+@pytest.mark.parametrize("prettyprint", [True, False])
+def test_print_to_file_wrong_encoding(tmpdir, element, prettyprint):
+    filename = os.path.join(tmpdir, "existing.xml")
+    with open(filename, "wb") as f:
+        f.write(b"<existing/>")
+    printToFile(element, filename, prettyprint, "not-an-encoding")
+    with open(filename, "rb") as f:
+        assert f.read() == b"<existing/>"
+    printToFile(
+        element,
+        os.path.join(tmpdir, "new.xml"),
+        prettyprint,
+        "not-an-encoding",
+    )
+    assert not os.path.exists(os.path.join(tmpdir, "new.xml"))
+
+
+def test_write_prettified(element):
+    output = io.BytesIO()
+    write_prettified(element, output)
+    assert output.getvalue() == prettify(element)
+
+
+def _stream_element():
+    def children():
+        yield ET.Element("first", attrib={"a": "1 & 2"})
+        yield StreamElement(
+            "nested", children=(ET.Element("leaf") for _ in range(2))
+        )
+        yield StreamElement("empty", {"b": "\n"})
+
+    return StreamElement("root", {"name": "x"}, children())
+
+
+def test_stream_element_to_element():
+    element = _stream_element().to_element()
+    assert [child.tag for child in element] == ["first", "nested", "empty"]
+    assert len(element.find("nested")) == 2
+
+
+@pytest.mark.parametrize("encoding", ["utf-8", "iso-8859-1", "utf-16"])
+@pytest.mark.parametrize("prettyprint", [True, False])
+def test_write_stream(prettyprint, encoding):
+    output = io.BytesIO()
+    write_stream(_stream_element(), output, prettyprint, encoding)
+    expected = io.BytesIO()
+    if prettyprint:
+        write_prettified(
+            _stream_element().to_element(), expected, encoding=encoding
+        )
+    else:
+        ET.ElementTree(_stream_element().to_element()).write(
+            expected, encoding=encoding
+        )
+    assert output.getvalue() == expected.getvalue()
+
+
+def test_print_to_file_stream_error(tmpdir):
+    def children():
+        yield ET.Element("first")
+        raise ValueError("broken")
+
+    filename = str(tmpdir.join("broken.xml"))
+    with pytest.raises(ValueError):
+        printToFile(StreamElement("root", children=children()), filename)
+    assert not tmpdir.join("broken.xml").exists()
+
+
+@pytest.fixture
+def lxml_factory():
+    previous_factory = set_element_factory("lxml")
+    previous_timestamp = set_deterministic_timestamp(0)
+    yield
+    set_element_factory(previous_factory)
+    set_deterministic_timestamp(previous_timestamp)
+
+
+def test_set_element_factory():
+    with pytest.raises(ValueError):
+        set_element_factory("minidom")
+    assert isinstance(Element("a"), ET.Element)
+
+
+def test_lxml_element(lxml_factory):
+    root = Element(
+        "root",
+        {
+            "xmlns:xsi": "http://www.w3.org/2001/XMLSchema-instance",
+            "xsi:noNamespaceSchemaLocation": "schema.xsd",
+        },
+    )
+    SubElement(root, "child", {"x": "1"})
+    assert isinstance(root, etree._Element)
+    assert root.nsmap == {"xsi": "http://www.w3.org/2001/XMLSchema-instance"}
+    assert len(root) == 1
+
+
+@pytest.mark.parametrize("encoding", ["utf-8", "utf-16"])
+def test_prettify_lxml(lxml_factory, encoding):
+    stochastic = xosc.Stochastic(10, 1)
+    stochastic.add_distribution(
+        "speed", xosc.UniformDistribution(xosc.Range(5, 10))
+    )
+    scenario = xosc.ParameterValueDistribution(
+        "my_parametrization", "Mandolin", "my_test.xosc", stochastic
+    )
+    road = xodr.create_road(xodr.Line(100), 0, 1, 1)
+    road.planview.set_start_point(0, 0, 0)
+    road.planview.adjust_geometries()
+    for obj in [scenario, road]:
+        lxml_element = obj.get_element()
+        assert isinstance(lxml_element, etree._Element)
+        set_element_factory("etree")
+        et_element = obj.get_element()
+        set_element_factory("lxml")
+        assert prettify(lxml_element, encoding) == prettify(
+            et_element, encoding
+        )
+
+
+@pytest.mark.parametrize("prettyprint", [True, False])
+def test_print_to_compressed_file(tmpdir, element, prettyprint):
+    filename = str(tmpdir.join("compressed.xml.gz"))
+    printToFile(element, filename, prettyprint)
+    with gzip.open(filename) as file_handle:
+        content = file_handle.read()
+    expected = io.BytesIO()
+    write_stream(element, expected, prettyprint)
+    assert content == expected.getvalue()
+    with open_file(filename, "r", encoding="utf-8") as file_handle:
+        assert file_handle.read() == content.decode()
+
+
+def test_prettify_qualified_names():
+    root = ET.fromstring(
+        '<root xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" '
+        'xsi:noNamespaceSchemaLocation="a.xsd"><child/></root>'
+    )
+    assert prettify(root) == (
+        b"<?xml version='1.0' encoding='utf-8'?>\n"
+        b'<root xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" '
+        b'xsi:noNamespaceSchemaLocation="a.xsd">\n'
+        b"    <child/>\n"
+        b"</root>\n"
+    )
+
+
+_CACHE_OFF_SCRIPT = """
+from scenariogeneration import helpers, xodr, xosc
+
+vehicle = xosc.Vehicle(
+    "car",
+    xosc.VehicleCategory.car,
+    xosc.BoundingBox(2, 5, 1.8, 2.0, 0, 0.9),
+    xosc.Axle(0.5, 0.8, 1.68, 2.98, 0.4),
+    xosc.Axle(0.5, 0.8, 1.68, 0, 0.4),
+    69,
+    10,
+    10,
+)
+vehicle.add_property("a", "b")
+vehicle.get_element()
+assert "__setattr__" not in vars(helpers.CachedElementBase)
+assert not hasattr(xosc.Vehicle.get_element, "__wrapped__")
+assert not hasattr(xosc.Vehicle.add_property, "__wrapped__")
+assert "_revision" not in vars(vehicle)
+
+vehicle.enable_element_cache()
+assert hasattr(xosc.Vehicle.get_element, "__wrapped__")
+assert hasattr(xodr.RoadMark.add_specific_road_line, "__wrapped__")
+vehicle.add_property("c", "d")
+assert "_revision" in vars(vehicle)
+"""
+
+
+def test_element_cache_off_cost():
+    # the tracking of the element cache is process wide, so it is checked in
+    # a new interpreter, where no cache has been enabled yet
+    subprocess.run(
+        [sys.executable, "-c", _CACHE_OFF_SCRIPT],
+        check=True,
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    )
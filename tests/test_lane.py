@@ -138,6 +138,13 @@ def test_roadmark():
         == ValidationResponse.OK
     )
 
+    mark4.enable_element_cache()
+    assert len(mark4.get_element().findall("type/line")) == 2
+    mark4.add_specific_road_line(xodr.RoadLine(0.2, 0, 0, 0.2, 0))
+    assert len(mark4.get_element().findall("type/line")) == 3
+    mark4.enable_element_cache(False)
+    assert len(mark4.get_element().findall("type/line")) == 3
+
     with pytest.raises(TypeError):
         xodr.RoadMark("dummy")
 
@@ -0,0 +1,86 @@
+"""
+scenariogeneration
+https://github.com/pyoscx/scenariogeneration
+
+This Source Code Form is subject to the terms of the Mozilla Public
+License, v. 2.0. If a copy of the MPL was not distributed with this
+file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+Copyright (c) 2022 The scenariogeneration Authors.
+
+"""
+
+import os
+
+from scenariogeneration import GenerationManifest, hash_file, hash_parameters
+
+
+def create_entry(name, parameters_hash, scenario_file, size, folder):
+    scenario_hash = ""
+    mtime_ns = 0
+    if os.path.isfile(os.path.join(folder, scenario_file)):
+        scenario_hash = hash_file(os.path.join(folder, scenario_file))
+        mtime_ns = os.stat(os.path.join(folder, scenario_file)).st_mtime_ns
+    return {
+        "name": name,
+        "parameters_hash": parameters_hash,
+        "generator_hash": "generator",
+        "scenario_file": scenario_file,
+        "scenario_hash": scenario_hash,
+        "scenario_size": size,
+        "scenario_mtime_ns": mtime_ns,
+        "road_file": "",
+        "road_hash": "",
+        "road_size": 0,
+        "road_mtime_ns": 0,
+    }
+
+
+def test_hash_parameters():
+    assert hash_parameters({"a": 1, "b": [1, 2]}) == hash_parameters(
+        {"b": [1, 2], "a": 1}
+    )
+    assert hash_parameters({"a": 1}) != hash_parameters({"a": 2})
+
+
+def test_hash_file(tmpdir):
+    filename = os.path.join(tmpdir, "file.txt")
+    with open(filename, "w") as f:
+        f.write("hej")
+    assert hash_file(filename) == hash_file(filename)
+    assert len(hash_file(filename)) == 64
+
+
+def test_manifest_persistent(tmpdir):
+    with open(os.path.join(tmpdir, "s1.xosc"), "w") as f:
+        f.write("abc")
+    filename = os.path.join(tmpdir, GenerationManifest.filename)
+    with GenerationManifest(filename) as manifest:
+        manifest.record(create_entry("s1", "p1", "s1.xosc", 3, tmpdir))
+        manifest.record(create_entry("s2", "p2", "s2.xosc", 3, tmpdir))
+    manifest = GenerationManifest(filename)
+    assert len(manifest) == 2
+    assert manifest.get("s1")["parameters_hash"] == "p1"
+    assert manifest.get("s3") is None
+    assert manifest.is_up_to_date("s1", "p1", "generator", tmpdir)
+    assert manifest.is_up_to_date("s1", "p2", "generator", tmpdir) is None
+    assert manifest.is_up_to_date("s1", "p1", "other", tmpdir) is None
+    assert manifest.is_up_to_date("s2", "p2", "generator", tmpdir) is None
+    assert [entry["name"] for entry in manifest] == ["s1", "s2"]
+    manifest.close()
+
+
+def test_manifest_modified_file(tmpdir):
+    scenario_file = os.path.join(tmpdir, "s1.xosc")
+    with open(scenario_file, "w") as f:
+        f.write("abc")
+    filename = os.path.join(tmpdir, GenerationManifest.filename)
+    with GenerationManifest(filename) as manifest:
+        manifest.record(create_entry("s1", "p1", "s1.xosc", 3, tmpdir))
+        # same content with a new modification time is still up to date
+        os.utime(scenario_file, ns=(0, 0))
+        assert manifest.is_up_to_date("s1", "p1", "generator", tmpdir)
+        # same size, other content
+        with open(scenario_file, "w") as f:
+            f.write("abd")
+        assert manifest.is_up_to_date("s1", "p1", "generator", tmpdir) is None
@@ -10,12 +10,14 @@ Copyright (c) 2022 The scenariogeneration Authors.
 
 """
 
+import io
+import xml.etree.ElementTree as ET
 from tempfile import tempdir
 
 import numpy as np
 import pytest
 
-from scenariogeneration import prettyprint, xodr
+from scenariogeneration import StreamElement, prettify, prettyprint, xodr
 from scenariogeneration.xodr.opendrive import OpenDrive
 
 from .xml_validator import ValidationResponse, version_validation
@@ -241,6 +243,45 @@ def test_road_with_road_types():
     )
 
 
+def test_opendrive_fingerprint():
+    odrs = []
+    for length in [100, 100, 50]:
+        odr = xodr.OpenDrive("")
+        odr.add_road(xodr.create_road(xodr.Line(length), 0, 2, 2))
+        odr.adjust_roads_and_lanes()
+        odrs.append(odr)
+    assert odrs[0] == odrs[1]
+    assert odrs[0].get_fingerprint() == odrs[1].get_fingerprint()
+    assert odrs[0].get_fingerprint() != odrs[2].get_fingerprint()
+    assert (
+        odrs[0].roads["0"].lanes.get_fingerprint()
+        == odrs[2].roads["0"].lanes.get_fingerprint()
+    )
+    assert (
+        odrs[0].roads["0"].planview.get_fingerprint()
+        != odrs[2].roads["0"].planview.get_fingerprint()
+    )
+
+
+def test_opendrive_write_stream(monkeypatch):
+    monkeypatch.setenv("SOURCE_DATE_EPOCH", "1700000000")
+    odr = xodr.OpenDrive("stream")
+    road = xodr.create_road(
+        [xodr.Line(100), xodr.Arc(0.01, length=50)], 0, 2, 2
+    )
+    road.add_object(xodr.Object(10, 2, id="1"))
+    road.add_signal(xodr.Signal(20, 2, country="DEU", Type="206"))
+    odr.add_road(road)
+    odr.adjust_roads_and_lanes()
+    assert isinstance(odr.iter_xml(), StreamElement)
+    output = io.BytesIO()
+    odr.write_stream(output)
+    assert output.getvalue() == prettify(odr.get_element())
+    output = io.BytesIO()
+    odr.write_stream(output, prettyprint=False)
+    assert output.getvalue() == ET.tostring(odr.get_element(), "utf-8")
+
+
 def test_road_with_repeating_objects():
     r1 = xodr.create_road(xodr.Line(100), 1)
     r2 = xodr.create_road(xodr.Line(100), 1)
@@ -289,6 +330,12 @@ def test_header():
     )
 
 
+def test_header_deterministic(monkeypatch):
+    monkeypatch.setenv("SOURCE_DATE_EPOCH", "0")
+    h1 = xodr.opendrive._Header("hej", "1", "4")
+    assert h1.get_attributes()["date"] == "1970-01-01 00:00:00"
+
+
 def test_odr_type_checks():
     odr = xodr.OpenDrive("my odr")
     with pytest.raises(TypeError):
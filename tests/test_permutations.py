@@ -0,0 +1,311 @@
+"""
+scenariogeneration
+https://github.com/pyoscx/scenariogeneration
+
+This Source Code Form is subject to the terms of the Mozilla Public
+License, v. 2.0. If a copy of the MPL was not distributed with this
+file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+Copyright (c) 2022 The scenariogeneration Authors.
+
+"""
+
+import itertools
+import sys
+
+import pytest
+
+from scenariogeneration import PermutationSpace
+
+
+@pytest.fixture
+def dict_of_params():
+    return {"a": [1, 2, 3], "b": ["x", "y"], "c": [0.1, 0.2]}
+
+
+def test_dict_of_lists_order(dict_of_params):
+    space = PermutationSpace(dict_of_params)
+    expected = [
+        dict(zip(dict_of_params.keys(), combo))
+        for combo in itertools.product(*dict_of_params.values())
+    ]
+    assert len(space) == 12
+    assert list(space) == expected
+    for i, permutation in enumerate(expected):
+        assert space[i] == permutation
+    assert space[-1] == expected[-1]
+
+
+def test_empty_parameters():
+    assert list(PermutationSpace({})) == [{}]
+    assert len(PermutationSpace([])) == 0
+    assert len(PermutationSpace({"a": [1], "b": []})) == 0
+
+
+def test_index_out_of_range(dict_of_params):
+    space = PermutationSpace(dict_of_params)
+    with pytest.raises(IndexError):
+        space[12]
+    with pytest.raises(IndexError):
+        space.decode(-1)
+
+
+def test_list_of_dicts_with_expansion():
+    space = PermutationSpace(
+        [{"a": 1}, {"a": 2}],
+        expand_permutations=[{"b": [10, 20, 30]}, {"c": [5, 6]}],
+    )
+    assert len(space) == 12
+    assert space[0] == {"a": 1, "b": 10, "c": 5}
+    assert space[1] == {"a": 1, "b": 10, "c": 6}
+    assert space[11] == {"a": 2, "b": 30, "c": 6}
+    assert list(space)[7] == space[7]
+
+
+def test_exclusions(dict_of_params):
+    excluded = [{"a": 2, "b": "x", "c": 0.2}, {"a": 3, "b": "y", "c": 0.1}]
+    space = PermutationSpace(dict_of_params, excluded_permutations=excluded)
+    assert space.raw_size == 12
+    assert len(space) == 10
+    assert all(ex not in space for ex in excluded)
+    assert space[4] == {"a": 2, "b": "x", "c": 0.1}
+    assert space[5] == {"a": 2, "b": "y", "c": 0.1}
+    assert space == list(space)
+
+
+def test_large_space_is_lazy():
+    space = PermutationSpace({str(i): list(range(10)) for i in range(12)})
+    assert len(space) == 10**12
+    assert space[10**12 - 1] == {str(i): 9 for i in range(12)}
+    assert space[123] == dict(
+        {str(i): 0 for i in range(9)}, **{"9": 1, "10": 2, "11": 3}
+    )
+
+
+def test_huge_space_size():
+    space = PermutationSpace({str(i): list(range(20)) for i in range(15)})
+    assert space.size == 20**15
+    with pytest.raises(OverflowError):
+        len(space)
+    assert space[-1] == {str(i): 19 for i in range(15)}
+
+
+def test_index_with_exclusions_is_counted_once():
+    calls = []
+
+    def odd_sum(a, b, c):
+        calls.append(1)
+        return (a + b + c) % 2 == 1
+
+    parameters = {
+        "a": list(range(20)),
+        "b": list(range(300)),
+        "c": list(range(5)),
+    }
+    expected = list(PermutationSpace(parameters, exclusion_rules=[odd_sum]))
+    space = PermutationSpace(parameters, exclusion_rules=[odd_sum])
+    calls.clear()
+    assert len(space) == space.size == len(expected) == 15000
+    counting_calls = len(calls)
+    assert counting_calls == 30000
+    assert len(space) == 15000
+    assert len(calls) == counting_calls
+    for index in [0, 1, 2999, 3000, 7777, 14999, -1]:
+        assert space[index] == expected[index]
+    # only the permutations with the same first parameter are enumerated
+    assert len(calls) - counting_calls <= 7 * 1500
+    with pytest.raises(IndexError):
+        space[15000]
+
+
+@pytest.mark.parametrize(
+    "excluded",
+    [None, [{"a": 1, "b": "y", "c": 0.1}, {"a": 3, "b": "x", "c": 0.2}]],
+)
+def test_iter_positions(dict_of_params, excluded):
+    space = PermutationSpace(dict_of_params, excluded_permutations=excluded)
+    selected = list(space.iter_positions(1, 3))
+    assert [position for position, _, _ in selected] == list(
+        range(1, len(space), 3)
+    )
+    for position, raw_index, permutation in selected:
+        assert space[position] == permutation
+        assert space.decode(raw_index) == permutation
+
+
+def test_exclusion_rules_partial(dict_of_params):
+    space = PermutationSpace(dict_of_params, exclusion_rules=[{"a": 2}])
+    assert len(space) == 8
+    assert all(p["a"] != 2 for p in space)
+    space = PermutationSpace(
+        dict_of_params, exclusion_rules=[{"a": 1, "b": "y"}, {"c": 0.2}]
+    )
+    assert list(space) == [
+        {"a": 1, "b": "x", "c": 0.1},
+        {"a": 2, "b": "x", "c": 0.1},
+        {"a": 2, "b": "y", "c": 0.1},
+        {"a": 3, "b": "x", "c": 0.1},
+        {"a": 3, "b": "y", "c": 0.1},
+    ]
+    assert space[2] == {"a": 2, "b": "y", "c": 0.1}
+    assert not space.is_excluded({"a": 2, "b": "y", "c": 0.1})
+    assert space.is_excluded({"a": 1, "b": "y", "c": 0.1})
+
+
+def test_exclusion_rules_predicates_prune_early():
+    calls = []
+
+    def first_only(a):
+        calls.append(a)
+        return a > 0
+
+    space = PermutationSpace(
+        {"a": list(range(10)), "b": list(range(1000))},
+        exclusion_rules=[first_only, lambda a, b: b >= 5],
+    )
+    assert [p for p in space] == [{"a": 0, "b": b} for b in range(5)]
+    assert calls == list(range(10))
+
+
+def test_exclusion_rules_with_expansion():
+    space = PermutationSpace(
+        [{"a": 1, "b": 1}, {"a": 2, "b": 1}],
+        expand_permutations=[{"b": [1, 2]}],
+        exclusion_rules=[{"a": 1, "b": 2}, {"c": 1}, {"a": [1]}],
+    )
+    assert list(space) == [
+        {"a": 1, "b": 1},
+        {"a": 2, "b": 1},
+        {"a": 2, "b": 2},
+    ]
+
+
+def test_exclusion_rules_unknown_key(dict_of_params):
+    with pytest.raises(ValueError):
+        PermutationSpace(dict_of_params, exclusion_rules=[lambda a, d: True])
+
+
+def test_exclusion_rules_missing_key():
+    space = PermutationSpace(
+        [{"a": 1, "b": 1}, {"a": 2}, {"a": 3, "b": 2}],
+        expand_permutations=[{"c": [1, 2]}],
+        exclusion_rules=[lambda b, c: b == c],
+    )
+    assert list(space) == [
+        {"a": 1, "b": 1, "c": 2},
+        {"a": 2, "c": 1},
+        {"a": 2, "c": 2},
+        {"a": 3, "b": 2, "c": 1},
+    ]
+    assert len(space.covering_array(2, seed=1)) > 0
+
+
+def test_exclusion_rules_unhashable():
+    space = PermutationSpace(
+        {"a": [[1, 2], [3]], "b": [1, 2]},
+        excluded_permutations=[{"a": [3], "b": 1}],
+        exclusion_rules=[{"a": [1, 2], "b": 2}],
+    )
+    assert list(space) == [{"a": [1, 2], "b": 1}, {"a": [3], "b": 2}]
+
+
+@pytest.mark.parametrize(
+    "method", ["random", "latin_hypercube", "sobol", "halton"]
+)
+def test_sample(method):
+    space = PermutationSpace({str(i): list(range(10)) for i in range(15)})
+    sample = space.sample(16, method, seed=3)
+    assert 0 < len(sample) <= 16
+    assert list(sample) == space.sample(16, method, seed=3)
+    for i, permutation in enumerate(sample):
+        assert space[sample.raw_indices[i]] == permutation
+        assert sample[i] == permutation
+    assert len({tuple(p.values()) for p in sample}) == len(sample)
+
+
+def test_sample_is_not_a_space():
+    space = PermutationSpace({"a": [1, 2, 3], "b": [4, 5]})
+    sample = space.sample(4, seed=1)
+    assert not isinstance(sample, PermutationSpace)
+    assert not hasattr(sample, "sample")
+    assert not hasattr(sample, "covering_array")
+    assert sample.space is space
+    assert sample.raw_size == len(sample) == 4
+    assert not sample.has_exclusions
+    assert list(sample.iter_raw_range(1, 3)) == [
+        (1, sample[1]),
+        (2, sample[2]),
+    ]
+    with pytest.raises(IndexError):
+        sample.decode(4)
+
+
+def test_sample_latin_hypercube_covers_levels():
+    space = PermutationSpace({"a": list(range(8)), "b": list(range(8))})
+    sample = space.sample(8, "latin_hypercube", seed=1)
+    assert sorted(p["a"] for p in sample) == list(range(8))
+    assert sorted(p["b"] for p in sample) == list(range(8))
+
+
+def test_sample_exclusions():
+    space = PermutationSpace(
+        {"a": [1, 2], "b": [1, 2]}, exclusion_rules=[{"a": 1}]
+    )
+    sample = space.sample(4, "random", seed=1)
+    assert list(sample) == [{"a": 2, "b": 1}, {"a": 2, "b": 2}]
+
+
+def test_sample_wrong_method():
+    with pytest.raises(ValueError):
+        PermutationSpace({"a": [1]}).sample(1, "grid")
+
+
+def test_sample_wrong_count():
+    with pytest.raises(ValueError):
+        PermutationSpace({"a": [1]}).sample(None)
+
+
+@pytest.mark.parametrize(
+    "method", ["random", "latin_hypercube", "sobol", "halton"]
+)
+def test_sample_huge_space(method):
+    space = PermutationSpace({str(i): list(range(20)) for i in range(15)})
+    assert space.raw_size > sys.maxsize
+    sample = space.sample(16, method, seed=1)
+    assert 0 < len(sample) <= 16
+    assert list(sample) == space.sample(16, method, seed=1)
+    for i, permutation in enumerate(sample):
+        assert space.decode(sample.raw_indices[i]) == permutation
+
+
+@pytest.mark.parametrize("strength", [2, 3])
+def test_covering_array(strength):
+    parameters = {str(i): list(range(4)) for i in range(6)}
+    space = PermutationSpace(parameters)
+    covering = space.covering_array(strength, seed=1)
+    assert len(covering) < space.raw_size
+    for keys in itertools.combinations(parameters, strength):
+        found = {tuple(p[key] for key in keys) for p in covering}
+        assert len(found) == 4**strength
+    for i, permutation in enumerate(covering):
+        assert space[covering.raw_indices[i]] == permutation
+
+
+def test_covering_array_exclusions():
+    space = PermutationSpace(
+        {"a": [1, 2, 3], "b": [1, 2, 3], "c": [1, 2]},
+        excluded_permutations=[{"a": 2, "b": 2, "c": 2}],
+        exclusion_rules=[{"a": 1, "b": 1}, lambda c, a: c == 2 and a == 3],
+    )
+    covering = space.covering_array(2, seed=1)
+    for permutation in covering:
+        assert not space.is_excluded(permutation)
+    pairs = {(p["a"], p["b"]) for p in covering}
+    assert pairs == {(a, b) for a in [1, 2, 3] for b in [1, 2, 3]} - {(1, 1)}
+    assert {(p["a"], p["c"]) for p in covering} == {
+        (1, 1),
+        (1, 2),
+        (2, 1),
+        (2, 2),
+        (3, 1),
+    }
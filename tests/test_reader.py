@@ -10,12 +10,19 @@ Copyright (c) 2022 The scenariogeneration Authors.
 
 """
 
+import gzip
 import os
+import warnings
 import xml.etree.ElementTree as ET
 
 import pytest
 
-from scenariogeneration import prettyprint, xosc
+from scenariogeneration import (
+    prettyprint,
+    printToFile,
+    set_element_factory,
+    xosc,
+)
 
 
 @pytest.fixture
@@ -406,3 +413,274 @@ def test_schema_validation(tmpdir, parameter_fixture):
         loaded_xosc = ET.parse(f)
     scenario = xosc.validate_schema(loaded_xosc)
     assert scenario is True
+
+
+def test_schema_validation_lxml(parameter_fixture):
+    previous_factory = set_element_factory("lxml")
+    try:
+        element = parameter_fixture.get_element()
+    finally:
+        set_element_factory(previous_factory)
+    assert xosc.validate_schema(element) is True
+
+
+def test_compressed_files(tmpdir, osc_fixture):
+    tmpfile = os.path.join(tmpdir, "myscenario.xosc.gz")
+    osc_fixture.write_xml(tmpfile)
+    with gzip.open(tmpfile) as f:
+        assert f.read().startswith(b"<?xml")
+    assert osc_fixture == xosc.ParseOpenScenario(tmpfile)
+    read_params = xosc.ParameterDeclarationReader(tmpfile)
+    assert osc_fixture.parameters == read_params
+
+    tmpcatalog = os.path.join(tmpdir, "my_catalog.xosc.gz")
+    cf = xosc.CatalogFile()
+    cf.create_catalog(
+        tmpcatalog, "ControllerCatalog", "My catalog", "Mandolin"
+    )
+    orig = xosc.Controller("my_controller", xosc.Properties())
+    cf.add_to_catalog(orig)
+    cf.dump()
+    second = xosc.Controller("my_second_controller", xosc.Properties())
+    xosc.CatalogFile().open_catalog(tmpcatalog)
+    second.append_to_catalog(tmpcatalog)
+    loader = xosc.CatalogLoader()
+    loader.load_catalog("my_catalog", tmpdir)
+    catref = xosc.CatalogReference("my_catalog", "my_second_controller")
+    assert loader.parse(catref) == second
+    catref = xosc.CatalogReference("my_catalog", "my_controller")
+    assert xosc.CatalogReader(catref, tmpdir) == orig
+
+
+def test_schema_cache():
+    schema = xosc.get_schema(1, 3)
+    assert xosc.get_schema("1", "3") is schema
+    assert xosc.get_schema(1, 3, "lxml") is not schema
+    with pytest.raises(ValueError):
+        xosc.get_schema(1, 2, "minidom")
+
+
+@pytest.mark.parametrize("validate", [True, False, "lazy"])
+def test_osc_reader_validate(tmpdir, osc_fixture, validate):
+    tmpfile = os.path.join(tmpdir, "myscenario.xosc")
+    osc_fixture.write_xml(tmpfile)
+    assert osc_fixture == xosc.ParseOpenScenario(tmpfile, validate)
+
+
+def test_osc_reader_invalid(tmpdir, osc_fixture):
+    tmpfile = os.path.join(tmpdir, "myscenario.xosc")
+    element = osc_fixture.get_element()
+    ET.SubElement(element, "NotInTheSchema")
+    printToFile(element, tmpfile)
+    with pytest.warns(UserWarning):
+        xosc.ParseOpenScenario(tmpfile)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        xosc.ParseOpenScenario(tmpfile, validate=False)
+        xosc.ParseOpenScenario(tmpfile, validate="lazy")
+    with pytest.raises(ValueError):
+        xosc.ParseOpenScenario(tmpfile, validate="always")
+
+
+def test_catalog_loader_cache(tmpdir):
+    tmpcatalog = os.path.join(tmpdir, "my_catalog.xosc")
+    cf = xosc.CatalogFile()
+    cf.create_catalog(
+        tmpcatalog, "ControllerCatalog", "My catalog", "Mandolin"
+    )
+    controllers = [
+        xosc.Controller("controller" + str(i), xosc.Properties())
+        for i in range(3)
+    ]
+    for controller in controllers:
+        cf.add_to_catalog(controller)
+    cf.dump()
+
+    loader = xosc.CatalogLoader(cache_size=2)
+    loader.load_catalog("my_catalog", tmpdir)
+    catref = xosc.CatalogReference("my_catalog", "controller0")
+    read = loader.parse(catref)
+    assert read == controllers[0]
+    read.properties.add_property("changed", "1")
+    assert loader.parse(catref) == controllers[0]
+    assert loader.parse(catref) is not loader.parse(catref)
+    for controller in controllers:
+        catref = xosc.CatalogReference("my_catalog", controller.name)
+        assert loader.parse(catref) == controller
+    assert len(loader._parsed_entries) == 2
+    with pytest.raises(NotImplementedError):
+        loader.parse(xosc.CatalogReference("my_catalog", "missing"))
+
+    xosc.Controller("controller0", xosc.Properties()).dump_to_catalog(
+        tmpcatalog, "ControllerCatalog", "My catalog", "Mandolin"
+    )
+    loader.load_catalog("my_catalog", tmpdir)
+    assert len(loader._parsed_entries) == 0
+    with pytest.raises(NotImplementedError):
+        loader.parse(xosc.CatalogReference("my_catalog", "controller1"))
+
+
+def test_load_catalog_directory(tmpdir, monkeypatch):
+    cf = xosc.CatalogFile()
+    cf.create_catalog(
+        os.path.join(tmpdir, "controllers.xosc"),
+        "ControllerCatalog",
+        "My catalog",
+        "Mandolin",
+    )
+    controller = xosc.Controller("controller", xosc.Properties())
+    cf.add_to_catalog(controller)
+    cf.dump()
+    cf.create_catalog(
+        os.path.join(tmpdir, "vehicles.xosc.gz"),
+        "VehicleCatalog",
+        "My catalog",
+        "Mandolin",
+    )
+    vehicle = xosc.Vehicle(
+        "car",
+        xosc.VehicleCategory.car,
+        xosc.BoundingBox(2, 5, 1.8, 2.0, 0, 0.9),
+        xosc.Axle(0.523598775598, 0.8, 1.68, 2.98, 0.4),
+        xosc.Axle(0.523598775598, 0.8, 1.68, 0, 0.4),
+        69,
+        10,
+        10,
+    )
+    cf.add_to_catalog(vehicle)
+    cf.dump()
+    cache_file = os.path.join(tmpdir, "catalogs.sqlite")
+
+    loader = xosc.CatalogLoader()
+    assert loader.load_catalog_directory(tmpdir, cache_file, 2) == [
+        "controllers",
+        "vehicles",
+    ]
+    assert loader.parse(
+        xosc.CatalogReference("controllers", "controller")
+    ) == (controller)
+    assert loader.parse(xosc.CatalogReference("vehicles", "car")) == vehicle
+
+    # warm start, nothing is read from the catalog files
+    def fail(*args, **kwargs):
+        raise AssertionError("catalog file parsed")
+
+    with monkeypatch.context() as m:
+        m.setattr(xosc.xosc_reader, "_read_catalog_file", fail)
+        m.setattr(xosc.xosc_reader.ET, "parse", fail)
+        m.setattr(xosc.xosc_reader.ET, "fromstring", fail)
+        loader = xosc.CatalogLoader()
+        loader.load_catalog_directory(tmpdir, cache_file)
+        assert loader.parse(xosc.CatalogReference("vehicles", "car")) == (
+            vehicle
+        )
+        with pytest.raises(NotImplementedError):
+            loader.parse(xosc.CatalogReference("vehicles", "missing"))
+        with pytest.raises(xosc.NoCatalogFoundError):
+            loader.parse(xosc.CatalogReference("trucks", "car"))
+    # the Catalog elements are read when all_catalogs is used
+    assert list(loader.all_catalogs) == ["controllers", "vehicles"]
+    assert loader.all_catalogs["vehicles"].tag == "Catalog"
+    assert loader.all_catalogs["vehicles"].attrib["name"] == "VehicleCatalog"
+    assert loader.parse(xosc.CatalogReference("vehicles", "car")) == vehicle
+    assert loader.read_entry(
+        xosc.CatalogReference("vehicles", "car"), tmpdir
+    ) == (vehicle)
+
+    # another version of scenariogeneration does not use the cache
+    parsed = []
+    read_catalog_file = xosc.xosc_reader._read_catalog_file
+    with monkeypatch.context() as m:
+        m.setattr(xosc.xosc_reader, "get_library_hash", lambda: "other")
+        m.setattr(
+            xosc.xosc_reader,
+            "_read_catalog_file",
+            lambda path: parsed.append(path) or read_catalog_file(path),
+        )
+        xosc.CatalogLoader().load_catalog_directory(tmpdir, cache_file)
+    assert len(parsed) == 2
+
+    # a changed catalog file is read again
+    controller = xosc.Controller("other_controller", xosc.Properties())
+    controller.dump_to_catalog(
+        os.path.join(tmpdir, "controllers.xosc"),
+        "ControllerCatalog",
+        "My catalog",
+        "Mandolin",
+    )
+    loader = xosc.CatalogLoader()
+    loader.load_catalog_directory(tmpdir, cache_file)
+    assert loader.parse(
+        xosc.CatalogReference("controllers", "other_controller")
+    ) == (controller)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_parse_open_scenarios(tmpdir, osc_fixture, workers):
+    paths = []
+    for i in range(3):
+        paths.append(os.path.join(tmpdir, "myscenario" + str(i) + ".xosc"))
+        osc_fixture.write_xml(paths[-1])
+    paths.insert(1, os.path.join(tmpdir, "missing.xosc"))
+    invalid = osc_fixture.get_element()
+    ET.SubElement(invalid, "NotInTheSchema")
+    paths.append(os.path.join(tmpdir, "invalid.xosc"))
+    printToFile(invalid, paths[-1])
+
+    results = list(xosc.ParseOpenScenarios(paths, workers, chunksize=2))
+    assert [r.index for r in results] == list(range(5))
+    assert [r.path for r in results] == paths
+    assert results[0].xosc_object == osc_fixture
+    assert results[0].error is None
+    assert results[1].xosc_object is None
+    assert isinstance(results[1].error, FileNotFoundError)
+    assert results[4].xosc_object == osc_fixture
+    assert len(results[4].warnings) == 1
+
+    results = xosc.ParseOpenScenarios(
+        paths, workers, validate=False, ordered=False
+    )
+    assert sorted(r.index for r in results if r.error is None) == [
+        0,
+        2,
+        3,
+        4,
+    ]
+
+
+@pytest.mark.parametrize(
+    "arguments",
+    [
+        {"validate": "strict"},
+        {"workers": 0},
+        {"workers": 1.5},
+        {"chunksize": 0},
+    ],
+)
+def test_parse_open_scenarios_wrong_arguments(arguments):
+    # raised on the call, before the results are iterated
+    with pytest.raises(ValueError):
+        xosc.ParseOpenScenarios(["myscenario.xosc"], **arguments)
+
+
+def test_partial_readers(tmpdir, osc_fixture, parameter_fixture):
+    tmpfile = os.path.join(tmpdir, "myscenario.xosc")
+    osc_fixture.write_xml(tmpfile)
+    # only the beginning of the file is read, the rest can be broken
+    with open(tmpfile) as f:
+        content = f.read()
+    with open(tmpfile, "w") as f:
+        f.write(content[: content.index("<Entities>")] + "<Entities><")
+
+    assert xosc.FileHeaderReader(tmpfile) == osc_fixture.header
+    assert xosc.ParameterDeclarationReader(tmpfile) == osc_fixture.parameters
+    assert xosc.CatalogLocationsReader(tmpfile) == osc_fixture.catalog
+    assert xosc.RoadNetworkReader(tmpfile) == osc_fixture.roadnetwork
+    assert xosc.FileTypeReader(tmpfile) == "Scenario"
+
+    tmpfile = os.path.join(tmpdir, "myparameters.xosc")
+    parameter_fixture.write_xml(tmpfile)
+    assert xosc.FileTypeReader(tmpfile) == "ParameterValueDistribution"
+    assert xosc.FileHeaderReader(tmpfile) == parameter_fixture.header
+    with pytest.raises(xosc.XMLStructureError):
+        xosc.ParameterDeclarationReader(tmpfile)
@@ -11,10 +11,12 @@ Copyright (c) 2022 The scenariogeneration Authors.
 """
 
 import datetime as dt
+import io
+import xml.etree.ElementTree as ET
 
 import pytest
 
-from scenariogeneration import prettyprint
+from scenariogeneration import prettify, prettyprint
 from scenariogeneration import xosc as OSC
 from scenariogeneration.xosc.enumerations import _MINOR_VERSION
 
@@ -221,6 +223,15 @@ class TestScenario:
     def test_scenario_prettyprint(self, sce):
         prettyprint(sce.get_element(), None)
 
+    def test_scenario_write_stream(self, sce, monkeypatch):
+        monkeypatch.setenv("SOURCE_DATE_EPOCH", "1700000000")
+        output = io.BytesIO()
+        sce.write_stream(output)
+        assert output.getvalue() == prettify(sce.get_element())
+        output = io.BytesIO()
+        sce.write_stream(output, prettyprint=False)
+        assert output.getvalue() == ET.tostring(sce.get_element(), "utf-8")
+
     def test_scenario_equality(
         self, sce, story_board, entities, road, catalog
     ):
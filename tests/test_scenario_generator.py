@@ -10,11 +10,29 @@ Copyright (c) 2022 The scenariogeneration Authors.
 
 """
 
+import gzip
+import json
 import os
+import shutil
+import xml.etree.ElementTree as ET
+from multiprocessing import Pool
 
 import pytest
 
-from scenariogeneration import ScenarioGenerator, prettyprint, xosc
+from scenariogeneration import (
+    GenerationManifest,
+    ScenarioGenerator,
+    get_deterministic_timestamp,
+    helpers,
+    merge_shard_manifests,
+    prettyprint,
+    printToFile,
+    scenario_generator,
+    set_deterministic_timestamp,
+    set_element_factory,
+    xodr,
+    xosc,
+)
 
 
 class writer_dummy:
@@ -22,6 +40,35 @@ class writer_dummy:
         with open(filename, "w") as f:
             pass
 
+    def get_fingerprint(self):
+        # every dummy is a distinct road
+        return id(self)
+
+
+class element_dummy:
+    def __init__(self, name):
+        self.name = name
+
+    def get_element(self):
+        return ET.Element("dummy", attrib={"name": self.name})
+
+    def write_xml(self, filename, prettyprint):
+        printToFile(self.get_element(), filename, prettyprint)
+
+
+class ClassElements(ScenarioGenerator):
+    def __init__(self, parameters, naming):
+        ScenarioGenerator.__init__(self)
+
+        self.parameters = parameters
+        self.naming = naming
+
+    def scenario(self, **kwargs):
+        return element_dummy("scenario")
+
+    def road(self, **kwargs):
+        return element_dummy("road")
+
 
 class ClassScenarioOnly(ScenarioGenerator):
     def __init__(self, parameters, naming):
@@ -321,3 +368,543 @@ class TestHandleAllPermutation:
         sg.print_permutations()
         assert len(sg.all_permutations) == 10
         assert sg.excluded_permutations not in sg.all_permutations
+
+
+def test_generate_parallel_generations(dict_of_params, tmpdir):
+    sg = ClassBoth(dict_of_params, "numerical")
+    serial_scenarios, serial_roads = sg.generate(os.path.join(tmpdir, "s"))
+
+    sg = ClassBoth(dict_of_params, "numerical")
+    sg.number_of_parallel_generations = 2
+    scenario_files, road_files = sg.generate(os.path.join(tmpdir, "p"))
+    assert len(os.listdir(os.path.join(tmpdir, "p", "xosc"))) == 6
+    assert len(os.listdir(os.path.join(tmpdir, "p", "xodr"))) == 6
+    assert [os.path.basename(f) for f in scenario_files] == [
+        os.path.basename(f) for f in serial_scenarios
+    ]
+    assert [os.path.basename(f) for f in road_files] == [
+        os.path.basename(f) for f in serial_roads
+    ]
+
+
+class ClassCountingTasks(ClassScenarioOnly):
+    # records how far the creation of tasks is ahead of the results
+    def __init__(self, parameters):
+        ClassScenarioOnly.__init__(self, parameters, "numerical")
+        self.results = []
+        self.tasks_ahead = []
+
+    def _generate_in_parallel(self, scenario_files, road_files):
+        self.results = scenario_files
+        ClassScenarioOnly._generate_in_parallel(
+            self, scenario_files, road_files
+        )
+
+    def _get_up_to_date_files(self, scenario_name, permutation):
+        self.tasks_ahead.append(len(self.tasks_ahead) - len(self.results))
+        return ClassScenarioOnly._get_up_to_date_files(
+            self, scenario_name, permutation
+        )
+
+
+def test_generate_parallel_generations_bounded(tmpdir):
+    sg = ClassCountingTasks({"p": list(range(1000))})
+    sg.number_of_parallel_generations = 2
+    scenario_files, _ = sg.generate(tmpdir)
+    assert len(scenario_files) == 1000
+    assert len(sg.tasks_ahead) == 1000
+    # at most two chunks (of 64 tasks) per process are waiting
+    assert max(sg.tasks_ahead) <= 5 * 64
+
+
+@pytest.mark.parametrize("backend", ["process", "thread"])
+def test_generate_pipelined_writings(dict_of_params, tmpdir, backend):
+    sg = ClassElements(dict_of_params, "numerical")
+    sg.number_of_parallel_writings = 2
+    sg.writing_queue_depth = 1
+    sg.writing_backend = backend
+    scenario_files, _ = sg.generate(tmpdir)
+    assert len(os.listdir(os.path.join(tmpdir, "xosc"))) == 6
+    assert len(os.listdir(os.path.join(tmpdir, "xodr"))) == 6
+    for scenario_file in scenario_files:
+        assert ET.parse(scenario_file).getroot().get("name") == "scenario"
+
+
+def test_generate_pipelined_writings_wrong_backend(dict_of_params, tmpdir):
+    sg = ClassElements(dict_of_params, "numerical")
+    sg.number_of_parallel_writings = 2
+    sg.writing_backend = "gpu"
+    with pytest.raises(ValueError):
+        sg.generate(tmpdir)
+
+
+class ClassUniqueRoads(ScenarioGenerator):
+    def __init__(self):
+        ScenarioGenerator.__init__(self)
+        self.parameters = {"length": [100, 50, 100], "speed": [1, 2]}
+        self.generate_all_roads = False
+
+    def road(self, **kwargs):
+        odr = xodr.OpenDrive("road")
+        odr.add_road(xodr.create_road(xodr.Line(kwargs["length"]), 0))
+        odr.adjust_roads_and_lanes()
+        return odr
+
+
+def test_generate_unique_roads(tmpdir):
+    sg = ClassUniqueRoads()
+    _, road_files = sg.generate(tmpdir)
+    assert len(os.listdir(os.path.join(tmpdir, "xodr"))) == 2
+    assert len(set(road_files)) == 2
+    assert road_files[0] == road_files[1] == road_files[4]
+
+
+@pytest.mark.parametrize(
+    "parallel_writings, parallel_generations", [(2, 1), (1, 2)]
+)
+def test_generate_parallel_lxml(
+    tmpdir, parallel_writings, parallel_generations
+):
+    previous_factory = set_element_factory("lxml")
+    try:
+        sg = ClassUniqueRoads()
+        sg.generate_all_roads = True
+        sg.number_of_parallel_writings = parallel_writings
+        sg.number_of_parallel_generations = parallel_generations
+        sg.generate(tmpdir)
+    finally:
+        set_element_factory(previous_factory)
+    road_files = os.listdir(os.path.join(tmpdir, "xodr"))
+    assert len(road_files) == 6
+    for road_file in road_files:
+        road = ET.parse(os.path.join(tmpdir, "xodr", road_file))
+        assert road.getroot().find("road") is not None
+
+
+class ClassRoadSignature(ScenarioGenerator):
+    def __init__(self):
+        ScenarioGenerator.__init__(self)
+        self.parameters = {"length": [100, 50], "speed": [1, 2, 3]}
+        self.road_calls = []
+
+    def road(self, length):
+        self.road_calls.append(length)
+        return writer_dummy()
+
+    def scenario(self, **kwargs):
+        return writer_dummy()
+
+
+def test_generate_road_once_per_road_parameters(tmpdir):
+    sg = ClassRoadSignature()
+    sg.generate_all_roads = False
+    _, road_files = sg.generate(tmpdir)
+    assert sg.road_calls == [100, 50]
+    assert len(os.listdir(os.path.join(tmpdir, "xodr"))) == 2
+    assert len(os.listdir(os.path.join(tmpdir, "xosc"))) == 6
+    assert road_files[0] == road_files[1] == road_files[2]
+    assert road_files[3] == road_files[4] == road_files[5]
+
+
+def test_generate_all_roads_road_parameters(tmpdir):
+    sg = ClassRoadSignature()
+    _, road_files = sg.generate(tmpdir)
+    assert sg.road_calls == [100, 100, 100, 50, 50, 50]
+    assert len(os.listdir(os.path.join(tmpdir, "xodr"))) == 6
+    assert len(set(road_files)) == 6
+
+
+def test_generate_road_parameters_lru(tmpdir):
+    parameters = [
+        {"length": 100, "speed": 1},
+        {"length": 50, "speed": 1},
+        {"length": 100, "speed": 2},
+    ]
+    sg = ClassBoth(parameters, "numerical")
+    sg.generate_all_roads = False
+    sg.road_parameters = ["length"]
+    sg.road_cache_size = 1
+    _, road_files = sg.generate(tmpdir)
+    assert len(set(road_files)) == 3
+
+    sg.road_cache_size = None
+    _, road_files = sg.generate(tmpdir)
+    assert len(set(road_files)) == 2
+
+
+class ClassCountingCalls(ScenarioGenerator):
+    def __init__(self, parameters):
+        ScenarioGenerator.__init__(self)
+        self.parameters = parameters
+        self.use_manifest = True
+        self.scenario_calls = 0
+
+    def scenario(self, **kwargs):
+        self.scenario_calls += 1
+        return element_dummy("scenario")
+
+    def road(self, **kwargs):
+        return element_dummy("road")
+
+
+def test_generate_with_manifest_library_version(
+    dict_of_params, tmpdir, monkeypatch
+):
+    ClassCountingCalls(dict_of_params).generate(tmpdir)
+    sg = ClassCountingCalls(dict_of_params)
+    sg.generate(tmpdir)
+    assert sg.scenario_calls == 0
+
+    monkeypatch.setattr(
+        scenario_generator, "get_library_hash", lambda: "other"
+    )
+    sg = ClassCountingCalls(dict_of_params)
+    sg.generate(tmpdir)
+    assert sg.scenario_calls == 6
+
+
+@pytest.mark.parametrize(
+    "parallel_writings, parallel_generations", [(1, 1), (2, 1), (1, 2)]
+)
+def test_generate_with_manifest(
+    dict_of_params, tmpdir, parallel_writings, parallel_generations
+):
+    sg = ClassCountingCalls(dict_of_params)
+    sg.number_of_parallel_writings = parallel_writings
+    sg.number_of_parallel_generations = parallel_generations
+    scenario_files, road_files = sg.generate(tmpdir)
+    assert os.path.isfile(os.path.join(tmpdir, "manifest.sqlite"))
+
+    sg = ClassCountingCalls(dict_of_params)
+    os.remove(scenario_files[2])
+    rerun_scenario_files, rerun_road_files = sg.generate(tmpdir)
+    assert sg.scenario_calls == 1
+    assert rerun_scenario_files == scenario_files
+    assert rerun_road_files == road_files
+
+    sg = ClassCountingCalls(dict_of_params)
+    sg.generate(tmpdir, prettyprint=False)
+    assert sg.scenario_calls == 6
+
+
+@pytest.mark.parametrize("naming", ["numerical", "parameter_no_lists"])
+@pytest.mark.parametrize(
+    "excluded", [[], [{"parameter1": 2, "parameter2": 1}]]
+)
+def test_generate_shards(dict_of_params, tmpdir, naming, excluded):
+    sg = ClassBoth(dict_of_params, naming)
+    sg.excluded_permutations = excluded
+    all_scenarios, _ = sg.generate(os.path.join(tmpdir, "all"))
+
+    shard_scenarios = []
+    for shard_index in range(4):
+        sg = ClassBoth(dict_of_params, naming)
+        sg.excluded_permutations = excluded
+        scenarios, _ = sg.generate(
+            os.path.join(tmpdir, "shards"),
+            shard_index=shard_index,
+            shard_count=4,
+        )
+        shard_scenarios.extend(os.path.basename(f) for f in scenarios)
+    assert len(shard_scenarios) == len(set(shard_scenarios))
+    assert sorted(shard_scenarios) == sorted(
+        os.path.basename(f) for f in all_scenarios
+    )
+
+
+def test_generate_shards_wrong_index(dict_of_params, tmpdir):
+    sg = ClassBoth(dict_of_params, "numerical")
+    with pytest.raises(ValueError):
+        sg.generate(tmpdir, shard_index=2, shard_count=2)
+
+
+def test_generate_shards_merge_manifests(dict_of_params, tmpdir):
+    for shard_index in range(2):
+        sg = ClassCountingCalls(dict_of_params)
+        sg.generate(tmpdir, shard_index=shard_index, shard_count=2)
+    merge_shard_manifests(tmpdir, remove_shard_manifests=True)
+    assert "manifest_shard_0_of_2.sqlite" not in os.listdir(tmpdir)
+
+    sg = ClassCountingCalls(dict_of_params)
+    sg.generate(tmpdir)
+    assert sg.scenario_calls == 0
+
+
+def _generate_from_queue(generation_folder):
+    sg = ClassCountingCalls({"parameter1": list(range(20)), "p2": [1, 2]})
+    sg.queue_chunk_size = 3
+    sg.queue_poll_interval = 0.01
+    scenario_files, _ = sg.generate(generation_folder, work_queue=True)
+    return scenario_files
+
+
+def test_generate_with_work_queue(tmpdir):
+    with Pool(3) as pool:
+        results = pool.map(_generate_from_queue, [str(tmpdir)] * 3)
+    scenario_files = [f for result in results for f in result]
+    assert len(scenario_files) == len(set(scenario_files)) == 40
+    assert len(os.listdir(os.path.join(tmpdir, "xosc"))) == 40
+
+    merge_shard_manifests(tmpdir, remove_shard_manifests=True)
+    os.remove(os.path.join(tmpdir, "queue.sqlite"))
+    sg = ClassCountingCalls({"parameter1": list(range(20)), "p2": [1, 2]})
+    scenario_files, _ = sg.generate(tmpdir, work_queue=True)
+    assert sg.scenario_calls == 0
+    assert len(scenario_files) == 40
+
+
+def test_generate_with_work_queue_rerun(tmpdir):
+    sg = ClassBoth({"parameter1": list(range(5)), "p2": [1, 2]}, "numerical")
+    sg.queue_chunk_size = 4
+    scenario_files, _ = sg.generate(tmpdir, work_queue=True)
+    for scenario_file in scenario_files:
+        os.remove(scenario_file)
+    with pytest.warns(UserWarning):
+        assert sg.generate(tmpdir, work_queue=True) == ([], [])
+    rerun_scenario_files, _ = sg.generate(tmpdir, work_queue="rerun")
+    assert rerun_scenario_files == scenario_files
+    assert len(os.listdir(os.path.join(tmpdir, "xosc"))) == 10
+
+    sg = ClassBoth({"parameter1": list(range(5)), "p2": [3, 4]}, "numerical")
+    sg.queue_chunk_size = 4
+    scenario_files, _ = sg.generate(tmpdir, work_queue=True)
+    assert len(scenario_files) == 10
+
+
+def test_generate_with_work_queue_excluded(tmpdir):
+    sg = ClassBoth({"parameter1": list(range(5)), "p2": [1, 2]}, "numerical")
+    sg.excluded_permutations = [{"parameter1": 1, "p2": 2}]
+    sg.queue_chunk_size = 4
+    scenario_files, _ = sg.generate(tmpdir, work_queue=True)
+    assert [os.path.basename(f) for f in scenario_files] == [
+        "test_scenario_generator" + str(i) + ".xosc" for i in range(9)
+    ]
+
+
+def test_generate_with_work_queue_parallel(dict_of_params, tmpdir):
+    sg = ClassBoth(dict_of_params, "numerical")
+    sg.number_of_parallel_writings = 2
+    with pytest.raises(ValueError):
+        sg.generate(tmpdir, work_queue=True)
+
+
+def test_generate_exclusion_rules(dict_of_params, tmpdir):
+    sg = ClassScenarioOnly(dict_of_params, "parameter")
+    sg.exclusion_rules = [
+        {"parameter1": 2},
+        lambda parameter2: parameter2 == 2,
+    ]
+    sg.generate(tmpdir)
+    assert sorted(os.listdir(os.path.join(tmpdir, "xosc"))) == [
+        "test_scenario_generator_parameter1-1_parameter2-1.xosc",
+        "test_scenario_generator_parameter1-3_parameter2-1.xosc",
+    ]
+
+
+def test_generate_sampled(tmpdir):
+    sg = ClassScenarioOnly(
+        {"p" + str(i): list(range(10)) for i in range(10)}, "numerical"
+    )
+    sg.sampling_method = "latin_hypercube"
+    sg.sample_count = 5
+    sg.sampling_seed = 1
+    scenario_files, _ = sg.generate(tmpdir)
+    assert len(scenario_files) == 5
+    assert len(os.listdir(os.path.join(tmpdir, "xosc"))) == 5
+
+
+def test_generate_sampled_without_count(tmpdir):
+    sg = ClassScenarioOnly({"p": list(range(10))}, "numerical")
+    sg.sampling_method = "random"
+    with pytest.raises(ValueError):
+        sg.generate(tmpdir)
+
+
+def test_generate_covering_array(tmpdir):
+    sg = ClassScenarioOnly(
+        {"p" + str(i): list(range(3)) for i in range(4)}, "numerical"
+    )
+    sg.sampling_method = "covering_array"
+    sg.covering_array_strength = 2
+    sg.sampling_seed = 1
+    scenario_files, _ = sg.generate(tmpdir)
+    assert 9 <= len(scenario_files) < 81
+    assert len(os.listdir(os.path.join(tmpdir, "xosc"))) == len(scenario_files)
+
+
+@pytest.mark.parametrize(
+    "archive_format, compression", [("tar", "gzip"), ("zip", None)]
+)
+def test_generate_to_archive(
+    dict_of_params, tmpdir, archive_format, compression
+):
+    sg = ClassElements(dict_of_params, "numerical")
+    sg.archive_format = archive_format
+    sg.archive_compression = compression
+    sg.archive_max_size = 1
+    scenario_files, road_files = sg.generate(tmpdir)
+    assert not os.path.exists(os.path.join(tmpdir, "xosc"))
+    with open(os.path.join(tmpdir, sg.basename + "_index.json")) as index_file:
+        index = json.load(index_file)
+    assert len(index["archives"]) == len(scenario_files)
+    extracted = os.path.join(tmpdir, "extracted")
+    for archive in index["archives"]:
+        shutil.unpack_archive(os.path.join(tmpdir, archive), extracted)
+    for scenario_file, road_file in zip(scenario_files, road_files):
+        scenario_file = os.path.join(
+            extracted, os.path.relpath(scenario_file, tmpdir)
+        )
+        assert os.path.isfile(scenario_file)
+        assert os.path.isfile(
+            os.path.join(os.path.dirname(scenario_file), road_file)
+        )
+
+
+def test_generate_to_archive_parallel(dict_of_params, tmpdir):
+    sg = ClassElements(dict_of_params, "numerical")
+    sg.archive_format = "tar"
+    sg.number_of_parallel_writings = 2
+    with pytest.raises(ValueError):
+        sg.generate(tmpdir)
+
+
+@pytest.mark.parametrize("use_manifest", [False, True])
+def test_generate_fan_out(dict_of_params, tmpdir, use_manifest):
+    sg = ClassElements(dict_of_params, "numerical")
+    sg.road_parameters = ["parameter1"]
+    sg.fan_out_levels = 2
+    sg.fan_out_width = 1
+    sg.use_manifest = use_manifest
+    scenario_files, road_files = sg.generate(tmpdir)
+    assert len(os.listdir(os.path.join(tmpdir, "xosc"))) > 1
+    for scenario_file, road_file in zip(scenario_files, road_files):
+        relative_file = os.path.relpath(scenario_file, tmpdir)
+        assert len(relative_file.split(os.sep)) == 4
+        assert os.path.isfile(scenario_file)
+        assert os.path.isfile(
+            os.path.join(os.path.dirname(scenario_file), road_file)
+        )
+    if use_manifest:
+        assert sg.generate(tmpdir) == (scenario_files, road_files)
+        manifest = GenerationManifest(
+            os.path.join(tmpdir, GenerationManifest.filename)
+        )
+        entry = manifest.get(sg.basename + "0")
+        manifest.close()
+        assert os.path.join(tmpdir, entry["scenario_file"]) == (
+            scenario_files[0]
+        )
+
+
+def test_generate_content_store(dict_of_params, tmpdir):
+    sg = ClassElements(dict_of_params, "numerical")
+    sg.use_content_store = True
+    scenario_files, road_files = sg.generate(tmpdir)
+    for scenario_file in scenario_files:
+        assert os.path.samefile(scenario_file, scenario_files[0])
+    road_inode = os.stat(os.path.join(tmpdir, "xodr", sg.basename + "0.xodr"))
+    blobs = [
+        os.path.join(folder, filename)
+        for folder, _, filenames in os.walk(os.path.join(tmpdir, "objects"))
+        for filename in filenames
+    ]
+    assert len(blobs) == 2
+    sg.generate(tmpdir)
+    assert os.stat(
+        os.path.join(tmpdir, "xodr", sg.basename + "0.xodr")
+    ).st_ino == (road_inode.st_ino)
+
+
+def test_generate_content_store_dated_headers(tmpdir):
+    sg = ClassHeaders()
+    sg.deterministic = False
+    sg.use_content_store = True
+    scenario_files, road_files = sg.generate(tmpdir)
+    assert os.path.samefile(
+        os.path.join(tmpdir, "xodr", sg.basename + "0.xodr"),
+        os.path.join(tmpdir, "xodr", sg.basename + "1.xodr"),
+    )
+    blobs = [
+        filename
+        for _, _, filenames in os.walk(os.path.join(tmpdir, "objects"))
+        for filename in filenames
+    ]
+    # one road and two scenarios (referring to different road files)
+    assert len(blobs) == 3
+    assert get_deterministic_timestamp() is None
+
+
+def test_generate_content_store_between_runs(tmpdir, monkeypatch):
+    monkeypatch.delenv("SOURCE_DATE_EPOCH", raising=False)
+    sg = ClassHeaders()
+    sg.deterministic = False
+    sg.use_content_store = True
+    scenario_files, _ = sg.generate(tmpdir)
+    scenario_inode = os.stat(scenario_files[0]).st_ino
+    # a later run (with another current time) uses the same blobs
+    monkeypatch.setattr(helpers.time, "time", lambda: 2e9)
+    scenario_files, _ = sg.generate(tmpdir)
+    assert os.stat(scenario_files[0]).st_ino == scenario_inode
+    blobs = [
+        filename
+        for _, _, filenames in os.walk(os.path.join(tmpdir, "objects"))
+        for filename in filenames
+    ]
+    assert len(blobs) == 3
+
+
+class ClassHeaders(ScenarioGenerator):
+    def __init__(self):
+        ScenarioGenerator.__init__(self)
+        self.parameters = {"speed": [1, 2]}
+        self.deterministic = True
+
+    def road(self, **kwargs):
+        return xodr.OpenDrive("road")
+
+    def scenario(self, **kwargs):
+        return xosc.Scenario(
+            "scenario",
+            "author",
+            xosc.ParameterDeclarations(),
+            xosc.Entities(),
+            xosc.StoryBoard(),
+            xosc.RoadNetwork(self.road_file),
+            xosc.Catalog(),
+        )
+
+
+def test_generate_deterministic(tmpdir):
+    contents = []
+    for run in ["first", "second"]:
+        scenario_files, road_files = ClassHeaders().generate(
+            os.path.join(tmpdir, run)
+        )
+        for filename in [scenario_files[0], road_files[0]]:
+            if not os.path.isabs(filename):
+                filename = os.path.join(
+                    os.path.dirname(scenario_files[0]), filename
+                )
+            with open(filename, "rb") as file_handle:
+                contents.append(file_handle.read())
+    assert contents[:2] == contents[2:]
+    assert b'date="1970-01-01T00:00:00"' in contents[0]
+    assert set_deterministic_timestamp(None) is None
+
+
+@pytest.mark.parametrize("use_content_store", [False, True])
+def test_generate_compressed(tmpdir, use_content_store):
+    sg = ClassHeaders()
+    sg.compress_files = True
+    sg.use_content_store = use_content_store
+    scenario_files, road_files = sg.generate(tmpdir)
+    assert scenario_files[0].endswith(".xosc.gz")
+    assert road_files[0].endswith(".xodr.gz")
+    scenario = xosc.ParseOpenScenario(scenario_files[0])
+    assert scenario.roadnetwork.road_file == road_files[0]
+    with gzip.open(scenario_files[0]) as file_handle:
+        assert b'date="1970-01-01T00:00:00"' in file_handle.read()
+
+    sg.archive_format = "tar"
+    with pytest.raises(ValueError):
+        sg.generate(tmpdir)
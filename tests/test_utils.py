@@ -16,7 +16,7 @@ import xml.etree.ElementTree as ET
 
 import pytest
 
-from scenariogeneration import prettyprint
+from scenariogeneration import prettyprint, set_deterministic_timestamp
 from scenariogeneration import xosc as OSC
 from scenariogeneration.xosc.utils import (
     ValueConstraintGroup,
@@ -554,6 +554,19 @@ def test_controller(tmpdir):
         OSC.Controller("mycontroler3", prop, "dummy")
 
 
+def test_fileheader_deterministic(monkeypatch):
+    fh = OSC.FileHeader("my_scenario", "Mandolin")
+    monkeypatch.setenv("SOURCE_DATE_EPOCH", "86400")
+    assert fh.get_attributes()["date"] == "1970-01-02T00:00:00"
+    previous = set_deterministic_timestamp(0)
+    try:
+        assert fh.get_attributes()["date"] == "1970-01-01T00:00:00"
+    finally:
+        set_deterministic_timestamp(previous)
+    monkeypatch.delenv("SOURCE_DATE_EPOCH")
+    assert fh.get_attributes()["date"] != "1970-01-01T00:00:00"
+
+
 def test_fileheader():
     fh = OSC.FileHeader(
         "my_scenario", "Mandolin", creation_date=dt.datetime.now()